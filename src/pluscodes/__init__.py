@@ -44,9 +44,59 @@ Examples:
     recoverNearest('9G8F+6X', 47.4, 8.6)
     recoverNearest('8F+6X', 47.4, 8.6)
 """
-from .code import PlusCode
-from .decoder import Decoder, decode
-from .encoder import Encoder, encode
-from .geo import Area, Point
-from .transformer import Transformer
-from .validator import Validator
+# Public names, mapped to the submodules defining them. Submodules are
+# imported on first access of one of their names (PEP 562), so importing the
+# package does not import the encoder, decoder, their dependencies or the
+# vendored openlocationcode until they are used.
+_EXPORTS = {
+    "PlusCode": "code",
+    "PlusCodeArray": "codearray",
+    "CodeFile": "codefile",
+    "cover": "covering",
+    "interior_cover": "covering",
+    "Decoder": "decoder",
+    "decode": "decoder",
+    "decode_bounds": "decoder",
+    "decode_center": "decoder",
+    "Encoder": "encoder",
+    "encode": "encoder",
+    "encode_many": "encoder",
+    "encode_many_with_area": "encoder",
+    "encode_with_area": "encoder",
+    "Area": "geo",
+    "AreaView": "geo",
+    "Point": "geo",
+    "k_ring": "grid",
+    "neighbors": "grid",
+    "ancestors": "hierarchy",
+    "children": "hierarchy",
+    "descendants": "hierarchy",
+    "parent": "hierarchy",
+    "PlusCodeIndex": "index",
+    "from_int": "packed",
+    "to_int": "packed",
+    "Transformer": "transformer",
+    "recover_many": "transformer",
+    "shorten_many": "transformer",
+    "CodeKind": "validator",
+    "Validator": "validator",
+    "classify": "validator",
+    "classify_many": "validator",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    try:
+        submodule = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(__import__(f"{__name__}.{submodule}", fromlist=[name]), name)
+    # Later lookups find the name without calling __getattr__.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_EXPORTS})
@@ -1,3 +1,6 @@
+from itertools import product
+
+
 class Base:
     """Base class for the Encoder, Decoder, and Validator subclasses defining
     class constants.
@@ -17,6 +20,10 @@ class Base:
     VALID_CHARS = set(ch for ch in ALPHABET) | {SEP, PADDING_CHAR}
     ALPHABET_INDEX = {c: i for i, c in enumerate(ALPHABET)}
 
+    # Lookup table of the 400 latitude, longitude character pairs, indexed by
+    # lat_digit * ENCODING_BASE + lon_digit.
+    PAIRS = tuple(map("".join, product(ALPHABET, repeat=2)))
+
     # The base to use to convert numbers to/from.
     ENCODING_BASE = len(ALPHABET)
 
@@ -0,0 +1,1130 @@
+"""Throughput benchmarks.
+
+Run with ``python -m pluscodes.bench``. By default, runs the suite: encode,
+decode, validate, shorten and recover at every code length, scalar and
+batch, for pluscodes and the vendored openlocationcode, on seeded synthetic
+workloads, along with the time to import each package in a fresh
+interpreter. Results can be written as JSON and compared against a stored
+baseline, exiting with status 1 on regressions:
+
+    python -m pluscodes.bench --json baseline.json
+    python -m pluscodes.bench --baseline baseline.json --threshold 0.1
+
+With ``--features``, runs the benchmarks of individual optimizations instead.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable
+
+# The modules under test are imported by each benchmark, so that importing
+# the suite does not import the whole package.
+
+
+def workload(n: int, seed: int = 42) -> tuple[list[float], list[float]]:
+    """Seeded, uniformly distributed latitudes and longitudes."""
+    rng = random.Random(seed)
+    lats = [rng.uniform(-90, 90) for _ in range(n)]
+    lons = [rng.uniform(-180, 180) for _ in range(n)]
+    return lats, lons
+
+
+def best_time(fn: Callable[[], object], repeat: int = 3) -> float:
+    """Best wall clock time in seconds of repeat calls to fn."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_encode(n: int = 100_000, code_length: int = 10, repeat: int = 3) -> dict:
+    """Compare the scalar Encoder.encode loop against Encoder.encode_many.
+
+    Returns:
+        Throughput in codes per second for each path and the batch speedup.
+    """
+    from .encoder import Encoders
+
+    lats, lons = workload(n)
+    encoder = Encoders[code_length]
+    encode = encoder.encode
+
+    scalar = best_time(lambda: [encode(a, b) for a, b in zip(lats, lons)], repeat)
+    batch = best_time(lambda: encoder.encode_many(lats, lons), repeat)
+    return {
+        "code_length": code_length,
+        "n": n,
+        "scalar_per_sec": n / scalar,
+        "batch_per_sec": n / batch,
+        "speedup": scalar / batch,
+    }
+
+
+def _loop_encode(encoder, latitude: float, longitude: float) -> str:
+    """The character by character Encoder.encode loop that predates the pair
+    lookup tables, kept as a baseline.
+    """
+    if latitude == 90:
+        latitude = latitude - encoder._lat_precision
+    if longitude == 180:
+        longitude = -180
+    code = ""
+    latVal = int(round((latitude + encoder.MAX_LAT) * encoder.FINAL_LAT_PRECISION, 6))
+    lngVal = int(round((longitude + encoder.MAX_LON) * encoder.FINAL_LON_PRECISION, 6))
+    if encoder.code_length > encoder.PAIR_CODE_LENGTH:
+        for _ in range(encoder.MAX_CODE_LENGTH - encoder.PAIR_CODE_LENGTH):
+            ndx = (latVal % encoder.GRID_ROWS) * encoder.GRID_COLUMNS
+            ndx += lngVal % encoder.GRID_COLUMNS
+            code = encoder.ALPHABET[ndx] + code
+            latVal //= encoder.GRID_ROWS
+            lngVal //= encoder.GRID_COLUMNS
+    else:
+        latVal //= encoder.GRID_ROW_DIV
+        lngVal //= encoder.GRID_COL_DIV
+    base = encoder.ENCODING_BASE
+    for _ in range(encoder.PAIR_CODE_LENGTH // 2):
+        code = encoder.ALPHABET[lngVal % base] + code
+        code = encoder.ALPHABET[latVal % base] + code
+        latVal //= base
+        lngVal //= base
+    sep, pos = encoder.SEP, encoder.SEP_POSITION
+    code = code[:pos] + sep + code[pos:]
+    if encoder.code_length >= pos:
+        return code[: encoder.code_length + 1]
+    return code[: encoder.code_length] + "".zfill(pos - encoder.code_length) + sep
+
+
+def bench_table_encode(
+    n: int = 100_000, code_length: int = 10, repeat: int = 3
+) -> dict:
+    """Compare the table driven Encoder.encode against the character by
+    character loop it replaced.
+    """
+    from .encoder import Encoders
+
+    lats, lons = workload(n)
+    encoder = Encoders[code_length]
+    encode = encoder.encode
+
+    loop = best_time(
+        lambda: [_loop_encode(encoder, a, b) for a, b in zip(lats, lons)], repeat
+    )
+    table = best_time(lambda: [encode(a, b) for a, b in zip(lats, lons)], repeat)
+    return {
+        "code_length": code_length,
+        "n": n,
+        "loop_per_sec": n / loop,
+        "table_per_sec": n / table,
+        "speedup": loop / table,
+    }
+
+
+def bench_decode(n: int = 100_000, code_length: int = 10, repeat: int = 3) -> dict:
+    """Compare Decoder.decode on a fresh instance per call, as the module level
+    decode used to, against the shared instance and the raw tuple variants.
+    """
+    from .decoder import Decoder, decode_bounds, decode_center
+    from .encoder import Encoders
+
+    codes = Encoders[code_length].encode_many(*workload(n))
+    decode = Decoder().decode
+
+    fresh = best_time(lambda: [Decoder().decode(c) for c in codes], repeat)
+    shared = best_time(lambda: [decode(c) for c in codes], repeat)
+    bounds = best_time(lambda: [decode_bounds(c) for c in codes], repeat)
+    center = best_time(lambda: [decode_center(c) for c in codes], repeat)
+    return {
+        "code_length": code_length,
+        "n": n,
+        "fresh_per_sec": n / fresh,
+        "shared_per_sec": n / shared,
+        "bounds_per_sec": n / bounds,
+        "center_per_sec": n / center,
+    }
+
+
+def bench_encode_with_area(
+    n: int = 100_000, code_length: int = 10, repeat: int = 3
+) -> dict:
+    """Compare an encode followed by a decode of the code against the fused
+    Encoder.encode_with_area, both called once per point.
+    """
+    from .decoder import decode
+    from .encoder import Encoders
+
+    lats, lons = workload(n)
+    encoder = Encoders[code_length]
+    encode = encoder.encode
+    encode_with_area = encoder.encode_with_area
+
+    def round_trip():
+        for a, b in zip(lats, lons):
+            code = encode(a, b)
+            decode(code)
+
+    def fused_loop():
+        for a, b in zip(lats, lons):
+            encode_with_area(a, b)
+
+    separate = best_time(round_trip, repeat)
+    fused = best_time(fused_loop, repeat)
+    return {
+        "code_length": code_length,
+        "n": n,
+        "round_trip_per_sec": n / separate,
+        "fused_per_sec": n / fused,
+        "speedup": separate / fused,
+    }
+
+
+class _EagerPlusCode:
+    """Layout of PlusCode before it was slotted and lazily evaluated: a
+    __dict__ holding the code, its decoded area and its length.
+    """
+
+    def __init__(self, code: str):
+        from .decoder import decode
+
+        self.code = code.upper()
+        self.area = decode(code)
+        self.length = len(code) - code.count("+") - code.count("0")
+
+
+def measure_bytes(make: Callable[[], list]) -> int:
+    """Bytes allocated, and still referenced, by the objects make returns."""
+    tracemalloc.start()
+    try:
+        objs = make()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del objs
+    return size
+
+
+def bench_plus_code_memory(n: int = 100_000, code_length: int = 10) -> dict:
+    """Per-object bytes of PlusCode instances, including their code strings,
+    before and after slotting and lazy evaluation.
+    """
+    from .code import PlusCode
+    from .encoder import Encoders
+
+    codes = Encoders[code_length].encode_many(*workload(n))
+    eager = measure_bytes(lambda: [_EagerPlusCode(c) for c in codes])
+    lazy = measure_bytes(lambda: [PlusCode.from_code(c) for c in codes])
+    return {
+        "code_length": code_length,
+        "n": n,
+        "eager_bytes_per_object": eager / n,
+        "lazy_bytes_per_object": lazy / n,
+    }
+
+
+@dataclass(frozen=True)
+class _DictPoint:
+    """Layout of Point before it was slotted."""
+
+    lat: float
+    lon: float
+
+
+@dataclass(frozen=True)
+class _DictArea:
+    """Layout of Area before it was slotted."""
+
+    sw: _DictPoint
+    ne: _DictPoint
+
+
+def bench_area(n: int = 100_000, code_length: int = 10, repeat: int = 3) -> dict:
+    """Per-object bytes and construction throughput of decoded areas: the
+    dict backed dataclasses Area used to be, the slotted Area, and AreaView
+    rows over one shared bounds buffer.
+    """
+    from array import array
+
+    from .decoder import decode_bounds
+    from .encoder import Encoders
+    from .geo import Area, AreaView, Point
+
+    codes = Encoders[code_length].encode_many(*workload(n))
+    bounds = [decode_bounds(c) for c in codes]
+    flat = array("d", [x for b in bounds for x in b])
+
+    def dict_areas():
+        return [_DictArea(_DictPoint(a, b), _DictPoint(c, d)) for a, b, c, d in bounds]
+
+    def slotted_areas():
+        return [Area(Point(a, b), Point(c, d)) for a, b, c, d in bounds]
+
+    return {
+        "code_length": code_length,
+        "n": n,
+        "dict_bytes_per_object": measure_bytes(dict_areas) / n,
+        "slotted_bytes_per_object": measure_bytes(slotted_areas) / n,
+        "view_bytes_per_object": measure_bytes(lambda: AreaView.rows(flat)) / n,
+        "dict_per_sec": n / best_time(dict_areas, repeat),
+        "slotted_per_sec": n / best_time(slotted_areas, repeat),
+        "view_per_sec": n / best_time(lambda: AreaView.rows(flat), repeat),
+    }
+
+
+def bench_code_array(n: int = 100_000, code_length: int = 10) -> dict:
+    """Per-code bytes of a list of code strings, a list of PlusCode instances
+    and a PlusCodeArray.
+    """
+    from .code import PlusCode
+    from .codearray import PlusCodeArray
+    from .encoder import Encoders
+
+    codes = Encoders[code_length].encode_many(*workload(n))
+    return {
+        "code_length": code_length,
+        "n": n,
+        "str_bytes_per_code": measure_bytes(lambda: [c.upper() for c in codes]) / n,
+        "plus_code_bytes_per_code": measure_bytes(
+            lambda: [PlusCode.from_code(c) for c in codes]
+        )
+        / n,
+        "array_bytes_per_code": measure_bytes(lambda: PlusCodeArray(codes)) / n,
+    }
+
+
+def bench_parallel(
+    n: int = 1_000_000,
+    code_length: int = 10,
+    workers: list[int] | None = None,
+    chunk_size: int | None = None,
+    repeat: int = 1,
+) -> list[dict]:
+    """Scaling curve of parallel.encode_many over worker counts, which default
+    to powers of two up to the CPU count, in chunks of parallel.CHUNK_SIZE by
+    default.
+    """
+    from . import parallel
+
+    chunk_size = chunk_size or parallel.CHUNK_SIZE
+    lats, lons = workload(n)
+    cpus = os.cpu_count() or 1
+    workers = workers or [w for w in (1, 2, 4, 8, 16, 32, 64) if w <= cpus]
+    results = []
+    for w in workers:
+        elapsed = best_time(
+            lambda: parallel.encode_many(
+                lats, lons, code_length, workers=w, chunk_size=chunk_size
+            ),
+            repeat,
+        )
+        results.append({"workers": w, "n": n, "per_sec": n / elapsed})
+    for res in results:
+        res["speedup"] = res["per_sec"] / results[0]["per_sec"]
+    return results
+
+
+def bench_codefile(n: int = 100_000, code_length: int = 10, repeat: int = 3) -> dict:
+    """Compare loading a reference set by parsing a text file of codes and
+    decoding each, against opening a memory-mapped code file.
+    """
+    from . import codefile
+    from .decoder import decode
+    from .encoder import Encoders
+
+    codes = Encoders[code_length].encode_many(*workload(n))
+    with tempfile.TemporaryDirectory() as tmp:
+        text_path, bin_path = f"{tmp}/codes.txt", f"{tmp}/codes.plc"
+        with open(text_path, "w") as f:
+            f.write("\n".join(codes))
+        codefile.write(bin_path, codes)
+
+        def load_text():
+            with open(text_path) as f:
+                return [decode(line.rstrip("\n")) for line in f]
+
+        def load_mmap():
+            with codefile.CodeFile(bin_path) as f:
+                return len(f)
+
+        text = best_time(load_text, repeat)
+        mapped = best_time(load_mmap, repeat)
+    return {
+        "code_length": code_length,
+        "n": n,
+        "text_seconds": text,
+        "mmap_seconds": mapped,
+        "speedup": text / mapped,
+    }
+
+
+def bench_index(
+    n: int = 100_000, queries: int = 10_000, scans: int = 20, repeat: int = 3
+) -> dict:
+    """Compare PlusCodeIndex.query against a linear scan of decoded areas, for
+    n regions of lengths 2 through 10.
+    """
+    from .decoder import decode
+    from .encoder import encode
+    from .index import PlusCodeIndex
+
+    rng = random.Random(42)
+    lats, lons = workload(n)
+    codes = [encode(a, b, rng.choice((2, 4, 6, 8, 10))) for a, b in zip(lats, lons)]
+    areas = [(code, decode(code)) for code in codes]
+    points = list(zip(*workload(queries, seed=7)))
+    index = PlusCodeIndex(codes)
+
+    def scan():
+        for lat, lon in points[:scans]:
+            [
+                code
+                for code, area in areas
+                if area.sw.lat <= lat < area.ne.lat and area.sw.lon <= lon < area.ne.lon
+            ]
+
+    query = index.query
+    indexed = best_time(lambda: [query(lat, lon) for lat, lon in points], repeat)
+    linear = best_time(scan, 1)
+    return {
+        "n": n,
+        "index_per_sec": queries / indexed,
+        "scan_per_sec": scans / linear,
+        "speedup": (queries / indexed) / (scans / linear),
+    }
+
+
+def bench_neighbors(n: int = 10_000, code_length: int = 10, repeat: int = 3) -> dict:
+    """Compare grid.neighbors against decoding each code, offsetting its center
+    by the cell size and encoding the 8 surrounding points.
+    """
+    from .decoder import decode
+    from .encoder import Encoders
+    from .grid import neighbors
+
+    codes = Encoders[code_length].encode_many(*workload(n))
+    encode = Encoders[code_length].encode
+
+    def round_trip(code):
+        area = decode(code)
+        lat, lon = area.center().latlon()
+        height, width = area.ne.lat - area.sw.lat, area.ne.lon - area.sw.lon
+        return [
+            encode(lat + dlat * height, lon + dlon * width)
+            for dlat in (1, 0, -1)
+            for dlon in (-1, 0, 1)
+            if dlat or dlon
+        ]
+
+    floats = best_time(lambda: [round_trip(c) for c in codes], repeat)
+    cells = best_time(lambda: [neighbors(c) for c in codes], repeat)
+    return {
+        "code_length": code_length,
+        "n": n,
+        "round_trip_per_sec": n / floats,
+        "grid_per_sec": n / cells,
+        "speedup": floats / cells,
+    }
+
+
+def bench_parent(n: int = 100_000, code_length: int = 10, repeat: int = 3) -> dict:
+    """Compare hierarchy.parent against decoding each code and encoding its
+    center at the parent length.
+    """
+    from .decoder import decode_center
+    from .encoder import Encoders
+    from .hierarchy import parent
+
+    codes = Encoders[code_length].encode_many(*workload(n))
+    length = code_length - 2 if code_length <= 10 else code_length - 1
+    encode = Encoders[length].encode
+
+    floats = best_time(lambda: [encode(*decode_center(c)) for c in codes], repeat)
+    strings = best_time(lambda: [parent(c, length) for c in codes], repeat)
+    return {
+        "code_length": code_length,
+        "n": n,
+        "round_trip_per_sec": n / floats,
+        "parent_per_sec": n / strings,
+        "speedup": floats / strings,
+    }
+
+
+def bench_shorten(n: int = 100_000, repeat: int = 3) -> dict:
+    """Compare Transformer.shorten in a loop against Transformer.shorten_many,
+    for length 10 codes within a degree of a shared reference.
+    """
+    from .encoder import Encoders
+    from .transformer import Transformer
+
+    rng = random.Random(42)
+    ref = (47.365590, 8.524997)
+    codes = Encoders[10].encode_many(
+        [ref[0] + rng.uniform(-1, 1) ** 3 for _ in range(n)],
+        [ref[1] + rng.uniform(-1, 1) ** 3 for _ in range(n)],
+    )
+    transformer = Transformer()
+
+    loop = best_time(lambda: [transformer.shorten(c, ref) for c in codes], repeat)
+    batch = best_time(lambda: transformer.shorten_many(codes, ref), repeat)
+    return {
+        "n": n,
+        "loop_per_sec": n / loop,
+        "batch_per_sec": n / batch,
+        "speedup": loop / batch,
+    }
+
+
+def bench_instrument(n: int = 100_000, code_length: int = 10, repeat: int = 3) -> dict:
+    """Compare encode before instrumentation is enabled, while enabled, and
+    after it is disabled again.
+    """
+    from . import instrument
+    from .encoder import encode
+
+    lats, lons = workload(n)
+
+    def run():
+        return [encode(a, b, code_length) for a, b in zip(lats, lons)]
+
+    before = best_time(run, repeat)
+    instrument.enable()
+    try:
+        enabled = best_time(run, repeat)
+    finally:
+        instrument.disable()
+    after = best_time(run, repeat)
+    return {
+        "n": n,
+        "before_per_sec": n / before,
+        "enabled_per_sec": n / enabled,
+        "disabled_per_sec": n / after,
+        "overhead": enabled / before,
+    }
+
+
+def bench_vectorized_encode(
+    n: int = 100_000, code_length: int = 10, repeat: int = 3
+) -> dict:
+    """Compare the scalar Encoder.encode loop against vectorized.encode.
+
+    Requires numpy.
+    """
+    import numpy as np
+
+    from . import vectorized
+    from .encoder import Encoders
+
+    lats, lons = workload(n)
+    lat_array, lon_array = np.array(lats), np.array(lons)
+    encode = Encoders[code_length].encode
+
+    scalar = best_time(lambda: [encode(a, b) for a, b in zip(lats, lons)], repeat)
+    vector = best_time(
+        lambda: vectorized.encode(lat_array, lon_array, code_length), repeat
+    )
+    return {
+        "code_length": code_length,
+        "n": n,
+        "scalar_per_sec": n / scalar,
+        "vectorized_per_sec": n / vector,
+        "speedup": scalar / vector,
+    }
+
+
+def bench_vectorized_decode(
+    n: int = 100_000, code_length: int = 10, repeat: int = 3
+) -> dict:
+    """Compare the scalar Decoder.decode loop against vectorized.decode.
+
+    Requires numpy.
+    """
+    import numpy as np
+
+    from . import vectorized
+    from .decoder import Decoder
+    from .encoder import Encoders
+
+    codes = Encoders[code_length].encode_many(*workload(n))
+    code_array = np.array(codes)
+    decode = Decoder().decode
+
+    scalar = best_time(lambda: [decode(c) for c in codes], repeat)
+    vector = best_time(lambda: vectorized.decode(code_array), repeat)
+    return {
+        "code_length": code_length,
+        "n": n,
+        "scalar_per_sec": n / scalar,
+        "vectorized_per_sec": n / vector,
+        "speedup": scalar / vector,
+    }
+
+
+# A benchmark run, from the workload size and repeat count to its results.
+_Run = Callable[[int, int], list[dict]]
+
+
+def _lengths() -> list[int]:
+    """The valid code lengths, in increasing order."""
+    from .encoder import Encoders
+
+    return sorted(Encoders)
+
+
+def _per_length(bench: Callable[..., dict]) -> _Run:
+    """Run a benchmark at every code length."""
+    return lambda n, repeat: [bench(n, length, repeat) for length in _lengths()]
+
+
+def _once(bench: Callable[..., dict]) -> _Run:
+    """Run a benchmark at its default code length."""
+    return lambda n, repeat: [bench(n, repeat=repeat)]
+
+
+def _with_numpy(run: _Run) -> _Run:
+    """Run a benchmark requiring numpy, or none without it."""
+
+    def wrapper(n: int, repeat: int) -> list[dict]:
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            return []
+        return run(n, repeat)
+
+    return wrapper
+
+
+# The benchmarks of individual optimizations, as (name, run, lines): run
+# takes the workload size and repeat count and returns the results, each
+# printed as the name followed by the format strings of lines.
+FEATURES: list[tuple[str, _Run, tuple[str, ...]]] = [
+    (
+        "table encode",
+        _per_length(bench_table_encode),
+        (
+            " length={code_length:>2}: loop {loop_per_sec:>12,.0f}/s  "
+            "table {table_per_sec:>12,.0f}/s  x{speedup:.2f}",
+        ),
+    ),
+    (
+        "encode",
+        _per_length(bench_encode),
+        (
+            " length={code_length:>2}: scalar {scalar_per_sec:>12,.0f}/s  "
+            "batch {batch_per_sec:>12,.0f}/s  x{speedup:.2f}",
+        ),
+    ),
+    (
+        "decode",
+        _per_length(bench_decode),
+        (
+            " length={code_length:>2}: fresh {fresh_per_sec:>12,.0f}/s  "
+            "shared {shared_per_sec:>12,.0f}/s  bounds {bounds_per_sec:>12,.0f}/s  "
+            "center {center_per_sec:>12,.0f}/s",
+        ),
+    ),
+    (
+        "encode with area",
+        _per_length(bench_encode_with_area),
+        (
+            " length={code_length:>2}: round trip {round_trip_per_sec:>12,.0f}/s  "
+            "fused {fused_per_sec:>12,.0f}/s  x{speedup:.2f}",
+        ),
+    ),
+    (
+        "PlusCode memory",
+        lambda n, repeat: [bench_plus_code_memory(n)],
+        (
+            ": eager {eager_bytes_per_object:.0f} B/object  "
+            "lazy {lazy_bytes_per_object:.0f} B/object",
+        ),
+    ),
+    (
+        "Area",
+        _once(bench_area),
+        (
+            " memory: dict {dict_bytes_per_object:.0f} B/object  "
+            "slotted {slotted_bytes_per_object:.0f} B/object  "
+            "view {view_bytes_per_object:.0f} B/object",
+            " construction: dict {dict_per_sec:>12,.0f}/s  "
+            "slotted {slotted_per_sec:>12,.0f}/s  view {view_per_sec:>12,.0f}/s",
+        ),
+    ),
+    (
+        "parallel encode",
+        lambda n, repeat: bench_parallel(10 * n),
+        (" workers={workers:>2}: {per_sec:>12,.0f}/s  x{speedup:.2f}",),
+    ),
+    (
+        "reference load",
+        _once(bench_codefile),
+        (": text {text_seconds:.4f}s  mmap {mmap_seconds:.6f}s  " "x{speedup:,.0f}",),
+    ),
+    (
+        "region lookup",
+        _once(bench_index),
+        (
+            " n={n:,}: scan {scan_per_sec:>10,.1f}/s  "
+            "index {index_per_sec:>12,.0f}/s  x{speedup:,.0f}",
+        ),
+    ),
+    (
+        "neighbors",
+        _once(bench_neighbors),
+        (
+            ": round trip {round_trip_per_sec:>12,.0f}/s  "
+            "grid {grid_per_sec:>12,.0f}/s  x{speedup:.2f}",
+        ),
+    ),
+    (
+        "parent",
+        _once(bench_parent),
+        (
+            ": round trip {round_trip_per_sec:>12,.0f}/s  "
+            "slice {parent_per_sec:>12,.0f}/s  x{speedup:.2f}",
+        ),
+    ),
+    (
+        "shorten",
+        _once(bench_shorten),
+        (
+            ": loop {loop_per_sec:>12,.0f}/s  batch {batch_per_sec:>12,.0f}/s  "
+            "x{speedup:.2f}",
+        ),
+    ),
+    (
+        "instrumented encode",
+        _once(bench_instrument),
+        (
+            ": before {before_per_sec:>12,.0f}/s  enabled {enabled_per_sec:>12,.0f}/s  "
+            "disabled {disabled_per_sec:>12,.0f}/s",
+        ),
+    ),
+    (
+        "Code container memory",
+        lambda n, repeat: [bench_code_array(n)],
+        (
+            ": str {str_bytes_per_code:.0f} B/code  "
+            "PlusCode {plus_code_bytes_per_code:.0f} B/code  "
+            "PlusCodeArray {array_bytes_per_code:.0f} B/code",
+        ),
+    ),
+    (
+        "vectorized encode",
+        _with_numpy(_per_length(bench_vectorized_encode)),
+        (
+            " length={code_length:>2}: scalar {scalar_per_sec:>12,.0f}/s  "
+            "vectorized {vectorized_per_sec:>12,.0f}/s  x{speedup:.2f}",
+        ),
+    ),
+    (
+        "vectorized decode",
+        _with_numpy(_per_length(bench_vectorized_decode)),
+        (
+            " length={code_length:>2}: scalar {scalar_per_sec:>12,.0f}/s  "
+            "vectorized {vectorized_per_sec:>12,.0f}/s  x{speedup:.2f}",
+        ),
+    ),
+]
+
+
+def features(n: int, repeat: int):
+    """Print the benchmarks of individual optimizations."""
+    for name, run, lines in FEATURES:
+        for res in run(n, repeat):
+            for line in lines:
+                print(name + line.format(**res))
+
+
+# The operations, implementations and modes of the suite.
+OPERATIONS = ("import", "encode", "decode", "validate", "shorten", "recover")
+IMPLEMENTATIONS = ("pluscodes", "openlocationcode")
+MODES = ("scalar", "batch")
+
+# The statements timed by the import benchmark, per (implementation, mode).
+IMPORTS = {
+    ("pluscodes", "package"): "import pluscodes",
+    ("pluscodes", "encode"): "from pluscodes import encode",
+    ("openlocationcode", "package"): (
+        "from pluscodes.openlocationcode import openlocationcode"
+    ),
+}
+
+# The reference location of the shorten and recover workloads.
+REFERENCE = (47.365590, 8.524997)
+
+
+def suite_workload(n: int, code_length: int, seed: int = 42) -> dict:
+    """
+    Seeded inputs for the suite at one code length: uniformly distributed
+    locations and their codes, codes within about a degree of REFERENCE,
+    and short codes of those, trimmed by 2, 4 or 6 digits.
+    """
+    from .encoder import Encoders
+
+    rng = random.Random(seed * 100 + code_length)
+    lats, lons = workload(n, seed)
+    near = Encoders[code_length].encode_many(
+        [REFERENCE[0] + rng.uniform(-1, 1) ** 3 for _ in range(n)],
+        [REFERENCE[1] + rng.uniform(-1, 1) ** 3 for _ in range(n)],
+    )
+    return {
+        "lats": lats,
+        "lons": lons,
+        "codes": Encoders[code_length].encode_many(lats, lons),
+        "near": near,
+        "short": [code[rng.choice((2, 4, 6)) :] for code in near],
+    }
+
+
+def suite_cases(code_length: int, data: dict) -> list[tuple[str, str, str, Callable]]:
+    """The (operation, implementation, mode, fn) cases at one code length.
+
+    Shortening and recovery need unpadded codes, so they are only measured
+    from length 8. Batch decoding requires numpy, and openlocationcode only
+    has scalar functions.
+    """
+    from .base import Base
+    from .decoder import decode
+    from .encoder import encode, encode_many
+    from .openlocationcode import openlocationcode as olc
+    from .transformer import Transformer, recover_many, shorten_many
+    from .validator import Validator, classify_many
+
+    lats, lons, codes = data["lats"], data["lons"], data["codes"]
+    near, short = data["near"], data["short"]
+    ref_lat, ref_lon = REFERENCE
+    transformer, is_full = Transformer(), Validator().is_full
+    L = code_length
+
+    cases = [
+        (
+            "encode",
+            "pluscodes",
+            "scalar",
+            lambda: [encode(a, b, L) for a, b in zip(lats, lons)],
+        ),
+        ("encode", "pluscodes", "batch", lambda: encode_many(lats, lons, L)),
+        (
+            "encode",
+            "openlocationcode",
+            "scalar",
+            lambda: [olc.encode(a, b, L) for a, b in zip(lats, lons)],
+        ),
+        ("decode", "pluscodes", "scalar", lambda: [decode(c) for c in codes]),
+        (
+            "decode",
+            "openlocationcode",
+            "scalar",
+            lambda: [olc.decode(c) for c in codes],
+        ),
+        ("validate", "pluscodes", "scalar", lambda: [is_full(c) for c in codes]),
+        ("validate", "pluscodes", "batch", lambda: classify_many(codes)),
+        (
+            "validate",
+            "openlocationcode",
+            "scalar",
+            lambda: [olc.isFull(c) for c in codes],
+        ),
+    ]
+    try:
+        from . import vectorized
+    except ImportError:
+        pass
+    else:
+        cases.append(("decode", "pluscodes", "batch", lambda: vectorized.decode(codes)))
+
+    if L >= Base.SEP_POSITION:
+        shorten, lengthen = transformer.shorten, transformer.lenghten
+        cases += [
+            (
+                "shorten",
+                "pluscodes",
+                "scalar",
+                lambda: [shorten(c, REFERENCE) for c in near],
+            ),
+            ("shorten", "pluscodes", "batch", lambda: shorten_many(near, REFERENCE)),
+            (
+                "shorten",
+                "openlocationcode",
+                "scalar",
+                lambda: [olc.shorten(c, ref_lat, ref_lon) for c in near],
+            ),
+            (
+                "recover",
+                "pluscodes",
+                "scalar",
+                lambda: [lengthen(c, REFERENCE) for c in short],
+            ),
+            ("recover", "pluscodes", "batch", lambda: recover_many(short, REFERENCE)),
+            (
+                "recover",
+                "openlocationcode",
+                "scalar",
+                lambda: [olc.recoverNearest(c, ref_lat, ref_lon) for c in short],
+            ),
+        ]
+    return cases
+
+
+def import_time(statement: str, repeat: int = 3) -> float:
+    """
+    The best time, in seconds, spent importing pluscodes modules and their
+    dependencies when running a statement in a fresh interpreter, as
+    reported by -X importtime. The interpreter's own startup is excluded.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    path = [root, os.environ.get("PYTHONPATH", "")]
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, path))}
+    best = float("inf")
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", statement],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        total = 0
+        for line in proc.stderr.splitlines():
+            # 'import time: <self us> | <cumulative us> | <module>', with
+            # nested imports indented.
+            fields = line.partition("import time:")[2].split("|")
+            if len(fields) != 3 or not fields[1].strip().isdigit():
+                continue
+            name = fields[2][1:]
+            if name.startswith("pluscodes"):
+                total += int(fields[1])
+        best = min(best, total / 1e6)
+    return best
+
+
+def result_key(result: dict) -> str:
+    """
+    The identifier of a suite result, e.g., 'encode/pluscodes/batch/10', or
+    'import/pluscodes/package' for imports, which have no code length.
+    """
+    fields = ("operation", "implementation", "mode", "code_length")
+    return "/".join(str(result[k]) for k in fields if result[k] is not None)
+
+
+def suite(
+    n: int = 10_000,
+    seed: int = 42,
+    repeat: int = 3,
+    code_lengths: list[int] | None = None,
+    operations: list[str] | None = None,
+) -> list[dict]:
+    """
+    Run the suite, returning one result per case, ordered by operation,
+    code length, implementation and mode. Import results have no code length,
+    and count a single import.
+    """
+    results = []
+    if not operations or "import" in operations:
+        for (implementation, mode), statement in IMPORTS.items():
+            seconds = import_time(statement, repeat)
+            results.append(
+                {
+                    "operation": "import",
+                    "implementation": implementation,
+                    "mode": mode,
+                    "code_length": None,
+                    "n": 1,
+                    "seconds": seconds,
+                    "per_sec": 1 / seconds,
+                }
+            )
+    for code_length in code_lengths or _lengths():
+        data = suite_workload(n, code_length, seed)
+        for operation, implementation, mode, fn in suite_cases(code_length, data):
+            if operations and operation not in operations:
+                continue
+            seconds = best_time(fn, repeat)
+            results.append(
+                {
+                    "operation": operation,
+                    "implementation": implementation,
+                    "mode": mode,
+                    "code_length": code_length,
+                    "n": n,
+                    "seconds": seconds,
+                    "per_sec": n / seconds,
+                }
+            )
+    order = {op: i for i, op in enumerate(OPERATIONS)}
+    # The sort is stable, so imports stay in the order of IMPORTS.
+    results.sort(
+        key=lambda r: (
+            order[r["operation"]],
+            r["code_length"] or 0,
+            IMPLEMENTATIONS.index(r["implementation"]),
+            MODES.index(r["mode"]) if r["mode"] in MODES else 0,
+        )
+    )
+    return results
+
+
+def environment() -> dict:
+    """The interpreter and platform that produced the results."""
+    try:
+        import numpy
+
+        numpy_version = numpy.__version__
+    except ImportError:
+        numpy_version = None
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "numpy": numpy_version,
+    }
+
+
+def compare(
+    results: list[dict], baseline: list[dict], threshold: float = 0.1
+) -> list[dict]:
+    """
+    Compare results against baseline results of the same cases.
+
+    Returns:
+        Per case present in both, the key, both throughputs, their ratio and
+        whether the throughput dropped by more than the threshold fraction.
+    """
+    previous = {result_key(r): r for r in baseline}
+    comparison = []
+    for result in results:
+        key = result_key(result)
+        if key not in previous:
+            continue
+        ratio = result["per_sec"] / previous[key]["per_sec"]
+        comparison.append(
+            {
+                "key": key,
+                "per_sec": result["per_sec"],
+                "baseline_per_sec": previous[key]["per_sec"],
+                "ratio": ratio,
+                "regression": ratio < 1 - threshold,
+            }
+        )
+    return comparison
+
+
+def report(results: list[dict]) -> str:
+    """A table of results, with the speedup of each pluscodes case over the
+    scalar openlocationcode case.
+    """
+    olc_rates = {
+        (r["operation"], r["code_length"]): r["per_sec"]
+        for r in results
+        if r["implementation"] == "openlocationcode"
+    }
+    lines = []
+    for r in results:
+        if r["code_length"] is None:
+            line = (
+                f"{r['operation']:<9} {'':<9}  {r['implementation']:<16} "
+                f"{r['mode']:<7} {r['seconds'] * 1e3:>10.3f} ms"
+            )
+            lines.append(line)
+            continue
+        line = (
+            f"{r['operation']:<9} length={r['code_length']:>2}  "
+            f"{r['implementation']:<16} {r['mode']:<7} {r['per_sec']:>12,.0f}/s"
+        )
+        olc_rate = olc_rates.get((r["operation"], r["code_length"]))
+        if r["implementation"] == "pluscodes" and olc_rate:
+            line += f"  x{r['per_sec'] / olc_rate:.2f} vs openlocationcode"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("-n", type=int, default=10_000, help="Workload size per case.")
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Runs per case; the best counts."
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Workload seed.")
+    parser.add_argument(
+        "-l",
+        "--code-length",
+        type=int,
+        action="append",
+        choices=_lengths(),
+        help="Code length to run, repeatable. Defaults to all.",
+    )
+    parser.add_argument(
+        "--op",
+        action="append",
+        choices=OPERATIONS,
+        help="Operation to run, repeatable. Defaults to all.",
+    )
+    parser.add_argument(
+        "--json", metavar="PATH", help="Write the results as JSON, or - for stdout."
+    )
+    parser.add_argument(
+        "--baseline", metavar="PATH", help="JSON results to compare against."
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Throughput drop, as a fraction of the baseline, reported as a regression.",
+    )
+    parser.add_argument(
+        "--features",
+        action="store_true",
+        help="Run the benchmarks of individual optimizations instead of the suite.",
+    )
+    args = parser.parse_args(argv)
+
+    if args.features:
+        features(args.n, args.repeat)
+        return 0
+
+    results = suite(args.n, args.seed, args.repeat, args.code_length, args.op)
+    doc = {
+        "environment": environment(),
+        "n": args.n,
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "results": results,
+    }
+    status = 0
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        doc["comparison"] = compare(results, baseline, args.threshold)
+        status = int(any(c["regression"] for c in doc["comparison"]))
+
+    if args.json == "-":
+        json.dump(doc, sys.stdout, indent=2)
+        print()
+        return status
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(doc, f, indent=2)
+
+    print(report(results))
+    for c in doc.get("comparison", []):
+        if c["regression"]:
+            print(
+                f"REGRESSION {c['key']}: {c['per_sec']:,.0f}/s vs "
+                f"{c['baseline_per_sec']:,.0f}/s (x{c['ratio']:.2f})"
+            )
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
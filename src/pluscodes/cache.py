@@ -0,0 +1,120 @@
+"""
+Opt-in, size bounded cache of decoded Plus Code areas.
+
+When enabled, every Decoder.decode call, and therefore decode, PlusCode and
+Transformer, consults the cache first. Call sites do not need to change:
+
+    from pluscodes import cache
+
+    cache.enable(maxsize=500_000)
+    ...
+    print(cache.info())
+    cache.disable()
+"""
+import threading
+from collections import OrderedDict
+from typing import Callable, NamedTuple
+
+from .decoder import Decoder
+from .geo import Area
+
+# Supported eviction policies.
+POLICIES = ("lru", "fifo")
+
+
+class CacheInfo(NamedTuple):
+    """Cache statistics, mirroring functools.lru_cache's cache_info()."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class DecodeCache:
+    """
+    Thread-safe, size bounded mapping of codes to decoded areas.
+
+    Args:
+        maxsize: The maximum number of cached areas.
+        policy: The eviction policy once maxsize is reached. "lru" evicts the
+            least recently used code, "fifo" the least recently inserted one.
+    """
+
+    def __init__(self, maxsize: int = 100_000, policy: str = "lru"):
+        if not isinstance(maxsize, int) or maxsize < 1:
+            raise ValueError(f"maxsize must be a positive integer: {maxsize=}")
+        if policy not in POLICIES:
+            raise ValueError(f"policy must be one of {POLICIES}: {policy=}")
+        self.maxsize = maxsize
+        self.policy = policy
+        self.hits = 0
+        self.misses = 0
+        self._lru = policy == "lru"
+        self._data: OrderedDict[str, Area] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def lookup(self, code: str, decode: Callable[[str], Area]) -> Area:
+        """Return the cached area of the code, computing and storing it with
+        decode on a miss.
+        """
+        with self._lock:
+            area = self._data.get(code)
+            if area is not None:
+                self.hits += 1
+                if self._lru:
+                    self._data.move_to_end(code)
+                return area
+            self.misses += 1
+
+        # Decode outside of the lock so that misses do not serialize.
+        area = decode(code)
+        with self._lock:
+            self._data[code] = area
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return area
+
+    def info(self) -> CacheInfo:
+        """Snapshot of the cache statistics."""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def clear(self):
+        """Remove all cached areas and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+def enable(maxsize: int = 100_000, policy: str = "lru") -> DecodeCache:
+    """Install a new, empty decode cache used by all Decoder instances."""
+    Decoder.cache = DecodeCache(maxsize, policy)
+    return Decoder.cache
+
+
+def disable():
+    """Remove the installed decode cache, if any."""
+    Decoder.cache = None
+
+
+def enabled() -> bool:
+    """Whether a decode cache is installed."""
+    return Decoder.cache is not None
+
+
+def info() -> CacheInfo | None:
+    """Statistics of the installed decode cache, or None if disabled."""
+    cache = Decoder.cache
+    return cache.info() if cache is not None else None
+
+
+def clear():
+    """Clear the installed decode cache, if any."""
+    cache = Decoder.cache
+    if cache is not None:
+        cache.clear()
@@ -0,0 +1,210 @@
+"""
+Command line interface for encoding and decoding large files.
+
+    pluscodes encode [FILE ...] [--format lines|csv|tsv] [--lat COL] [--lon COL]
+    pluscodes decode [FILE ...] [--format lines|csv|tsv] [--code COL] [--center]
+
+Input is read from the files, or stdin when none (or "-") are given, and
+processed in chunks of --chunk-size rows, so memory use does not grow with
+the input. Results are written to stdout, and the throughput to stderr.
+
+In the lines format, each line holds either a code, or a latitude and a
+longitude separated by a comma or whitespace. CSV and TSV input has a header
+row unless --no-header is given, and columns are selected by name or by
+zero-based index.
+"""
+import argparse
+import csv
+import sys
+import time
+from itertools import chain
+from typing import TextIO
+
+from .encoder import Encoders
+from .rows import (
+    DELIMITERS,
+    FORMATS,
+    chunked,
+    decode_chunk,
+    encode_chunk,
+    read_lines,
+    read_rows,
+)
+
+CHUNK_SIZE = 65_536
+
+# Column names recognized when no column is selected explicitly.
+_LAT_NAMES = ("lat", "latitude")
+_LON_NAMES = ("lon", "lng", "long", "longitude")
+_CODE_NAMES = ("code", "pluscode", "plus_code")
+
+_BOUNDS_HEADER = ["sw_lat", "sw_lon", "ne_lat", "ne_lon"]
+_CENTER_HEADER = ["center_lat", "center_lon"]
+
+
+def find_column(header: list[str] | None, spec: str | None, names: tuple) -> int:
+    """
+    Resolve a column name or zero-based index, or the first of the default
+    names present in the header, or else the position of the default names in
+    the lines format.
+    """
+    if spec is not None:
+        if spec.isdigit():
+            return int(spec)
+        if header is None:
+            raise ValueError(f"Columns can only be named with a header: {spec=}")
+        try:
+            return header.index(spec)
+        except ValueError:
+            raise ValueError(f"No such column: {spec=}")
+    if header is not None:
+        lowered = [name.strip().lower() for name in header]
+        for name in names:
+            if name in lowered:
+                return lowered.index(name)
+        raise ValueError(f"None of the columns {names} are in the header.")
+    return {_LAT_NAMES: 0, _LON_NAMES: 1, _CODE_NAMES: 0}[names]
+
+
+class Meter:
+    """Counts processed rows and reports the throughput on a stream."""
+
+    def __init__(self, name: str, stream: TextIO, progress: bool = False):
+        self.name = name
+        self.stream = stream
+        self.progress = progress
+        self.rows = 0
+        self.start = time.perf_counter()
+
+    def update(self, rows: int):
+        self.rows += rows
+        if self.progress:
+            self.report()
+
+    def report(self):
+        elapsed = max(time.perf_counter() - self.start, 1e-9)
+        print(
+            f"pluscodes {self.name}: {self.rows:,} rows in {elapsed:.2f}s "
+            f"({self.rows / elapsed:,.0f} rows/s)",
+            file=self.stream,
+        )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="pluscodes",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("files", nargs="*", help="Input files. Defaults to stdin.")
+    common.add_argument("-f", "--format", choices=FORMATS, default="lines")
+    common.add_argument(
+        "--no-header",
+        dest="header",
+        action="store_false",
+        help="CSV and TSV input has no header row.",
+    )
+    common.add_argument(
+        "-k",
+        "--keep",
+        action="store_true",
+        help="Write the input columns before the results.",
+    )
+    common.add_argument(
+        "--skip-invalid",
+        action="store_true",
+        help="Write empty results for invalid rows instead of failing.",
+    )
+    common.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    common.add_argument(
+        "--progress", action="store_true", help="Report throughput per chunk."
+    )
+    common.add_argument(
+        "-q", "--quiet", action="store_true", help="Do not report throughput."
+    )
+
+    encode = commands.add_parser(
+        "encode", parents=[common], help="Encode locations into Plus Codes."
+    )
+    encode.add_argument("--lat", help="Latitude column name or index.")
+    encode.add_argument("--lon", help="Longitude column name or index.")
+    encode.add_argument(
+        "-l", "--code-length", type=int, default=10, choices=sorted(Encoders)
+    )
+
+    decode = commands.add_parser(
+        "decode", parents=[common], help="Decode Plus Codes into bounds."
+    )
+    decode.add_argument("--code", help="Code column name or index.")
+    decode.add_argument("--center", action="store_true", help="Add the center.")
+    return parser
+
+
+def run(
+    args: argparse.Namespace,
+    stdin: TextIO,
+    stdout: TextIO,
+    stderr: TextIO,
+):
+    """Stream the input through the selected command."""
+    if args.chunk_size < 1:
+        raise ValueError(f"Chunk size must be positive: {args.chunk_size=}")
+
+    rows = read_rows(read_lines(args.files, stdin), args.format)
+    header = None
+    if args.format != "lines" and args.header:
+        _, header = next(rows, (None, None))
+        if header is None:
+            return
+
+    writer = csv.writer(stdout, delimiter=DELIMITERS[args.format], lineterminator="\n")
+    if args.command == "encode":
+        lat_col = find_column(header, args.lat, _LAT_NAMES)
+        lon_col = find_column(header, args.lon, _LON_NAMES)
+        results = ["code"]
+    else:
+        code_col = find_column(header, args.code, _CODE_NAMES)
+        results = _BOUNDS_HEADER + (_CENTER_HEADER if args.center else [])
+    if header is not None:
+        writer.writerow(header + results if args.keep else results)
+
+    meter = Meter(args.command, stderr, args.progress)
+    delimiter = DELIMITERS[args.format]
+    skip_invalid = args.skip_invalid
+    for chunk in chunked(rows, args.chunk_size):
+        fields = [row for _, row in chunk] if args.keep else None
+        if args.command == "encode":
+            out = encode_chunk(chunk, lat_col, lon_col, args.code_length, skip_invalid)
+            if args.keep:
+                writer.writerows(map(chain, fields, ([code] for code in out)))
+            else:
+                # Codes and floats never need quoting, so skip the csv writer.
+                stdout.write("\n".join(out) + "\n")
+        else:
+            out = decode_chunk(chunk, code_col, args.center, skip_invalid)
+            if args.keep:
+                writer.writerows(map(chain, fields, out))
+            else:
+                join = delimiter.join
+                stdout.write("\n".join([join(map(repr, row)) for row in out]) + "\n")
+        meter.update(len(chunk))
+    if not args.quiet and not args.progress:
+        meter.report()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        run(args, sys.stdin, sys.stdout, sys.stderr)
+    except (OSError, ValueError) as e:
+        print(f"pluscodes {args.command}: error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,5 @@
-import re
-from typing import Callable
-
+from . import packed
+from .base import Base
 from .decoder import decode
 from .encoder import encode
 from .geo import Area, Point
@@ -20,8 +19,13 @@ class PlusCode:
         area: The roughly 13m x 13m geographic bounds corresponding to the
             Plus Code.
 
+    The area and length are computed on first access. Instances are slotted,
+    and the from_latlon, from_code and from_int factories skip the input
+    type dispatch performed by the constructor.
     """
 
+    __slots__ = ("code", "_area", "_length")
+
     # validator = Validator()
     # is_valid: Callable = validator.is_valid
     # is_full: Callable = validator.is_full
@@ -56,8 +60,57 @@ class PlusCode:
         else:
             raise ValueError(f"Unexpected input {val=}")
 
-        self.area = area or decode(self.code)
-        self.length: int = len(re.sub("[+0]", "", self.code))
+        self._area = area
+        self._length = None
+
+    @classmethod
+    def from_latlon(cls, lat: float, lon: float, code_length: int = 10) -> "PlusCode":
+        """Encode a location into a PlusCode."""
+        obj = cls.__new__(cls)
+        obj.code = encode(lat, lon, code_length)
+        obj._area = obj._length = None
+        return obj
+
+    @classmethod
+    def from_code(cls, code: str) -> "PlusCode":
+        """Wrap a full Plus Code string. No explicit validation checks are
+        performed.
+        """
+        obj = cls.__new__(cls)
+        obj.code = code.upper()
+        obj._area = obj._length = None
+        return obj
+
+    @classmethod
+    def from_int(cls, key: int) -> "PlusCode":
+        """Unpack an integer key produced by packed.to_int into a PlusCode."""
+        obj = cls.__new__(cls)
+        obj.code = packed.from_int(key)
+        obj._area = obj._length = None
+        return obj
+
+    @property
+    def area(self) -> Area:
+        """The geographic bounds of the code, decoded on first access."""
+        if self._area is None:
+            self._area = decode(self.code)
+        return self._area
+
+    @area.setter
+    def area(self, area: Area):
+        self._area = area
+
+    @property
+    def length(self) -> int:
+        """The number of digits in the code, excluding separator and padding
+        characters.
+        """
+        if self._length is None:
+            code = self.code
+            self._length = (
+                len(code) - code.count(Base.SEP) - code.count(Base.PADDING_CHAR)
+            )
+        return self._length
 
     # @classmethod
     # def is_valid(cls, code: str) -> bool:
@@ -0,0 +1,246 @@
+"""
+A compact, columnar container of full Plus Codes.
+
+PlusCodeArray stores each code as its packed integer key (see packed) in an
+array('Q'), i.e., 8 bytes per code instead of a str or PlusCode object.
+Because keys sort in code order and the descendants of a code form a
+contiguous range of keys, sorted arrays support binary search and prefix
+queries directly on the keys.
+
+The keys are exposed through the buffer protocol, so they can be handed to
+other libraries without copying:
+
+    codes = PlusCodeArray.encode(lats, lons)
+    keys = numpy.frombuffer(codes.keys, dtype=numpy.uint64)
+"""
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Iterable, Iterator, overload
+
+from . import packed
+from .encoder import Encoders
+from .geo import AreaView, as_doubles
+
+_TYPECODE = "Q"
+
+
+class PlusCodeArray:
+    """
+    An array of full Plus Codes stored as packed integer keys.
+
+    Indexing returns code strings and slicing returns a new PlusCodeArray.
+
+    Args:
+        codes: Full Plus Codes of any valid length.
+
+    Raises:
+        ValueError: If a code is not a full code of a valid length.
+    """
+
+    __slots__ = ("_keys",)
+
+    def __init__(self, codes: Iterable[str] = ()):
+        self._keys = array(_TYPECODE, map(packed.to_int, codes))
+
+    @classmethod
+    def _wrap(cls, keys: array) -> "PlusCodeArray":
+        obj = cls.__new__(cls)
+        obj._keys = keys
+        return obj
+
+    @classmethod
+    def from_keys(cls, keys: Iterable[int]) -> "PlusCodeArray":
+        """Wrap packed integer keys. No explicit validation checks are
+        performed.
+        """
+        return cls._wrap(array(_TYPECODE, keys))
+
+    @classmethod
+    def frombuffer(cls, buffer: Any) -> "PlusCodeArray":
+        """Copy packed integer keys from a buffer of native uint64 values, e.g.,
+        a numpy uint64 array. No explicit validation checks are performed on
+        the keys.
+
+        Raises:
+            ValueError: If the buffer does not hold unsigned 64-bit integers.
+        """
+        view = memoryview(buffer)
+        keys = array(_TYPECODE)
+        if view.itemsize != keys.itemsize or view.format.lstrip("@=") not in ("Q", "L"):
+            raise ValueError(f"Expected a buffer of uint64 values: {view.format=}")
+        keys.frombytes(view.cast("B"))
+        return cls._wrap(keys)
+
+    @classmethod
+    def encode(
+        cls, lats: Iterable[float], lons: Iterable[float], code_length: int = 10
+    ) -> "PlusCodeArray":
+        """
+        Encode many locations into an array of codes of the input length.
+
+        Uses vectorized.encode_int when numpy is installed, and
+        Encoder.encode_int otherwise.
+        """
+        try:
+            encoder = Encoders[code_length]
+        except KeyError:
+            raise ValueError(f"Invalid code length: {code_length=}")
+        try:
+            from . import vectorized
+        except ImportError:
+            encode_int = encoder.encode_int
+            return cls.from_keys(
+                [encode_int(a, b) for a, b in zip(lats, lons, strict=True)]
+            )
+        # numpy treats iterators as scalar objects, so materialize them.
+        if not hasattr(lats, "__len__"):
+            lats = list(lats)
+        if not hasattr(lons, "__len__"):
+            lons = list(lons)
+        return cls.frombuffer(vectorized.encode_int(lats, lons, code_length))
+
+    @property
+    def keys(self) -> array:
+        """The underlying array('Q') of packed integer keys."""
+        return self._keys
+
+    def __buffer__(self, flags: int) -> memoryview:
+        return memoryview(self._keys)
+
+    def codes(self) -> list[str]:
+        """The codes as a list of strings."""
+        return list(map(packed.from_int, self._keys))
+
+    def bounds(self) -> array:
+        """
+        Decode every code into its bounds without parsing code strings.
+
+        Returns:
+            An array('d') of consecutive (sw_lat, sw_lon, ne_lat, ne_lon) rows,
+            with the same values as Decoder.decode_bounds.
+
+        Uses vectorized.decode_int when numpy is installed.
+        """
+        out = array("d")
+        try:
+            from . import vectorized
+        except ImportError:
+            pass
+        else:
+            if self._keys:
+                out.frombytes(vectorized.decode_int(self._keys).tobytes())
+            return out
+
+        from .decoder import round_bounds
+
+        extend = out.extend
+        to_cell = packed.to_cell
+        for key in self._keys:
+            lat, lon, code_length = to_cell(key)
+            encoder = Encoders[code_length]
+            corner = encoder._corner(lat * encoder._lat_div, lon * encoder._lon_div)
+            extend(round_bounds(*corner, encoder._lat_size, encoder._lon_size))
+        return out
+
+    def areas(self) -> list[AreaView]:
+        """Decode every code into an AreaView over one shared bounds buffer."""
+        return AreaView.rows(as_doubles(self.bounds()))
+
+    def sort(self):
+        """Sort the codes in place, in code string order."""
+        self._keys = array(_TYPECODE, sorted(self._keys))
+
+    def unique(self) -> "PlusCodeArray":
+        """The sorted, distinct codes."""
+        return self._wrap(array(_TYPECODE, sorted(set(self._keys))))
+
+    def searchsorted(self, code: str | int, side: str = "left") -> int:
+        """
+        Find the index at which a code would be inserted into this sorted
+        array to keep it sorted, as with bisect and numpy.searchsorted.
+
+        Args:
+            code: A full Plus Code or its packed integer key.
+            side: "left" for the first suitable index, "right" for the last.
+        """
+        key = packed.to_int(code) if isinstance(code, str) else code
+        if side == "left":
+            return bisect_left(self._keys, key)
+        if side == "right":
+            return bisect_right(self._keys, key)
+        raise ValueError(f"side must be 'left' or 'right': {side=}")
+
+    def within(self, code: str) -> "PlusCodeArray":
+        """The codes of this sorted array that are the input code or one of
+        its descendants.
+        """
+        key = packed.to_int(code)
+        size = packed.subtree_size(packed.to_cell(key)[2])
+        keys = self._keys
+        return self._wrap(keys[bisect_left(keys, key) : bisect_left(keys, key + size)])
+
+    def truncate(self, code_length: int) -> "PlusCodeArray":
+        """
+        The ancestor of each code with the input length.
+
+        Raises:
+            ValueError: If a code is shorter than the input length.
+        """
+        truncate = packed.truncate
+        return self._wrap(
+            array(_TYPECODE, [truncate(key, code_length) for key in self._keys])
+        )
+
+    def groupby(self, code_length: int) -> dict[str, "PlusCodeArray"]:
+        """
+        Group the codes by their ancestor with the input length.
+
+        Returns:
+            A dict mapping each ancestor code to the array of its descendants,
+            in order of first appearance.
+
+        Raises:
+            ValueError: If a code is shorter than the input length.
+        """
+        truncate = packed.truncate
+        groups: dict[int, array] = {}
+        for key in self._keys:
+            prefix = truncate(key, code_length)
+            try:
+                groups[prefix].append(key)
+            except KeyError:
+                groups[prefix] = array(_TYPECODE, (key,))
+        return {
+            packed.from_int(prefix): self._wrap(keys) for prefix, keys in groups.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __iter__(self) -> Iterator[str]:
+        return map(packed.from_int, self._keys)
+
+    @overload
+    def __getitem__(self, index: int) -> str:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "PlusCodeArray":
+        ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._wrap(self._keys[index])
+        return packed.from_int(self._keys[index])
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PlusCodeArray):
+            return self._keys == other._keys
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        if len(self) > 6:
+            head = ", ".join(map(repr, self[:3]))
+            tail = ", ".join(map(repr, self[-3:]))
+            return f"PlusCodeArray([{head}, ..., {tail}])"
+        return f"PlusCodeArray({self.codes()!r})"
@@ -0,0 +1,256 @@
+"""
+A fixed-width binary file format for code columns, read through mmap.
+
+Layout, all little-endian:
+
+    offset  size     field
+    0       8        magic b"PLUSCODE"
+    8       2        version, currently 1
+    10      2        flags, bit 0 set when bounds are present
+    12      4        reserved, zero
+    16      8        count, the number of codes
+    24      8        reserved, zero
+    32      8*count  packed uint64 keys (see packed)
+    ...     32*count optional float64 (sw_lat, sw_lon, ne_lat, ne_lon) rows
+
+Both sections are 8-byte aligned, so a CodeFile can cast the mapped pages
+directly into key and bounds memoryviews. Nothing is parsed or decoded on
+open, and processes mapping the same file share its pages.
+
+    codefile.write("reference.plc", codes)
+    with CodeFile("reference.plc") as ref:
+        code, area = ref[123], ref.area(123)
+"""
+import mmap
+import os
+import shutil
+import stat
+import struct
+import sys
+import tempfile
+from bisect import bisect_left, bisect_right
+from itertools import islice
+from typing import Iterable, Iterator
+
+from . import packed
+from .codearray import PlusCodeArray
+from .geo import AreaView
+
+MAGIC = b"PLUSCODE"
+VERSION = 1
+HAS_BOUNDS = 0x1
+
+_HEADER = struct.Struct("<8sHHIQQ")
+_KEY_SIZE = 8
+_BOUNDS_SIZE = 32
+
+
+class ByteOrderError(OSError):
+    """Code files cannot be read or written on a big-endian host."""
+
+
+def _check_byteorder():
+    if sys.byteorder != "little":
+        raise ByteOrderError("Code files require a little-endian host.")
+
+
+def _file_mode(path: str | os.PathLike) -> int:
+    """The mode of an existing file at path, or of a new file under the
+    current umask.
+    """
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def write(
+    path: str | os.PathLike,
+    codes: PlusCodeArray | Iterable[str],
+    *,
+    bounds: bool = True,
+    chunk_size: int = 65_536,
+) -> int:
+    """
+    Write codes, and optionally their bounds, to a code file.
+
+    Code strings are packed and decoded chunk_size at a time, and bounds are
+    staged in a temporary file, so memory use does not grow with the input.
+    The file is written next to path and renamed into place once complete,
+    so a failure, e.g., an invalid code, leaves any existing file untouched.
+    The file keeps the mode of the file it replaces, and is otherwise created
+    under the umask.
+
+    Args:
+        path: The output path.
+        codes: A PlusCodeArray, or full Plus Codes of any valid length.
+        bounds: Whether to store the decoded bounds of each code.
+
+    Returns:
+        The number of codes written.
+    """
+    _check_byteorder()
+    if isinstance(codes, PlusCodeArray):
+        chunks = iter([codes])
+    else:
+        codes = iter(codes)
+        chunks = iter(lambda: PlusCodeArray(islice(codes, chunk_size)), PlusCodeArray())
+
+    count = 0
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, partial = tempfile.mkstemp(dir=directory, suffix=".partial")
+    try:
+        # mkstemp creates the file readable by its owner only.
+        os.fchmod(fd, _file_mode(path))
+        with open(fd, "wb") as f, tempfile.TemporaryFile() as staged:
+            f.write(_HEADER.pack(MAGIC, VERSION, 0, 0, 0, 0))
+            for chunk in chunks:
+                chunk.keys.tofile(f)
+                if bounds:
+                    chunk.bounds().tofile(staged)
+                count += len(chunk)
+            if bounds:
+                staged.seek(0)
+                shutil.copyfileobj(staged, f)
+            f.seek(0)
+            flags = HAS_BOUNDS if bounds else 0
+            f.write(_HEADER.pack(MAGIC, VERSION, flags, 0, count, 0))
+        os.replace(partial, path)
+    except BaseException:
+        os.unlink(partial)
+        raise
+    return count
+
+
+class CodeFile:
+    """
+    A read-only, memory-mapped code file.
+
+    Indexing returns code strings, iteration yields them in order, and
+    slicing returns a CodeFile over the same mapping without copying.
+
+    Args:
+        path: The path of a file written by write.
+
+    Raises:
+        ValueError: If the file is not a valid code file.
+    """
+
+    __slots__ = ("_mmap", "_keys", "_bounds", "_rows")
+
+    def __init__(self, path: str | os.PathLike):
+        _check_byteorder()
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < _HEADER.size:
+                raise ValueError(f"Not a code file: {path=}")
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, version, flags, _, count, _ = _HEADER.unpack_from(self._mmap)
+            if magic != MAGIC:
+                raise ValueError(f"Not a code file: {path=}")
+            if version != VERSION:
+                raise ValueError(f"Unsupported code file version: {version=}")
+            has_bounds = bool(flags & HAS_BOUNDS)
+            end = _HEADER.size + count * (_KEY_SIZE + has_bounds * _BOUNDS_SIZE)
+            if size != end:
+                raise ValueError(f"Truncated or oversized code file: {path=}")
+        except BaseException:
+            self._mmap.close()
+            raise
+
+        view = memoryview(self._mmap)
+        start = _HEADER.size + count * _KEY_SIZE
+        self._keys = view[_HEADER.size : start].cast("Q")
+        self._bounds = view[start:].cast("d") if has_bounds else None
+        self._rows = range(count)
+
+    def _view(self, rows: range) -> "CodeFile":
+        obj = type(self).__new__(type(self))
+        obj._mmap, obj._keys, obj._bounds = self._mmap, self._keys, self._bounds
+        obj._rows = rows
+        return obj
+
+    @property
+    def has_bounds(self) -> bool:
+        """Whether the file stores the bounds of each code."""
+        return self._bounds is not None
+
+    @property
+    def keys(self) -> memoryview:
+        """A zero-copy memoryview of the packed keys of these rows."""
+        rows = self._rows
+        stop = rows.stop if rows.stop >= 0 else None
+        return self._keys[rows.start : stop : rows.step]
+
+    def key(self, index: int) -> int:
+        """The packed key of the code at the index."""
+        return self._keys[self._rows[index]]
+
+    def bounds(self, index: int) -> tuple[float, float, float, float]:
+        """The (sw_lat, sw_lon, ne_lat, ne_lon) bounds of the code at the index,
+        read from the file if stored and decoded otherwise.
+        """
+        row = self._rows[index]
+        if self._bounds is None:
+            return tuple(PlusCodeArray.from_keys([self._keys[row]]).bounds())
+        return tuple(self._bounds[4 * row : 4 * row + 4])
+
+    def area(self, index: int) -> AreaView:
+        """
+        The area of the code at the index, viewing the mapped bounds.
+
+        Raises:
+            ValueError: If the file does not store bounds.
+        """
+        if self._bounds is None:
+            raise ValueError("The code file does not store bounds.")
+        return AreaView(self._bounds, self._rows[index])
+
+    def to_array(self) -> PlusCodeArray:
+        """Copy the keys of these rows into a PlusCodeArray."""
+        return PlusCodeArray.frombuffer(self.keys)
+
+    def searchsorted(self, code: str | int, side: str = "left") -> int:
+        """
+        Find the index at which a code would be inserted to keep the rows
+        sorted, as with PlusCodeArray.searchsorted. The rows must be sorted.
+        """
+        key = packed.to_int(code) if isinstance(code, str) else code
+        if side == "left":
+            return bisect_left(self.keys, key)
+        if side == "right":
+            return bisect_right(self.keys, key)
+        raise ValueError(f"side must be 'left' or 'right': {side=}")
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __iter__(self) -> Iterator[str]:
+        return map(packed.from_int, self.keys)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._view(self._rows[index])
+        return packed.from_int(self._keys[self._rows[index]])
+
+    def close(self):
+        """Release the mapping, which slices of this file share. Views handed
+        out by keys and area must be released first.
+        """
+        self._keys.release()
+        if self._bounds is not None:
+            self._bounds.release()
+        self._mmap.close()
+
+    def __enter__(self) -> "CodeFile":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"CodeFile(rows={len(self)}, has_bounds={self.has_bounds})"
@@ -0,0 +1,290 @@
+"""
+Approximate regions with small sets of codes of mixed lengths.
+
+A covering is a set of codes whose union contains the region, and an
+interior covering a set of codes contained in the region. Both are built
+top down, in the style of S2's RegionCoverer: cells at min_length that
+intersect the region are refined, coarsest first, into their intersecting
+children while the number of cells stays within max_cells. Cells that are
+fully inside the region, or already at max_length, are never refined.
+
+Regions are either boxes, given as an Area or AreaView, or simple polygons,
+given as a sequence of (lat, lon) vertices. Boxes are classified exactly in
+the integer units of the encoder; polygons with floating point geometry.
+Neither may cross the antimeridian.
+"""
+import heapq
+from typing import Iterable, Sequence
+
+from .base import Base
+from .encoder import Encoders
+from .geo import Area, AreaView
+from .packed import LENGTHS
+
+# Classification of a cell against a region.
+DISJOINT, INTERSECTS, CONTAINED = 0, 1, 2
+
+_LAT_UNITS = int(2 * Base.MAX_LAT * Base.FINAL_LAT_PRECISION)
+_LON_UNITS = int(2 * Base.MAX_LON * Base.FINAL_LON_PRECISION)
+
+# The next length of each code length, and the number of (lat, lon) children
+# of each cell at that length.
+_NEXT = dict(zip(LENGTHS, LENGTHS[1:]))
+_SPLIT = {
+    length: (
+        (Base.ENCODING_BASE, Base.ENCODING_BASE)
+        if length < Base.PAIR_CODE_LENGTH
+        else (Base.GRID_ROWS, Base.GRID_COLUMNS)
+    )
+    for length in _NEXT
+}
+
+
+def _units(value: float, offset: int, precision: float, limit: int) -> int:
+    """A coordinate in the finest integer units, as computed by Encoder.encode,
+    clamped to [0, limit].
+    """
+    return min(max(int(round((value + offset) * precision, 6)), 0), limit)
+
+
+class _Box:
+    """A latitude and longitude box, in the finest integer units."""
+
+    def __init__(self, sw_lat: float, sw_lon: float, ne_lat: float, ne_lon: float):
+        if sw_lat > ne_lat or sw_lon > ne_lon:
+            raise ValueError("Boxes must have sw <= ne and not cross the antimeridian.")
+        fnl_lat, fnl_lon = Base.FINAL_LAT_PRECISION, Base.FINAL_LON_PRECISION
+        self.lat0 = _units(sw_lat, Base.MAX_LAT, fnl_lat, _LAT_UNITS - 1)
+        self.lon0 = _units(sw_lon, Base.MAX_LON, fnl_lon, _LON_UNITS - 1)
+        # The north and east edges are exclusive, but a degenerate box still
+        # covers the cell of its corner.
+        self.lat1 = max(
+            _units(ne_lat, Base.MAX_LAT, fnl_lat, _LAT_UNITS), self.lat0 + 1
+        )
+        self.lon1 = max(
+            _units(ne_lon, Base.MAX_LON, fnl_lon, _LON_UNITS), self.lon0 + 1
+        )
+
+    def cell_range(self, code_length: int) -> tuple[int, int, int, int]:
+        """The (south, north, west, east) inclusive cell range of the box."""
+        encoder = Encoders[code_length]
+        lat_div, lon_div = encoder._lat_div, encoder._lon_div
+        return (
+            self.lat0 // lat_div,
+            (self.lat1 - 1) // lat_div,
+            self.lon0 // lon_div,
+            (self.lon1 - 1) // lon_div,
+        )
+
+    def classify(self, lat: int, lon: int, code_length: int) -> int:
+        """Classify a cell within the cell range of the box."""
+        encoder = Encoders[code_length]
+        lat_div, lon_div = encoder._lat_div, encoder._lon_div
+        if (
+            self.lat0 <= lat * lat_div
+            and (lat + 1) * lat_div <= self.lat1
+            and self.lon0 <= lon * lon_div
+            and (lon + 1) * lon_div <= self.lon1
+        ):
+            return CONTAINED
+        return INTERSECTS
+
+
+class _Polygon:
+    """A simple polygon with (lat, lon) vertices."""
+
+    def __init__(self, vertices: Sequence[tuple[float, float]]):
+        self.vertices = [(float(lat), float(lon)) for lat, lon in vertices]
+        if len(self.vertices) < 3:
+            raise ValueError("Polygons need at least 3 vertices.")
+        self.edges = list(zip(self.vertices, self.vertices[1:] + self.vertices[:1]))
+        lats, lons = zip(*self.vertices)
+        self.bbox = _Box(min(lats), min(lons), max(lats), max(lons))
+
+    def cell_range(self, code_length: int) -> tuple[int, int, int, int]:
+        return self.bbox.cell_range(code_length)
+
+    def contains_point(self, lat: float, lon: float) -> bool:
+        """Even-odd ray casting towards the east."""
+        inside = False
+        for (lat_a, lon_a), (lat_b, lon_b) in self.edges:
+            if (lat_a > lat) != (lat_b > lat):
+                cross = lon_a + (lat - lat_a) * (lon_b - lon_a) / (lat_b - lat_a)
+                if lon < cross:
+                    inside = not inside
+        return inside
+
+    def classify(self, lat: int, lon: int, code_length: int) -> int:
+        encoder = Encoders[code_length]
+        south = lat * encoder._lat_size - Base.MAX_LAT
+        west = lon * encoder._lon_size - Base.MAX_LON
+        north, east = south + encoder._lat_size, west + encoder._lon_size
+
+        corners = [(south, west), (south, east), (north, west), (north, east)]
+        inside = sum(self.contains_point(*corner) for corner in corners)
+        crossing = any(_crosses(a, b, south, west, north, east) for a, b in self.edges)
+        if inside == 4 and not crossing:
+            return CONTAINED
+        if inside or crossing:
+            return INTERSECTS
+        # No corner is inside and no edge passes through the cell, so the
+        # polygon is either disjoint from it or entirely within it.
+        lat_v, lon_v = self.vertices[0]
+        if south <= lat_v <= north and west <= lon_v <= east:
+            return INTERSECTS
+        return DISJOINT
+
+
+def _crosses(
+    a: tuple[float, float],
+    b: tuple[float, float],
+    south: float,
+    west: float,
+    north: float,
+    east: float,
+) -> bool:
+    """Whether the segment from a to b passes through the interior of the box,
+    by Liang-Barsky clipping.
+    """
+    (lat_a, lon_a), (lat_b, lon_b) = a, b
+    d_lat, d_lon = lat_b - lat_a, lon_b - lon_a
+    t0, t1 = 0.0, 1.0
+    for p, q in (
+        (-d_lon, lon_a - west),
+        (d_lon, east - lon_a),
+        (-d_lat, lat_a - south),
+        (d_lat, north - lat_a),
+    ):
+        if p == 0:
+            if q <= 0:
+                return False
+        else:
+            t = q / p
+            if p < 0:
+                t0 = max(t0, t)
+            else:
+                t1 = min(t1, t)
+            if t0 >= t1:
+                return False
+    # The clipped segment has positive length; it is in the interior unless
+    # it runs along the boundary.
+    mid = (t0 + t1) / 2
+    lat_m, lon_m = lat_a + mid * d_lat, lon_a + mid * d_lon
+    return south < lat_m < north and west < lon_m < east
+
+
+def _region(region) -> _Box | _Polygon:
+    if isinstance(region, (Area, AreaView)):
+        return _Box(region.sw.lat, region.sw.lon, region.ne.lat, region.ne.lon)
+    return _Polygon(region)
+
+
+def _cells(
+    region: _Box | _Polygon, code_length: int, parent: tuple[int, int, int] | None
+) -> Iterable[tuple[int, int, int, int]]:
+    """The (lat, lon, code_length, classification) of the cells of the input
+    length that intersect the region, within the parent cell if given.
+    """
+    south, north, west, east = region.cell_range(code_length)
+    if parent is not None:
+        lat, lon, length = parent
+        rows, cols = _SPLIT[length]
+        south, north = max(south, lat * rows), min(north, lat * rows + rows - 1)
+        west, east = max(west, lon * cols), min(east, lon * cols + cols - 1)
+    for lat in range(south, north + 1):
+        for lon in range(west, east + 1):
+            kind = region.classify(lat, lon, code_length)
+            if kind != DISJOINT:
+                yield lat, lon, code_length, kind
+
+
+def _cover(
+    region, max_cells: int, min_length: int, max_length: int, interior: bool
+) -> list[str]:
+    for length in (min_length, max_length):
+        if length not in Encoders:
+            raise ValueError(f"Invalid code length: {length=}")
+    if min_length > max_length:
+        raise ValueError(f"{min_length=} exceeds {max_length=}")
+    if max_cells < 1:
+        raise ValueError(f"max_cells must be positive: {max_cells=}")
+    region = _region(region)
+
+    result = []
+    # Candidates, coarsest first and otherwise in insertion order.
+    queue: list[tuple[int, int, int, int]] = []
+    counter = 0
+
+    def add(lat: int, lon: int, code_length: int, kind: int):
+        nonlocal counter
+        if kind == CONTAINED or code_length == max_length:
+            if kind == CONTAINED or not interior:
+                result.append((lat, lon, code_length))
+        else:
+            heapq.heappush(queue, (code_length, counter, lat, lon))
+            counter += 1
+
+    for cell in _cells(region, min_length, None):
+        add(*cell)
+
+    while queue:
+        code_length, _, lat, lon = heapq.heappop(queue)
+        child_length = _NEXT[code_length]
+        children = list(_cells(region, child_length, (lat, lon, code_length)))
+        if interior and child_length == max_length:
+            # Children that only intersect the region would be dropped.
+            children = [child for child in children if child[3] == CONTAINED]
+        budget = len(result) + len(queue) + len(children)
+        if budget > max_cells:
+            # Refining would exceed the budget, so keep the cell as is.
+            if not interior:
+                result.append((lat, lon, code_length))
+            continue
+        for child in children:
+            add(*child)
+
+    codes = []
+    for lat, lon, code_length in result:
+        encoder = Encoders[code_length]
+        codes.append(encoder._code(lat * encoder._lat_div, lon * encoder._lon_div))
+    # Code strings sort in the same order as their packed keys.
+    codes.sort()
+    return codes
+
+
+def cover(
+    region: Area | AreaView | Sequence[tuple[float, float]],
+    max_cells: int = 8,
+    min_length: int = 2,
+    max_length: int = 10,
+) -> list[str]:
+    """
+    A small set of codes, of lengths min_length through max_length, whose
+    union contains the region.
+
+    Args:
+        region: A box as an Area or AreaView, or a simple polygon as a
+            sequence of (lat, lon) vertices.
+        max_cells: The number of codes to aim for. More are returned when
+            the cells at min_length that intersect the region already exceed
+            it.
+        min_length: The minimum code length.
+        max_length: The maximum code length.
+
+    Returns:
+        The codes, sorted.
+    """
+    return _cover(region, max_cells, min_length, max_length, interior=False)
+
+
+def interior_cover(
+    region: Area | AreaView | Sequence[tuple[float, float]],
+    max_cells: int = 8,
+    min_length: int = 2,
+    max_length: int = 10,
+) -> list[str]:
+    """
+    A small set of codes, of lengths min_length through max_length, that are
+    each contained in the region. See cover for the arguments.
+    """
+    return _cover(region, max_cells, min_length, max_length, interior=True)
@@ -1,8 +1,45 @@
-import re
-
 from .base import Base
 from .geo import Area, Point
 
+# Removes separator and padding characters and converts to upper case in a
+# single pass.
+_STRIP = str.maketrans(
+    {
+        Base.SEP: None,
+        Base.PADDING_CHAR: None,
+        **{c.lower(): c for c in Base.ALPHABET if c.isalpha()},
+    }
+)
+
+# Latitude and longitude digit values of each character pair.
+_PAIR_DIGITS = {
+    pair: divmod(i, Base.ENCODING_BASE) for i, pair in enumerate(Base.PAIRS)
+}
+
+# Row and column values of each grid character.
+_GRID_DIGITS = {c: divmod(i, Base.GRID_COLUMNS) for i, c in enumerate(Base.ALPHABET)}
+
+# Place values of each pair of digits, most significant first.
+_PAIR_PLACE_VALUES = [
+    Base.ENCODING_BASE**k for k in range(Base.PAIR_CODE_LENGTH // 2 - 1, -1, -1)
+]
+
+
+def round_bounds(
+    lat: float, lng: float, latPrecision: float, lngPrecision: float
+) -> tuple[float, float, float, float]:
+    """The (sw_lat, sw_lon, ne_lat, ne_lon) bounds of the area with the input
+    southwest corner and dimensions.
+    """
+    # Round to 14 decimal places. This reduces errors due to floating point
+    # precision.
+    return (
+        round(lat, 14),
+        round(lng, 14),
+        round(lat + latPrecision, 14),
+        round(lng + lngPrecision, 14),
+    )
+
 
 class Decoder(Base):
     """
@@ -16,11 +53,30 @@ class Decoder(Base):
       corners of the area, the center, and the length of the original code.
     """
 
+    # An optional DecodeCache consulted by decode, installed by cache.enable.
+    cache = None
+
     def decode(self, code: str) -> Area:
         """Decode a valid, full Plus Code.
 
         No explicit validation
         """
+        cache = self.cache
+        if cache is not None:
+            return cache.lookup(code, self._decode)
+        return self._decode(code)
+
+    def _decode(self, code: str) -> Area:
+        sw_lat, sw_lon, ne_lat, ne_lon = self._bounds(code)
+        return Area(Point(sw_lat, sw_lon), Point(ne_lat, ne_lon))
+
+    def decode_bounds(self, code: str) -> tuple[float, float, float, float]:
+        """Decode a valid, full Plus Code into its bounds without allocating
+        Point and Area instances.
+
+        Returns:
+            A (sw_lat, sw_lon, ne_lat, ne_lon) tuple.
+        """
         # if not is_full(code):
         #     raise ValueError(
         #         'Passed Open Location Code is not a valid full code - ' + str(code))
@@ -28,9 +84,7 @@ class Decoder(Base):
         # Strip out separator character (we've already established the code is
         # valid so the maximum is one), and padding characters. Convert to upper
         # case and constrain to the maximum number of digits.
-        code = re.sub("[+0]", "", code)
-        code = code.upper()
-        code = code[: self.MAX_CODE_LENGTH]
+        code = code.translate(_STRIP)[: self.MAX_CODE_LENGTH]
 
         # Initialise the values for each section. We work them out as integers and
         # convert them to floats at the end.
@@ -40,53 +94,60 @@ class Decoder(Base):
         gridLng = 0
         # How many digits do we have to process?
         digits = min(len(code), self.PAIR_CODE_LENGTH)
-        # Define the place value for the most significant pair.
-        pv = self.PAIR_FIRST_PLACE_VALUE
 
-        # Decode the paired digits.
-        for i in range(0, digits, 2):
-            normalLat += self._char_index(code[i]) * pv
-            normalLng += self._char_index(code[i + 1]) * pv
-            if i < digits - 2:
-                pv //= self.ENCODING_BASE
+        # Decode the paired digits, keeping the place value of the last pair.
+        pv = _PAIR_PLACE_VALUES[0]
+        for i, pv in zip(range(0, digits, 2), _PAIR_PLACE_VALUES):
+            lat_digit, lon_digit = _PAIR_DIGITS[code[i : i + 2]]
+            normalLat += lat_digit * pv
+            normalLng += lon_digit * pv
 
         # Convert the place value to a float in degrees.
         fnl_lat_prec = self.FINAL_LAT_PRECISION
         fnl_lon_prec = self.FINAL_LON_PRECISION
-        latPrecision = float(pv) / self.PAIR_PRECISION
-        lngPrecision = float(pv) / self.PAIR_PRECISION
+        latPrecision = lngPrecision = pv / self.PAIR_PRECISION
         # Process any extra precision digits.
         if len(code) > self.PAIR_CODE_LENGTH:
             # Initialise the place values for the grid.
             rowpv = self.GRID_LAT_FIRST_PLACE_VALUE
             colpv = self.GRID_LON_FIRST_PLACE_VALUE
-            # How many digits do we have to process?
-            digits = min(len(code), self.MAX_CODE_LENGTH)
-            for i in range(self.PAIR_CODE_LENGTH, digits):
-                digitVal = self._char_index(code[i])
-                row = digitVal // self.GRID_COLUMNS
-                col = digitVal % self.GRID_COLUMNS
+            for char in code[self.PAIR_CODE_LENGTH : -1]:
+                row, col = _GRID_DIGITS[char]
                 gridLat += row * rowpv
                 gridLng += col * colpv
-                if i < digits - 1:
-                    rowpv //= self.GRID_ROWS
-                    colpv //= self.GRID_COLUMNS
+                rowpv //= self.GRID_ROWS
+                colpv //= self.GRID_COLUMNS
+            row, col = _GRID_DIGITS[code[-1]]
+            gridLat += row * rowpv
+            gridLng += col * colpv
 
             # Adjust the precisions from the integer values to degrees.
-            latPrecision = float(rowpv) / fnl_lat_prec
-            lngPrecision = float(colpv) / fnl_lon_prec
+            latPrecision = rowpv / fnl_lat_prec
+            lngPrecision = colpv / fnl_lon_prec
 
         # Merge the values from the normal and extra precision parts of the code.
-        lat = float(normalLat) / self.PAIR_PRECISION + float(gridLat) / fnl_lat_prec
-        lng = float(normalLng) / self.PAIR_PRECISION + float(gridLng) / fnl_lon_prec
+        lat = normalLat / self.PAIR_PRECISION + gridLat / fnl_lat_prec
+        lng = normalLng / self.PAIR_PRECISION + gridLng / fnl_lon_prec
+
+        return round_bounds(lat, lng, latPrecision, lngPrecision)
+
+    # Called by decode and decode_center, so that each call is recorded once
+    # by the instrument module, which only wraps the public method.
+    _bounds = decode_bounds
+
+    def decode_center(self, code: str) -> tuple[float, float]:
+        """Decode a valid, full Plus Code into the (lat, lon) of its center,
+        as computed by Area.center, without allocating Point and Area instances.
+        """
+        sw_lat, sw_lon, ne_lat, ne_lon = self._bounds(code)
+        return (
+            round(min((sw_lat + ne_lat) / 2, self.MAX_LAT), 14),
+            round(min((sw_lon + ne_lon) / 2, self.MAX_LON), 14),
+        )
 
-        # Multiple values by 1e14, round and then divide. This reduces errors due
-        # to floating point precision.
 
-        sw = Point(lat=round(lat, 14), lon=round(lng, 14))
-        ne = Point(lat=round(lat + latPrecision, 14), lon=round(lng + lngPrecision, 14))
-        area = Area(sw=sw, ne=ne)
-        return area
+# Shared by the module level functions, since decoders are stateless.
+_decoder = Decoder()
 
 
 def decode(code: str) -> Area:
@@ -94,4 +155,21 @@ def decode(code: str) -> Area:
 
     No explicit validation checks are performed.
     """
-    return Decoder().decode(code)
+    return _decoder.decode(code)
+
+
+def decode_bounds(code: str) -> tuple[float, float, float, float]:
+    """Decode a valid, full Plus Code into a (sw_lat, sw_lon, ne_lat, ne_lon)
+    tuple.
+
+    No explicit validation checks are performed.
+    """
+    return _decoder.decode_bounds(code)
+
+
+def decode_center(code: str) -> tuple[float, float]:
+    """Decode a valid, full Plus Code into the (lat, lon) of its center.
+
+    No explicit validation checks are performed.
+    """
+    return _decoder.decode_center(code)
@@ -1,7 +1,16 @@
 import math
+from collections.abc import Iterable
 
 from .base import Base
 
+# The area and integer key methods import the geo, decoder and packed modules
+# when called, since they cost far more to import than this module, e.g., for
+# `from pluscodes import encode`. Type checkers treat any TYPE_CHECKING as
+# true, without importing typing.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .geo import Area
+
 
 class Encoder(Base):
     """
@@ -30,6 +39,60 @@ class Encoder(Base):
         else:
             self._lat_precision = pow(20, -3) / pow(self.GRID_ROWS, code_length - 10)
 
+        # Digits beyond the code length are discarded, so their divisions are
+        # folded into a single one up front.
+        base = self.ENCODING_BASE
+        self._n_grid = max(code_length - self.PAIR_CODE_LENGTH, 0)
+        self._n_pairs = min(code_length, self.PAIR_CODE_LENGTH) // 2
+        skipped_grid = self.GRID_CODE_LENGTH - self._n_grid
+        skipped_pairs = self.PAIR_CODE_LENGTH // 2 - self._n_pairs
+        self._lat_div = self.GRID_ROWS**skipped_grid * base**skipped_pairs
+        self._lon_div = self.GRID_COLUMNS**skipped_grid * base**skipped_pairs
+
+        # Divisors of the remaining value that isolate each grid digit and each
+        # pair of digits, most significant first.
+        rows, cols = self.GRID_ROWS, self.GRID_COLUMNS
+        self._grid_divs = [
+            (rows**k, cols**k) for k in range(self._n_grid - 1, -1, -1)
+        ]
+        self._grid_lat_div = rows**self._n_grid
+        self._grid_lon_div = cols**self._n_grid
+        self._pair_divs = [base**k for k in range(self._n_pairs - 1, -1, -1)]
+        # Place values of the last pair and grid digits, and the dimensions of
+        # the code area in degrees, as computed by the decoder.
+        self._pair_mod = base ** (self.PAIR_CODE_LENGTH // 2)
+        self._pair_place = base**skipped_pairs
+        self._row_place = rows**skipped_grid
+        self._col_place = cols**skipped_grid
+        if self._n_grid:
+            self._lat_size = self._row_place / self.FINAL_LAT_PRECISION
+            self._lon_size = self._col_place / self.FINAL_LON_PRECISION
+        else:
+            self._lat_size = self._lon_size = self._pair_place / self.PAIR_PRECISION
+
+        self._padding = ""
+        if code_length < self.SEP_POSITION:
+            self._padding = self.PADDING_CHAR * (self.SEP_POSITION - code_length)
+            self._padding += self.SEP
+
+        # Output layout used by the vectorized encoder: digits, padding and the
+        # separator. Digit i lives at position i, or i + 1 once past the
+        # separator. Slots are listed from the least significant digit up.
+        pos = self.SEP_POSITION
+        template = list(self.ALPHABET[0] * code_length)
+        if code_length < pos:
+            template += [self.PADDING_CHAR] * (pos - code_length)
+        template.insert(pos, self.SEP)
+        self._template = template
+        self._grid_slots = [
+            i + (i >= pos)
+            for i in range(code_length - 1, code_length - self._n_grid - 1, -1)
+        ]
+        self._pair_slots = [
+            (i + (i >= pos), i + 1 + (i + 1 >= pos))
+            for i in range(2 * self._n_pairs - 2, -1, -2)
+        ]
+
     def encode(self, latitude: float, longitude: float) -> str:
         """
         Encode a location into an Plus Code.
@@ -48,9 +111,48 @@ class Encoder(Base):
           code_length: The number of significant digits in the output code, not
               including any separator characters.
         """
-        # TODO: Is there a way to easily compute the boundary while encoding
-        # instead of performing a code / decode op?
+        return self._code(*self._scale(latitude, longitude))
+
+    def encode_with_area(self, latitude: float, longitude: float) -> tuple[str, "Area"]:
+        """
+        Encode a location into a Plus Code along with the code's area.
 
+        Equivalent to ``(code, decode(code))`` where
+        ``code = self.encode(latitude, longitude)``, but the boundary is derived
+        from the integer values computed while encoding instead of parsing the
+        code again.
+        """
+        from .geo import Area, Point
+
+        latVal, lngVal = self._scale(latitude, longitude)
+        sw_lat, sw_lon, ne_lat, ne_lon = self._bounds(latVal, lngVal)
+        area = Area(Point(sw_lat, sw_lon), Point(ne_lat, ne_lon))
+        return self._code(latVal, lngVal), area
+
+    def encode_many_with_area(
+        self, lats: Iterable[float], lons: Iterable[float]
+    ) -> list[tuple[str, "Area"]]:
+        """Encode many locations into (code, area) pairs. See encode_with_area
+        and encode_many.
+        """
+        from .decoder import round_bounds
+        from .geo import Area, Point
+
+        scale, code, corner = self._scale, self._code, self._corner
+        lat_size, lon_size = self._lat_size, self._lon_size
+        results = []
+        append = results.append
+        for latitude, longitude in zip(lats, lons, strict=True):
+            latVal, lngVal = scale(latitude, longitude)
+            lat, lng = corner(latVal, lngVal)
+            sw_lat, sw_lon, ne_lat, ne_lon = round_bounds(lat, lng, lat_size, lon_size)
+            sw = Point(sw_lat, sw_lon)
+            ne = Point(ne_lat, ne_lon)
+            append((code(latVal, lngVal), Area(sw, ne)))
+        return results
+
+    def _scale(self, latitude: float, longitude: float) -> tuple[int, int]:
+        """Convert a location to integers in units of the finest precision."""
         # Latitude 90 needs to be adjusted to be just less, so the returned code
         # can also be decoded.
         if latitude == 90:
@@ -61,12 +163,6 @@ class Encoder(Base):
         if longitude == 180:
             longitude = -180
 
-        code = ""
-
-        # TODO: Populate an array instead of a collection of string ops.
-        # chars = []
-
-        # Compute the code.
         # This approach converts each value to an integer after multiplying it by
         # the final precision. This allows us to use only integer operations, so
         # avoiding any accumulation of floating point representation errors.
@@ -76,44 +172,173 @@ class Encoder(Base):
         # Note: Python requires rounding before truncating to ensure precision!
         latVal = int(round((latitude + self.MAX_LAT) * self.FINAL_LAT_PRECISION, 6))
         lngVal = int(round((longitude + self.MAX_LON) * self.FINAL_LON_PRECISION, 6))
+        return latVal, lngVal
 
-        # Compute the grid part of the code if necessary.
-        # TODO: Some of these computations can be made at init.
-        if self.code_length > self.PAIR_CODE_LENGTH:
-            for _ in range(self.MAX_CODE_LENGTH - self.PAIR_CODE_LENGTH):
-                latDigit = latVal % self.GRID_ROWS
-                lngDigit = lngVal % self.GRID_COLUMNS
-                ndx = latDigit * self.GRID_COLUMNS + lngDigit
-                char = self.ALPHABET[ndx]
-                code = char + code
-                # Appending to char buf in reverse
-                # chars.append(char)
-                latVal //= self.GRID_ROWS
-                lngVal //= self.GRID_COLUMNS
-        else:
-            latVal //= self.GRID_ROW_DIV
-            lngVal //= self.GRID_COL_DIV
+    def _code(self, latVal: int, lngVal: int) -> str:
+        """Compute the code of the scaled integer location."""
+        # Drop the digits beyond the code length.
+        latVal //= self._lat_div
+        lngVal //= self._lon_div
+
+        # Look up the grid characters, most significant first.
+        grid = ""
+        if self._grid_divs:
+            rows, cols = self.GRID_ROWS, self.GRID_COLUMNS
+            grid = "".join(
+                [
+                    self.ALPHABET[(latVal // r % rows) * cols + lngVal // c % cols]
+                    for r, c in self._grid_divs
+                ]
+            )
+            latVal //= self._grid_lat_div
+            lngVal //= self._grid_lon_div
+
+        # Look up the character pairs, most significant first.
+        pairs, base = self.PAIRS, self.ENCODING_BASE
+        code = "".join(
+            [
+                pairs[(latVal // d % base) * base + lngVal // d % base]
+                for d in self._pair_divs
+            ]
+        )
+
+        # Add the separator character, padding if necessary.
+        pos = self.SEP_POSITION
+        if self.code_length < pos:
+            return code + self._padding
+        return code[:pos] + self.SEP + code[pos:] + grid
+
+    def _bounds(self, latVal: int, lngVal: int) -> tuple[float, float, float, float]:
+        """
+        Compute the (sw_lat, sw_lon, ne_lat, ne_lon) bounds of the code of the
+        scaled integer location, exactly as Decoder.decode_bounds would.
+        """
+        from .decoder import round_bounds
+
+        lat, lng = self._corner(latVal, lngVal)
+        return round_bounds(lat, lng, self._lat_size, self._lon_size)
 
-        # Compute the pair section of the code.
+    def _corner(self, latVal: int, lngVal: int) -> tuple[float, float]:
+        """
+        Compute the unrounded (lat, lng) south west corner of the code of the
+        scaled integer location, as Decoder.decode_bounds does.
+        """
+        # The pair and grid sections in the decoder's units, reduced to the
+        # digits that are actually encoded and truncated to the code length.
+        normalLat = (latVal // self.GRID_ROW_DIV) % self._pair_mod
+        normalLng = (lngVal // self.GRID_COL_DIV) % self._pair_mod
+        normalLat -= normalLat % self._pair_place
+        normalLng -= normalLng % self._pair_place
+        normalLat -= self.MAX_LAT * self.PAIR_PRECISION
+        normalLng -= self.MAX_LON * self.PAIR_PRECISION
+        gridLat = gridLng = 0
+        if self._n_grid:
+            gridLat = latVal % self.GRID_ROW_DIV
+            gridLng = lngVal % self.GRID_COL_DIV
+            gridLat -= gridLat % self._row_place
+            gridLng -= gridLng % self._col_place
+
+        lat = normalLat / self.PAIR_PRECISION + gridLat / self.FINAL_LAT_PRECISION
+        lng = normalLng / self.PAIR_PRECISION + gridLng / self.FINAL_LON_PRECISION
+        return lat, lng
+
+    def encode_many(self, lats: Iterable[float], lons: Iterable[float]) -> list[str]:
+        """
+        Encode many locations into Plus Codes of this encoder's length.
+
+        Equivalent to ``[self.encode(lat, lon) for lat, lon in zip(lats, lons)]``
+        but with attribute lookups and length dependent branching hoisted out
+        of the loop.
+
+        Args:
+          lats: Latitudes in signed decimal degrees. Any iterable of numbers
+              works, e.g., a list, array.array, memoryview or numpy array.
+          lons: Longitudes in signed decimal degrees. Must have the same number
+              of elements as lats.
+        """
+        lat_precision = self._lat_precision
+        alphabet = self.ALPHABET
+        pairs = self.PAIRS
+        max_lat = self.MAX_LAT
+        max_lon = self.MAX_LON
+        fnl_lat_prec = self.FINAL_LAT_PRECISION
+        fnl_lon_prec = self.FINAL_LON_PRECISION
         base = self.ENCODING_BASE
-        for _ in range(self.PAIR_CODE_LENGTH // 2):
-            # chars.append(self.ALPHABET[lngVal % base])
-            # chars.append(self.ALPHABET[latVal % base])
-            code = self.ALPHABET[lngVal % base] + code
-            code = self.ALPHABET[latVal % base] + code
-            latVal //= self.ENCODING_BASE
-            lngVal //= self.ENCODING_BASE
-
-        # Add the separator character.
-        sep, pos = self.SEP, self.SEP_POSITION
-        code = code[:pos] + sep + code[pos:]
-
-        # If we don't need to pad the code, return the requested section.
-        if self.code_length >= pos:
-            code = code[: self.code_length + 1]
-        else:
-            code = code[: self.code_length] + "".zfill(pos - self.code_length) + sep
-        return code
+        rows = self.GRID_ROWS
+        cols = self.GRID_COLUMNS
+        lat_div = self._lat_div
+        lon_div = self._lon_div
+        grid_divs = self._grid_divs
+        grid_lat_div = self._grid_lat_div
+        grid_lon_div = self._grid_lon_div
+        pair_divs = self._pair_divs
+        pos = self.SEP_POSITION
+        sep = self.SEP
+        padding = self._padding
+        padded = self.code_length < pos
+
+        codes = []
+        append = codes.append
+        join = "".join
+        for latitude, longitude in zip(lats, lons, strict=True):
+            if latitude == 90:
+                latitude = latitude - lat_precision
+            if longitude == 180:
+                longitude = -180
+            latVal = int(round((latitude + max_lat) * fnl_lat_prec, 6)) // lat_div
+            lngVal = int(round((longitude + max_lon) * fnl_lon_prec, 6)) // lon_div
+
+            grid = ""
+            if grid_divs:
+                grid = join(
+                    [
+                        alphabet[(latVal // r % rows) * cols + lngVal // c % cols]
+                        for r, c in grid_divs
+                    ]
+                )
+                latVal //= grid_lat_div
+                lngVal //= grid_lon_div
+            code = join(
+                [
+                    pairs[(latVal // d % base) * base + lngVal // d % base]
+                    for d in pair_divs
+                ]
+            )
+            if padded:
+                append(code + padding)
+            else:
+                append(code[:pos] + sep + code[pos:] + grid)
+        return codes
+
+    def encode_int(self, latitude: float, longitude: float) -> int:
+        """
+        Encode a location into the packed integer key of its Plus Code.
+
+        Equivalent to ``packed.to_int(self.encode(latitude, longitude))``,
+        without building the intermediate string.
+        """
+        from .packed import _pack
+
+        latVal, lngVal = self._scale(latitude, longitude)
+        latVal //= self._lat_div
+        lngVal //= self._lon_div
+
+        # Digit groups, least significant first.
+        groups = []
+        rows, cols = self.GRID_ROWS, self.GRID_COLUMNS
+        for _ in range(self._n_grid):
+            groups.append((latVal % rows) * cols + lngVal % cols)
+            latVal //= rows
+            lngVal //= cols
+        base = self.ENCODING_BASE
+        for _ in range(self._n_pairs - 1):
+            groups.append((latVal % base) * base + lngVal % base)
+            latVal //= base
+            lngVal //= base
+        # The first pair only spans 18 longitude digits.
+        groups.append((latVal % base) * (2 * self.MAX_LON // base) + lngVal % base)
+        groups.reverse()
+        return _pack(groups)
 
 
 # Pre-init all possible encoders.
@@ -132,3 +357,42 @@ def encode(lat: float, lon: float, code_length: int = 10) -> str:
     except KeyError:
         raise ValueError("code_length must be between 6 and 15, inclusive.")
     return encoder.encode(lat, lon)
+
+
+def encode_many(
+    lats: Iterable[float], lons: Iterable[float], code_length: int = 10
+) -> list[str]:
+    """Encode many locations using the pre-initialized Encoder for the input
+    code length.
+    """
+    try:
+        encoder = Encoders[code_length]
+    except KeyError:
+        raise ValueError("code_length must be between 6 and 15, inclusive.")
+    return encoder.encode_many(lats, lons)
+
+
+def encode_with_area(
+    lat: float, lon: float, code_length: int = 10
+) -> tuple[str, "Area"]:
+    """Encode a location into a Plus Code of the input length along with the
+    code's area.
+    """
+    try:
+        encoder = Encoders[code_length]
+    except KeyError:
+        raise ValueError("code_length must be between 6 and 15, inclusive.")
+    return encoder.encode_with_area(lat, lon)
+
+
+def encode_many_with_area(
+    lats: Iterable[float], lons: Iterable[float], code_length: int = 10
+) -> list[tuple[str, "Area"]]:
+    """Encode many locations into (code, area) pairs using the pre-initialized
+    Encoder for the input code length.
+    """
+    try:
+        encoder = Encoders[code_length]
+    except KeyError:
+        raise ValueError("code_length must be between 6 and 15, inclusive.")
+    return encoder.encode_many_with_area(lats, lons)
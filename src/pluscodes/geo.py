@@ -1,11 +1,13 @@
 from dataclasses import dataclass
-from typing import Dict, Tuple
+from typing import Any, Dict, Tuple
 
 
 @dataclass(frozen=True)
 class Point:
     """A two-dimensional geocoordinate."""
 
+    __slots__ = ("lat", "lon")
+
     lat: float
     lon: float
 
@@ -21,6 +23,20 @@ class Point:
         """Point represented as a dictionary."""
         return {"lat": self.lat, "lon": self.lon}
 
+    def __getstate__(self) -> Tuple[float, float]:
+        return (self.lat, self.lon)
+
+    def __setstate__(self, state: Tuple[float, float]):
+        object.__setattr__(self, "lat", state[0])
+        object.__setattr__(self, "lon", state[1])
+
+
+def _center(sw_lat: float, sw_lon: float, ne_lat: float, ne_lon: float) -> Point:
+    """The center point of the area with the input bounds."""
+    lat = round(min((sw_lat + ne_lat) / 2, 90), 14)
+    lon = round(min((sw_lon + ne_lon) / 2, 180), 14)
+    return Point(lat, lon)
+
 
 @dataclass(frozen=True)
 class Area:
@@ -32,14 +48,21 @@ class Area:
         ne: The northeast (high) coordinates.
     """
 
+    # The center is not a field: it is computed on first use and cached.
+    __slots__ = ("sw", "ne", "_center")
+
     sw: Point
     ne: Point
 
     def center(self) -> Point:
         """The center point of the Plus Code area."""
-        lat = round(min((self.sw.lat + self.ne.lat) / 2, 90), 14)
-        lon = round(min((self.sw.lon + self.ne.lon) / 2, 180), 14)
-        return Point(lat=lat, lon=lon)
+        try:
+            return self._center
+        except AttributeError:
+            sw, ne = self.sw, self.ne
+            center = _center(sw.lat, sw.lon, ne.lat, ne.lon)
+            object.__setattr__(self, "_center", center)
+            return center
 
     def dict(self) -> Dict[str, Dict[str, float]]:
         """Area as a dict."""
@@ -54,3 +77,130 @@ class Area:
         point boundaries
         """
         return (self.sw.latlon(), self.ne.latlon())
+
+    def __getstate__(self) -> Tuple[Point, Point]:
+        return (self.sw, self.ne)
+
+    def __setstate__(self, state: Tuple[Point, Point]):
+        object.__setattr__(self, "sw", state[0])
+        object.__setattr__(self, "ne", state[1])
+
+
+def as_doubles(buffer: Any) -> memoryview:
+    """A flat, read-only float64 view of a C-contiguous buffer, e.g., an
+    array('d'), a numpy float64 or structured bounds array, or an mmap.
+    """
+    view = memoryview(buffer)
+    if view.format != "d" or view.ndim != 1:
+        view = view.cast("B").cast("d")
+    return view.toreadonly()
+
+
+def row_width(buffer: Any) -> int:
+    """
+    The number of float64 values per row of a buffer: the fields of each
+    record of a structured array, e.g., 6 for vectorized.decode with centers,
+    the columns of a 2-D float64 array, or 4 bounds otherwise.
+    """
+    view = memoryview(buffer)
+    if view.format == "d" and view.ndim == 2:
+        return view.shape[1]
+    if view.format not in ("d", "B") and view.itemsize % 8 == 0:
+        return view.itemsize // 8
+    return 4
+
+
+def _row_count(view: memoryview, stride: int) -> int:
+    if stride < 4 or len(view) % stride:
+        raise ValueError(f"Buffer is not made of rows of {stride=} values.")
+    return len(view) // stride
+
+
+class AreaView:
+    """
+    An Area whose coordinates are read from a row of a columnar buffer
+    instead of being owned by the instance.
+
+    The buffer holds float64 values laid out as consecutive rows starting
+    with (sw_lat, sw_lon, ne_lat, ne_lon), such as the output of
+    vectorized.decode, whose rows also hold the center when requested.
+    AreaView provides the same read API as Area and compares equal to an
+    Area with the same bounds.
+
+    Args:
+        buffer: A memoryview returned by as_doubles, or any object accepted
+            by it. Pass the same memoryview to many views to share it.
+        row: The row of the bounds in the buffer.
+        stride: The number of values per row. Defaults to the row_width of
+            the buffer, which is 4 for flat buffers such as memoryviews
+            returned by as_doubles.
+
+    Raises:
+        ValueError: If the stride is less than 4 or does not divide the
+            buffer into whole rows.
+    """
+
+    __slots__ = ("_buf", "_start")
+
+    def __init__(self, buffer: Any, row: int, stride: int | None = None):
+        if stride is None:
+            stride = row_width(buffer)
+        self._buf = buffer if isinstance(buffer, memoryview) else as_doubles(buffer)
+        n = _row_count(self._buf, stride)
+        if not 0 <= row < n:
+            raise IndexError(f"Row out of range: {row=}")
+        self._start = row * stride
+
+    @classmethod
+    def rows(cls, buffer: Any, stride: int | None = None) -> list["AreaView"]:
+        """Views of every row of the buffer, sharing a single memoryview."""
+        if stride is None:
+            stride = row_width(buffer)
+        view = as_doubles(buffer)
+        return [cls(view, row, stride) for row in range(_row_count(view, stride))]
+
+    def bounds(self) -> Tuple[float, float, float, float]:
+        """Return the (sw_lat, sw_lon, ne_lat, ne_lon) tuple."""
+        i = self._start
+        return tuple(self._buf[i : i + 4])
+
+    @property
+    def sw(self) -> Point:
+        """The southwest (low) coordinates."""
+        i = self._start
+        return Point(self._buf[i], self._buf[i + 1])
+
+    @property
+    def ne(self) -> Point:
+        """The northeast (high) coordinates."""
+        i = self._start
+        return Point(self._buf[i + 2], self._buf[i + 3])
+
+    def center(self) -> Point:
+        """The center point of the Plus Code area."""
+        return _center(*self.bounds())
+
+    def dict(self) -> Dict[str, Dict[str, float]]:
+        """Area as a dict."""
+        return Area.dict(self)
+
+    def tuple(self) -> Tuple[Tuple[float, float], Tuple[float, float]]:
+        """Return a tuple containing the Southwest point and Northeast point
+        boundaries
+        """
+        return Area.tuple(self)
+
+    def area(self) -> Area:
+        """Copy the bounds into an Area that owns them."""
+        return Area(self.sw, self.ne)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (Area, AreaView)):
+            return (self.sw, self.ne) == (other.sw, other.ne)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.sw, self.ne))
+
+    def __repr__(self) -> str:
+        return f"AreaView(sw={self.sw!r}, ne={self.ne!r})"
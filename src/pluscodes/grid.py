@@ -0,0 +1,153 @@
+"""
+Neighborhoods of codes computed in integer cell space.
+
+Each code of a given length is a cell of a regular grid, identified by its
+(lat, lon) row and column counted north of -90 and east of -180. Neighbors
+are found by stepping these integers, with longitude wrapping around the
+antimeridian and latitude clamped at the poles, and formatting the result,
+so no floating point values are involved.
+"""
+from .base import Base
+from .encoder import Encoders
+from .validator import _full_digits
+
+_LENGTHS = frozenset(Encoders)
+
+
+def grid_size(code_length: int) -> tuple[int, int]:
+    """
+    The number of (lat, lon) cells of codes of the input length.
+
+    Raises:
+        ValueError: If the code length is invalid.
+    """
+    if code_length not in _LENGTHS:
+        raise ValueError(f"Invalid code length: {code_length=}")
+    base = Base.ENCODING_BASE
+    pairs = min(code_length, Base.PAIR_CODE_LENGTH) // 2 - 1
+    grid = max(code_length - Base.PAIR_CODE_LENGTH, 0)
+    lat_cells = 2 * Base.MAX_LAT // base * base**pairs * Base.GRID_ROWS**grid
+    lon_cells = 2 * Base.MAX_LON // base * base**pairs * Base.GRID_COLUMNS**grid
+    return lat_cells, lon_cells
+
+
+def cell(code: str) -> tuple[int, int, int]:
+    """
+    The (lat, lon, code_length) cell of a full Plus Code.
+
+    Raises:
+        ValueError: If the input is not a full code of a valid length.
+    """
+    digits = _full_digits(code)
+    index = Base.ALPHABET_INDEX
+    base, cols = Base.ENCODING_BASE, Base.GRID_COLUMNS
+    lat = lon = 0
+    for i in range(0, min(len(digits), Base.PAIR_CODE_LENGTH), 2):
+        lat = lat * base + index[digits[i]]
+        lon = lon * base + index[digits[i + 1]]
+    for char in digits[Base.PAIR_CODE_LENGTH :]:
+        row, col = divmod(index[char], cols)
+        lat = lat * Base.GRID_ROWS + row
+        lon = lon * cols + col
+    return lat, lon, len(digits)
+
+
+def from_cell(lat: int, lon: int, code_length: int) -> str:
+    """
+    The code of a (lat, lon) cell of the input length.
+
+    Raises:
+        ValueError: If the code length is invalid or the cell out of range.
+    """
+    lat_cells, lon_cells = grid_size(code_length)
+    if not (0 <= lat < lat_cells and 0 <= lon < lon_cells):
+        raise ValueError(f"Cell is out of range: {lat=}, {lon=}")
+    encoder = Encoders[code_length]
+    return encoder._code(lat * encoder._lat_div, lon * encoder._lon_div)
+
+
+def offset(code: str, dlat: int, dlon: int) -> str | None:
+    """
+    The code dlat cells north and dlon cells east of the input code, with
+    longitude wrapping around the antimeridian, or None if the cell would lie
+    beyond a pole.
+    """
+    lat, lon, code_length = cell(code)
+    lat_cells, lon_cells = grid_size(code_length)
+    lat += dlat
+    if not 0 <= lat < lat_cells:
+        return None
+    return from_cell(lat, (lon + dlon) % lon_cells, code_length)
+
+
+def k_ring(code: str, k: int) -> list[str]:
+    """
+    The distinct codes within k cells of the input code, in both latitude
+    and longitude, including the code itself. Rows are listed from north to
+    south and codes within a row from west to east.
+
+    Rows beyond the poles are omitted, and longitude wraps around the
+    antimeridian.
+
+    Raises:
+        ValueError: If the input is not a full code or k is negative.
+    """
+    if k < 0:
+        raise ValueError(f"k must not be negative: {k=}")
+    lat, lon, code_length = cell(code)
+    lat_cells, lon_cells = grid_size(code_length)
+    encoder = Encoders[code_length]
+    fmt, lat_div, lon_div = encoder._code, encoder._lat_div, encoder._lon_div
+
+    # Longitudes wrap, so a ring wider than the grid repeats columns.
+    if 2 * k + 1 >= lon_cells:
+        lons = range(lon_cells)
+    else:
+        lons = [(lon + d) % lon_cells for d in range(-k, k + 1)]
+    rows = range(min(lat + k, lat_cells - 1), max(lat - k, 0) - 1, -1)
+    return [fmt(y * lat_div, x * lon_div) for y in rows for x in lons]
+
+
+# Neighbor offsets, clockwise from north.
+_NEIGHBORS = ((1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1), (0, -1), (1, -1))
+
+
+def neighbors(code: str) -> list[str]:
+    """
+    The codes adjacent to the input code, including diagonally, clockwise
+    from north. Cells beyond the poles are omitted, and longitude wraps
+    around the antimeridian.
+
+    Raises:
+        ValueError: If the input is not a full code.
+    """
+    lat, lon, code_length = cell(code)
+    lat_cells, lon_cells = grid_size(code_length)
+    encoder = Encoders[code_length]
+    fmt, lat_div, lon_div = encoder._code, encoder._lat_div, encoder._lon_div
+    center = code.upper()
+
+    # Most neighbors only differ in the last pair or grid digit, which is
+    # replaced in place. Steps that carry into earlier digits, wrap or reach
+    # the poles are formatted from the stepped cell instead.
+    if code_length > Base.PAIR_CODE_LENGTH:
+        rows, cols = Base.GRID_ROWS, Base.GRID_COLUMNS
+        chars, stride, pos, width = Base.ALPHABET, cols, len(center) - 1, 1
+    else:
+        rows = cols = Base.ENCODING_BASE
+        if code_length == 2:
+            rows, cols = lat_cells, lon_cells
+        chars, stride, width = Base.PAIRS, Base.ENCODING_BASE, 2
+        pos = code_length - 2 + (code_length > Base.SEP_POSITION)
+    head, tail = center[:pos], center[pos + width :]
+    row, col = lat % rows, lon % cols
+
+    codes = []
+    for dlat, dlon in _NEIGHBORS:
+        y, x = row + dlat, col + dlon
+        if 0 <= y < rows and 0 <= x < cols:
+            codes.append(head + chars[y * stride + x] + tail)
+        elif 0 <= lat + dlat < lat_cells:
+            x = (lon + dlon) % lon_cells
+            codes.append(fmt((lat + dlat) * lat_div, x * lon_div))
+    return codes
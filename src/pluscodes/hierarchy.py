@@ -0,0 +1,116 @@
+"""
+Navigate the hierarchy of full Plus Codes with string operations.
+
+A code of length 2 through 8 has 400 children, one per additional pair of
+digits, and a code of length 10 through 14 has 20 children, one per
+additional grid digit. Parents are found by truncating the digits and
+re-padding, and children by appending digits, so nothing is decoded.
+
+    parent('8FVC9G8F+6X')            # '8FVC9G8F+'
+    parent('8FVC9G8F+6X', 4)         # '8FVC0000+'
+    list(children('8FVC9G8F+'))      # 400 codes, '8FVC9G8F+22' to '8FVC9G8F+XX'
+"""
+from itertools import product
+from typing import Iterator
+
+from .base import Base
+from .packed import LENGTHS
+from .validator import _full_digits
+
+_INDEX = {length: i for i, length in enumerate(LENGTHS)}
+
+
+def _format(digits: str) -> str:
+    """Pad and separate the significant digits of a full code."""
+    pos = Base.SEP_POSITION
+    if len(digits) <= pos:
+        return digits + Base.PADDING_CHAR * (pos - len(digits)) + Base.SEP
+    return digits[:pos] + Base.SEP + digits[pos:]
+
+
+def parent(code: str, code_length: int | None = None) -> str:
+    """
+    The ancestor of a full code with the input length, by default the next
+    shorter valid length.
+
+    Raises:
+        ValueError: If the input is not a full code, or the length is invalid
+            or not shorter than the code.
+    """
+    digits = _full_digits(code)
+    if code_length is None:
+        i = _INDEX[len(digits)]
+        if i == 0:
+            raise ValueError(f"Length 2 codes have no parent: {code=}")
+        code_length = LENGTHS[i - 1]
+    elif code_length not in _INDEX or code_length >= len(digits):
+        raise ValueError(f"Invalid parent length: {code_length=}")
+    return _format(digits[:code_length])
+
+
+def ancestors(code: str) -> list[str]:
+    """
+    The ancestors of a full code, shortest first, not including the code.
+
+    Raises:
+        ValueError: If the input is not a full code.
+    """
+    digits = _full_digits(code)
+    return [_format(digits[:length]) for length in LENGTHS[: _INDEX[len(digits)]]]
+
+
+def _tails(code_length: int, target: int) -> list[tuple[str, ...]]:
+    """The digits appended per level, from code_length to target."""
+    levels = LENGTHS[_INDEX[code_length] + 1 : _INDEX[target] + 1]
+    return [
+        Base.PAIRS if length <= Base.PAIR_CODE_LENGTH else tuple(Base.ALPHABET)
+        for length in levels
+    ]
+
+
+def children(code: str) -> Iterator[str]:
+    """
+    Iterate over the children of a full code in sorted order: 400 codes for
+    codes of length 2 through 8, 20 for codes of length 10 through 14 and
+    none for codes of length 15.
+
+    Raises:
+        ValueError: If the input is not a full code.
+    """
+    digits = _full_digits(code)
+    i = _INDEX[len(digits)]
+    if i + 1 == len(LENGTHS):
+        return iter(())
+    return _descendants(digits, LENGTHS[i + 1])
+
+
+def descendants(code: str, code_length: int) -> Iterator[str]:
+    """
+    Lazily iterate over the descendants of a full code with the input length,
+    in sorted order.
+
+    Raises:
+        ValueError: If the input is not a full code, or the length is invalid
+            or not longer than the code.
+    """
+    digits = _full_digits(code)
+    if code_length not in _INDEX or code_length <= len(digits):
+        raise ValueError(f"Invalid descendant length: {code_length=}")
+    return _descendants(digits, code_length)
+
+
+def _descendants(digits: str, code_length: int) -> Iterator[str]:
+    tails = _tails(len(digits), code_length)
+    # Codes of length 8 and less are padded, and longer codes separated after
+    # the eighth digit, which the pairs up to length 8 precede.
+    pos = Base.SEP_POSITION
+    head = tails[: max((pos - len(digits)) // 2, 0)]
+    rest = tails[len(head) :]
+    for prefix in product(*head):
+        stem = digits + "".join(prefix)
+        if not rest:
+            yield _format(stem)
+            continue
+        stem = _format(stem)
+        for tail in product(*rest):
+            yield stem + "".join(tail)
@@ -0,0 +1,163 @@
+"""
+A spatial index of regions expressed as Plus Codes of mixed lengths.
+
+The index keeps one hash table of packed keys per code length. Since a code
+contains exactly the points whose longer codes start with it, the regions
+containing a point are found by encoding the point once, at the longest
+indexed length, and looking up each of its prefixes in the table of that
+length. A lookup costs at most one probe per code length, however many
+regions are indexed.
+"""
+from array import array
+from typing import Any, Iterable, Iterator
+
+from . import packed
+from .encoder import Encoders
+
+
+def _length(key: int) -> int:
+    return packed.LENGTHS[len(packed.lineage(key)) - 1]
+
+
+class PlusCodeIndex:
+    """
+    A mapping of full Plus Codes of any valid length to values, supporting
+    lookups of the codes that contain a point or another code.
+
+    Args:
+        codes: Codes to index, e.g., a list of strings or a PlusCodeArray.
+        values: Values of the codes, in the same order. Defaults to None for
+            each code.
+
+    Raises:
+        ValueError: If a code is not a full code of a valid length.
+    """
+
+    __slots__ = ("_levels", "_max_length")
+
+    def __init__(self, codes: Iterable[str] = (), values: Iterable[Any] | None = None):
+        self._levels: dict[int, dict[int, Any]] = {}
+        self._max_length = 0
+        self.update(codes, values)
+
+    @classmethod
+    def from_keys(
+        cls, keys: Iterable[int], values: Iterable[Any] | None = None
+    ) -> "PlusCodeIndex":
+        """
+        Bulk load packed keys, e.g., the keys of a PlusCodeArray or of a
+        memory-mapped CodeFile.
+        """
+        index = cls()
+        index._load(keys, values)
+        return index
+
+    def _load(self, keys: Iterable[int], values: Iterable[Any] | None):
+        levels = self._levels
+        if values is None:
+            keys = list(keys)
+            values = [None] * len(keys)
+        for key, value in zip(keys, values, strict=True):
+            length = _length(key)
+            try:
+                levels[length][key] = value
+            except KeyError:
+                levels[length] = {key: value}
+        self._max_length = max(levels, default=0)
+
+    def update(self, codes: Iterable[str], values: Iterable[Any] | None = None):
+        """Insert many codes, with values in the same order if provided."""
+        self._load(map(packed.to_int, codes), values)
+
+    def insert(self, code: str, value: Any = None):
+        """Insert a code, replacing the value of the code if already indexed."""
+        self._load([packed.to_int(code)], [value])
+
+    def delete(self, code: str):
+        """
+        Remove a code.
+
+        Raises:
+            KeyError: If the code is not indexed.
+        """
+        key = packed.to_int(code)
+        length = _length(key)
+        level = self._levels.get(length, {})
+        if key not in level:
+            raise KeyError(code)
+        del level[key]
+        if not level:
+            del self._levels[length]
+            self._max_length = max(self._levels, default=0)
+
+    def get(self, code: str, default: Any = None) -> Any:
+        """The value of an indexed code, or the default."""
+        key = packed.to_int(code)
+        return self._levels.get(_length(key), {}).get(key, default)
+
+    def _matches(self, lineage: list[int]) -> Iterator[tuple[int, Any]]:
+        levels = self._levels
+        for length, key in zip(packed.LENGTHS, lineage):
+            level = levels.get(length)
+            if level is not None and key in level:
+                yield key, level[key]
+
+    def _point_lineage(self, lat: float, lon: float) -> list[int]:
+        if not self._max_length:
+            return []
+        return packed.lineage(Encoders[self._max_length].encode_int(lat, lon))
+
+    def query(self, lat: float, lon: float) -> list[str]:
+        """The indexed codes containing the point, shortest first."""
+        return [
+            packed.from_int(key)
+            for key, _ in self._matches(self._point_lineage(lat, lon))
+        ]
+
+    def query_items(self, lat: float, lon: float) -> list[tuple[str, Any]]:
+        """The indexed (code, value) pairs whose codes contain the point,
+        shortest first.
+        """
+        return [
+            (packed.from_int(key), value)
+            for key, value in self._matches(self._point_lineage(lat, lon))
+        ]
+
+    def query_code(self, code: str) -> list[str]:
+        """The indexed codes equal to or containing the input code, shortest
+        first.
+        """
+        lineage = packed.lineage(packed.to_int(code))
+        return [packed.from_int(key) for key, _ in self._matches(lineage)]
+
+    @property
+    def lengths(self) -> list[int]:
+        """The lengths of the indexed codes."""
+        return sorted(self._levels)
+
+    def __len__(self) -> int:
+        return sum(map(len, self._levels.values()))
+
+    def __contains__(self, code: str) -> bool:
+        key = packed.to_int(code)
+        return key in self._levels.get(_length(key), {})
+
+    def __iter__(self) -> Iterator[str]:
+        for length in sorted(self._levels):
+            yield from map(packed.from_int, self._levels[length])
+
+    def __getstate__(self) -> dict:
+        # Keys pickle far more compactly as arrays than as dict entries.
+        return {
+            length: (array("Q", level), list(level.values()))
+            for length, level in self._levels.items()
+        }
+
+    def __setstate__(self, state: dict):
+        self._levels = {
+            length: dict(zip(keys, values)) for length, (keys, values) in state.items()
+        }
+        self._max_length = max(self._levels, default=0)
+
+    def __repr__(self) -> str:
+        return f"PlusCodeIndex(codes={len(self)}, lengths={self.lengths})"
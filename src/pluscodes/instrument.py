@@ -0,0 +1,265 @@
+"""
+Opt-in instrumentation of the encoding, decoding, transforming and validation
+methods.
+
+By default nothing is measured: the methods are the plain functions, with no
+per-call check of whether instrumentation is on. enable swaps timed wrappers
+into the Encoder, Decoder, Transformer and Validator classes, so calls
+through any instance, including those of the module level encode, decode and
+transform functions, are measured, and disable restores the original
+methods. Call sites do not need to change:
+
+    from pluscodes import instrument
+
+    instrument.enable()
+    ...
+    print(instrument.snapshot()["Encoder.encode"])
+    instrument.disable()
+
+Decoder.decode and Decoder.decode_center share the uninstrumented
+implementation of Decoder.decode_bounds, so a decode is recorded once, under
+its own operation. Transformer methods calling the encoder and decoder, e.g.,
+Transformer.lenghten, which decodes and encodes, are recorded under each
+operation.
+"""
+import threading
+import time
+from functools import update_wrapper
+from typing import Any, Callable
+
+from .decoder import Decoder
+from .encoder import Encoder
+from .transformer import Transformer
+from .validator import Validator
+
+
+def _results_len(result: tuple[list, bytearray]) -> int:
+    return len(result[0])
+
+
+# The instrumented methods of each class, mapped to the function counting the
+# items of a batch method's result, or to None for methods of one item.
+METHODS: dict[type, dict[str, Callable[[Any], int] | None]] = {
+    Encoder: {
+        "encode": None,
+        "encode_int": None,
+        "encode_with_area": None,
+        "encode_many": len,
+        "encode_many_with_area": len,
+    },
+    Decoder: {
+        "decode": None,
+        "decode_bounds": None,
+        "decode_center": None,
+    },
+    Transformer: {
+        "lenghten": None,
+        "shorten": None,
+        "recover_many": _results_len,
+        "shorten_many": _results_len,
+    },
+    Validator: {
+        "is_valid": None,
+        "is_short": None,
+        "is_full": None,
+        "classify": None,
+        "classify_many": len,
+    },
+}
+
+
+class OperationStats:
+    """
+    Counters of one operation, and its latencies over a window of the most
+    recent calls, from which percentiles are computed.
+    """
+
+    __slots__ = (
+        "calls",
+        "items",
+        "errors",
+        "total_ns",
+        "max_ns",
+        "_latencies",
+        "_window",
+    )
+
+    def __init__(self, window: int):
+        self.calls = 0
+        self.items = 0
+        self.errors = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        # A ring buffer, filled up to the window size.
+        self._latencies: list[int] = []
+        self._window = window
+
+    def record(self, ns: int, items: int, error: bool):
+        """Record a call of ns nanoseconds, processing the number of items."""
+        latencies, window = self._latencies, self._window
+        if len(latencies) < window:
+            latencies.append(ns)
+        else:
+            latencies[self.calls % window] = ns
+        self.calls += 1
+        self.items += items
+        self.errors += error
+        self.total_ns += ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+
+    def snapshot(self) -> dict:
+        """The counters, batch size and latencies in seconds, as a dict."""
+        latencies = sorted(self._latencies)
+
+        def percentile(q: float) -> float:
+            if not latencies:
+                return 0.0
+            # Nearest rank.
+            return latencies[max(round(q * len(latencies)) - 1, 0)] / 1e9
+
+        calls = self.calls
+        return {
+            "calls": calls,
+            "items": self.items,
+            "errors": self.errors,
+            "mean_batch_size": self.items / calls if calls else 0.0,
+            "total_seconds": self.total_ns / 1e9,
+            "mean_seconds": self.total_ns / calls / 1e9 if calls else 0.0,
+            "max_seconds": self.max_ns / 1e9,
+            "p50_seconds": percentile(0.5),
+            "p90_seconds": percentile(0.9),
+            "p99_seconds": percentile(0.99),
+        }
+
+
+class Registry:
+    """
+    Thread-safe statistics of instrumented operations, keyed by
+    'Class.method', e.g., 'Encoder.encode'.
+
+    Args:
+        window: The number of most recent calls per operation whose latencies
+            are kept for percentiles.
+    """
+
+    def __init__(self, window: int = 4096):
+        if not isinstance(window, int) or window < 1:
+            raise ValueError(f"window must be a positive integer: {window=}")
+        self.window = window
+        self._stats: dict[str, OperationStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, operation: str, ns: int, items: int = 1, error: bool = False):
+        """Record a call of an operation."""
+        with self._lock:
+            stats = self._stats.get(operation)
+            if stats is None:
+                stats = self._stats[operation] = OperationStats(self.window)
+            stats.record(ns, items, error)
+
+    def snapshot(self) -> dict[str, dict]:
+        """The statistics of each operation called so far, as plain dicts."""
+        with self._lock:
+            return {
+                operation: stats.snapshot()
+                for operation, stats in sorted(self._stats.items())
+            }
+
+    def clear(self):
+        """Remove all statistics."""
+        with self._lock:
+            self._stats.clear()
+
+
+def _timed(
+    registry: Registry,
+    operation: str,
+    method: Callable,
+    size: Callable[[Any], int] | None,
+) -> Callable:
+    """Wrap a method to record its calls in the registry."""
+    record, clock = registry.record, time.perf_counter_ns
+
+    if size is None:
+
+        def wrapper(*args, **kwargs):
+            start = clock()
+            try:
+                result = method(*args, **kwargs)
+            except Exception:
+                record(operation, clock() - start, 1, True)
+                raise
+            record(operation, clock() - start, 1, False)
+            return result
+
+    else:
+
+        def wrapper(*args, **kwargs):
+            start = clock()
+            try:
+                result = method(*args, **kwargs)
+            except Exception:
+                record(operation, clock() - start, 0, True)
+                raise
+            record(operation, clock() - start, size(result), False)
+            return result
+
+    return update_wrapper(wrapper, method)
+
+
+# The installed registry, and the original methods it replaced.
+_registry: Registry | None = None
+_originals: dict[tuple[type, str], Callable] = {}
+_lock = threading.Lock()
+
+
+def enable(window: int = 4096) -> Registry:
+    """
+    Install a new, empty registry, recording every call of the instrumented
+    methods until disabled.
+    """
+    global _registry
+    registry = Registry(window)
+    with _lock:
+        _restore()
+        for cls, methods in METHODS.items():
+            for name, size in methods.items():
+                method = cls.__dict__[name]
+                _originals[cls, name] = method
+                operation = f"{cls.__name__}.{name}"
+                setattr(cls, name, _timed(registry, operation, method, size))
+        _registry = registry
+    return registry
+
+
+def _restore():
+    global _registry
+    for (cls, name), method in _originals.items():
+        setattr(cls, name, method)
+    _originals.clear()
+    _registry = None
+
+
+def disable():
+    """Restore the original methods and remove the registry, if any."""
+    with _lock:
+        _restore()
+
+
+def enabled() -> bool:
+    """Whether instrumentation is installed."""
+    return _registry is not None
+
+
+def snapshot() -> dict[str, dict] | None:
+    """Statistics of the installed registry, or None if disabled."""
+    registry = _registry
+    return registry.snapshot() if registry is not None else None
+
+
+def clear():
+    """Clear the statistics of the installed registry, if any."""
+    registry = _registry
+    if registry is not None:
+        registry.clear()
@@ -0,0 +1,190 @@
+"""
+Pack Plus Codes into 64-bit integer keys.
+
+Codes form a tree: each code of length 2 through 10 has 400 children, one per
+additional pair of digits, and each code of length 10 through 14 has 20
+children, one per additional grid digit. A key is the position of a code in
+a pre-order walk of that tree, so
+
+* every full code of length 2 through 15 has a distinct key,
+* keys sort in the same order as the (upper case, padded) code strings, and
+* the descendants of a code are exactly the keys in the half-open range
+  [to_int(code), to_int(code) + subtree_size(length)).
+
+The largest key is below 2**64, so keys fit into unsigned 64-bit storage.
+"""
+from .base import Base
+from .validator import _full_digits
+
+# The code lengths at which a digit group ends, i.e., the valid lengths of
+# full codes.
+LENGTHS = (2, 4, 6, 8, 10, 11, 12, 13, 14, 15)
+
+# The first pair of a full code can only select 9 latitude and 18 longitude
+# values, while later pairs select 20 of each, and grid digits one of 20.
+_FIRST_LAT_DIGITS = 2 * Base.MAX_LAT // Base.ENCODING_BASE
+_FIRST_LON_DIGITS = 2 * Base.MAX_LON // Base.ENCODING_BASE
+_FANOUT = {
+    length: Base.ENCODING_BASE ** (2 if length <= Base.PAIR_CODE_LENGTH else 1)
+    for length in LENGTHS
+}
+_FANOUT[LENGTHS[0]] = _FIRST_LAT_DIGITS * _FIRST_LON_DIGITS
+
+# The number of codes in the subtree rooted at a code of each length,
+# including the code itself.
+SUBTREE_SIZE = {LENGTHS[-1]: 1}
+for _parent, _child in zip(LENGTHS[-2::-1], LENGTHS[:0:-1]):
+    SUBTREE_SIZE[_parent] = 1 + _FANOUT[_child] * SUBTREE_SIZE[_child]
+
+# One past the largest key.
+MAX_KEY = _FANOUT[LENGTHS[0]] * SUBTREE_SIZE[LENGTHS[0]]
+
+# Per length, the size of the subtree below each digit group.
+_STRIDES = [SUBTREE_SIZE[length] for length in LENGTHS]
+
+
+def subtree_size(code_length: int) -> int:
+    """The number of keys spanned by a code of the input length and all of
+    its descendants.
+    """
+    try:
+        return SUBTREE_SIZE[code_length]
+    except KeyError:
+        raise ValueError(f"Invalid code length: {code_length=}")
+
+
+def _pack(groups: list[int]) -> int:
+    """Key of the code with the input digit group values, most significant
+    first. Pair groups are lat_digit * 20 + lon_digit, except for the first
+    which is lat_digit * 18 + lon_digit.
+    """
+    key = -1
+    for group, stride in zip(groups, _STRIDES):
+        key += 1 + group * stride
+    return key
+
+
+def to_int(code: str) -> int:
+    """
+    Pack a full Plus Code into its integer key.
+
+    Raises:
+        ValueError: If the input is not a full code of a valid length.
+    """
+    index = Base.ALPHABET_INDEX
+    idx = [index[c] for c in _full_digits(code)]
+
+    pair_digits = min(len(idx), Base.PAIR_CODE_LENGTH)
+    groups = [idx[0] * _FIRST_LON_DIGITS + idx[1]]
+    groups += [
+        idx[i] * Base.ENCODING_BASE + idx[i + 1] for i in range(2, pair_digits, 2)
+    ]
+    groups += idx[Base.PAIR_CODE_LENGTH :]
+    return _pack(groups)
+
+
+def truncate(key: int, code_length: int) -> int:
+    """
+    The key of the ancestor of the input key's code with the input length.
+
+    Raises:
+        ValueError: If the code length is invalid or longer than the key's code.
+    """
+    subtree_size(code_length)
+    if not 0 <= key < MAX_KEY:
+        raise ValueError(f"Key is out of range: {key=}")
+
+    ancestor = -1
+    for length, stride in zip(LENGTHS, _STRIDES):
+        group, key = divmod(key, stride)
+        ancestor += 1 + group * stride
+        if length == code_length:
+            return ancestor
+        if key == 0:
+            raise ValueError(f"Key is shorter than the code length: {code_length=}")
+        key -= 1
+
+
+def lineage(key: int) -> list[int]:
+    """
+    The keys of the ancestors of the input key's code, shortest first,
+    followed by the key itself. The i-th key has length LENGTHS[i].
+
+    Raises:
+        ValueError: If the key is outside of [0, MAX_KEY).
+    """
+    if not 0 <= key < MAX_KEY:
+        raise ValueError(f"Key is out of range: {key=}")
+
+    keys = []
+    ancestor = -1
+    for stride in _STRIDES:
+        group, key = divmod(key, stride)
+        ancestor += 1 + group * stride
+        keys.append(ancestor)
+        if key == 0:
+            break
+        key -= 1
+    return keys
+
+
+def to_cell(key: int) -> tuple[int, int, int]:
+    """
+    Unpack an integer key into the (lat, lon, code_length) of its code's cell,
+    where lat and lon count cells of that length north of -90 and east of -180.
+
+    Raises:
+        ValueError: If the key is outside of [0, MAX_KEY).
+    """
+    if not 0 <= key < MAX_KEY:
+        raise ValueError(f"Key is out of range: {key=}")
+
+    base, rows, cols = Base.ENCODING_BASE, Base.GRID_ROWS, Base.GRID_COLUMNS
+    group, key = divmod(key, _STRIDES[0])
+    lat, lon = divmod(group, _FIRST_LON_DIGITS)
+    code_length = LENGTHS[0]
+    for length, stride in zip(LENGTHS[1:], _STRIDES[1:]):
+        if key == 0:
+            break
+        group, key = divmod(key - 1, stride)
+        if length <= Base.PAIR_CODE_LENGTH:
+            lat_digit, lon_digit = divmod(group, base)
+            lat, lon = lat * base + lat_digit, lon * base + lon_digit
+        else:
+            row, col = divmod(group, cols)
+            lat, lon = lat * rows + row, lon * cols + col
+        code_length = length
+    return lat, lon, code_length
+
+
+def from_int(key: int) -> str:
+    """
+    Unpack an integer key into its full Plus Code.
+
+    Raises:
+        ValueError: If the key is outside of [0, MAX_KEY).
+    """
+    if not 0 <= key < MAX_KEY:
+        raise ValueError(f"Key is out of range: {key=}")
+
+    alphabet = Base.ALPHABET
+    digits = []
+    for length, stride in zip(LENGTHS, _STRIDES):
+        group, key = divmod(key, stride)
+        if length == LENGTHS[0]:
+            lat, lon = divmod(group, _FIRST_LON_DIGITS)
+            digits += [alphabet[lat], alphabet[lon]]
+        elif length <= Base.PAIR_CODE_LENGTH:
+            lat, lon = divmod(group, Base.ENCODING_BASE)
+            digits += [alphabet[lat], alphabet[lon]]
+        else:
+            digits.append(alphabet[group])
+        if key == 0:
+            break
+        key -= 1
+
+    code = "".join(digits)
+    pos = Base.SEP_POSITION
+    if len(code) < pos:
+        return code + Base.PADDING_CHAR * (pos - len(code)) + Base.SEP
+    return code[:pos] + Base.SEP + code[pos:]
@@ -0,0 +1,202 @@
+"""
+Multi-process bulk encoding.
+
+The input is split into chunks that are encoded by a pool of worker
+processes, and the results are reassembled in input order. At most
+max_pending chunks are in flight at a time, so memory use is bounded by the
+chunk size rather than the input size, and a slow consumer stalls the
+producer instead of letting results pile up.
+
+    from pluscodes import parallel
+
+    codes = parallel.encode_many(lats, lons, workers=8)
+    parallel.encode_file("points.csv", "codes.txt", fmt="csv", header=True)
+"""
+import os
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Callable, Iterable, Iterator
+
+from .encoder import Encoders
+from .rows import chunked, encode_chunk, read_rows
+
+CHUNK_SIZE = 65_536
+
+
+def _encode_floats(code_length: int, lats: array, lons: array) -> list[str]:
+    """Worker task: encode a chunk of coordinates."""
+    return Encoders[code_length].encode_many(lats, lons)
+
+
+def _encode_lines(
+    lines: list[str], fmt: str, lat_col: int, lon_col: int, code_length: int, start: int
+) -> tuple[str, int]:
+    """Worker task: parse and encode a chunk of lines into newline terminated
+    codes, where start is the line number of the first line.
+    """
+    codes = encode_chunk(
+        list(read_rows(lines, fmt, start)), lat_col, lon_col, code_length
+    )
+    return "".join([code + "\n" for code in codes]), len(codes)
+
+
+def _check(
+    code_length: int, workers: int | None, chunk_size: int, max_pending: int | None
+) -> tuple[int, int]:
+    """Validate the options, returning the worker count and pending limit."""
+    if code_length not in Encoders:
+        raise ValueError(f"Invalid code length: {code_length=}")
+    if chunk_size < 1:
+        raise ValueError(f"Chunk size must be positive: {chunk_size=}")
+    workers = workers or os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"Worker count must be positive: {workers=}")
+    max_pending = max_pending or 2 * workers
+    if max_pending < 1:
+        raise ValueError(f"Pending limit must be positive: {max_pending=}")
+    return workers, max_pending
+
+
+def pipeline(
+    fn: Callable, tasks: Iterable[tuple], workers: int, max_pending: int
+) -> Iterator:
+    """
+    Apply fn to each tuple of arguments on a process pool, yielding the
+    results in task order with at most max_pending tasks in flight.
+
+    With a single worker, tasks run in the calling process.
+    """
+    if workers == 1:
+        for args in tasks:
+            yield fn(*args)
+        return
+
+    pool = ProcessPoolExecutor(workers)
+    try:
+        pending = deque()
+        for args in tasks:
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+            pending.append(pool.submit(fn, *args))
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def encode_chunks(
+    lats: Iterable[float],
+    lons: Iterable[float],
+    code_length: int = 10,
+    *,
+    workers: int | None = None,
+    chunk_size: int = CHUNK_SIZE,
+    max_pending: int | None = None,
+) -> Iterator[list[str]]:
+    """
+    Encode many locations on a process pool, yielding a list of codes per
+    chunk of chunk_size locations, in input order.
+
+    Args:
+        lats: Latitudes in signed decimal degrees.
+        lons: Longitudes in signed decimal degrees, as many as lats.
+        code_length: The number of significant digits in the codes.
+        workers: The number of worker processes. Defaults to the CPU count.
+        chunk_size: The number of locations per task.
+        max_pending: The maximum number of tasks in flight. Defaults to twice
+            the number of workers.
+    """
+    workers, max_pending = _check(code_length, workers, chunk_size, max_pending)
+
+    def tasks():
+        lat_iter, lon_iter = iter(lats), iter(lons)
+        while True:
+            lat_chunk = array("d", islice(lat_iter, chunk_size))
+            lon_chunk = array("d", islice(lon_iter, chunk_size))
+            if len(lat_chunk) != len(lon_chunk):
+                raise ValueError("lats and lons have different lengths.")
+            if not lat_chunk:
+                return
+            yield code_length, lat_chunk, lon_chunk
+
+    yield from pipeline(_encode_floats, tasks(), workers, max_pending)
+
+
+def encode_many(
+    lats: Iterable[float],
+    lons: Iterable[float],
+    code_length: int = 10,
+    *,
+    workers: int | None = None,
+    chunk_size: int = CHUNK_SIZE,
+    max_pending: int | None = None,
+) -> list[str]:
+    """
+    Encode many locations on a process pool.
+
+    Equivalent to encoder.encode_many. See encode_chunks for the options.
+    """
+    codes = []
+    for chunk in encode_chunks(
+        lats,
+        lons,
+        code_length,
+        workers=workers,
+        chunk_size=chunk_size,
+        max_pending=max_pending,
+    ):
+        codes += chunk
+    return codes
+
+
+def encode_file(
+    src: str | os.PathLike,
+    dst: str | os.PathLike,
+    code_length: int = 10,
+    *,
+    fmt: str = "lines",
+    lat_col: int = 0,
+    lon_col: int = 1,
+    header: bool = False,
+    workers: int | None = None,
+    chunk_size: int = CHUNK_SIZE,
+    max_pending: int | None = None,
+) -> int:
+    """
+    Encode the locations of a file on a process pool, writing one code per
+    line to dst in input order. Lines are parsed by the workers.
+
+    Args:
+        src: The input path, in one of the command line formats. Records
+            cannot span lines.
+        dst: The output path.
+        fmt: One of "lines", "csv" or "tsv", as for the command line.
+        lat_col: The zero-based latitude column.
+        lon_col: The zero-based longitude column.
+        header: Whether to skip a header line.
+        See encode_chunks for the remaining options.
+
+    Returns:
+        The number of encoded rows.
+
+    Raises:
+        rows.RowError: If a row cannot be parsed.
+    """
+    workers, max_pending = _check(code_length, workers, chunk_size, max_pending)
+    rows = 0
+    with open(src, newline="") as fin, open(dst, "w") as fout:
+        if header:
+            next(fin, None)
+
+        def tasks():
+            start = 2 if header else 1
+            for lines in chunked(fin, chunk_size):
+                yield lines, fmt, lat_col, lon_col, code_length, start
+                start += len(lines)
+
+        for text, n in pipeline(_encode_lines, tasks(), workers, max_pending):
+            fout.write(text)
+            rows += n
+    return rows
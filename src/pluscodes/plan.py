@@ -0,0 +1,151 @@
+"""
+Plan range scans of the codes of one length that intersect a box.
+
+key_ranges and prefixes return the packed key ranges, or code prefixes, that
+enumerate exactly those codes in a sorted store, along with their
+descendants. Boxes are classified in the integer units of the encoder, as by
+cover.
+"""
+from .base import Base
+from .covering import _SPLIT, _Box
+from .encoder import Encoders
+from .geo import Area, AreaView
+from .packed import _FIRST_LON_DIGITS, LENGTHS, SUBTREE_SIZE, lineage
+
+
+def _plan(box: _Box, code_length: int) -> list[tuple[int, int, int, int]]:
+    """
+    The (key, lat, lon, code_length) of the fewest cells, in key order, whose
+    descendants of the input length are exactly those intersecting the box.
+    Cells are refined top down, stopping at cells whose descendants all
+    intersect the box.
+    """
+    if code_length not in SUBTREE_SIZE:
+        raise ValueError(f"Invalid code length: {code_length=}")
+    lengths = LENGTHS[: LENGTHS.index(code_length) + 1]
+    ranges = {length: box.cell_range(length) for length in lengths}
+    south, north, west, east = ranges[code_length]
+    target = Encoders[code_length]
+    cells = []
+
+    def visit(depth: int, lat: int, lon: int, key: int):
+        length = lengths[depth]
+        encoder = Encoders[length]
+        rows = encoder._lat_div // target._lat_div
+        cols = encoder._lon_div // target._lon_div
+        if length == code_length or (
+            south <= lat * rows
+            and (lat + 1) * rows - 1 <= north
+            and west <= lon * cols
+            and (lon + 1) * cols - 1 <= east
+        ):
+            cells.append((key, lat, lon, length))
+            return
+        child = lengths[depth + 1]
+        stride = SUBTREE_SIZE[child]
+        fy, fx = _SPLIT[length]
+        s, n, w, e = ranges[child]
+        for y in range(max(s, lat * fy), min(n, lat * fy + fy - 1) + 1):
+            for x in range(max(w, lon * fx), min(e, lon * fx + fx - 1) + 1):
+                group = (y - lat * fy) * fx + x - lon * fx
+                visit(depth + 1, y, x, key + 1 + group * stride)
+
+    s, n, w, e = ranges[lengths[0]]
+    for lat in range(s, n + 1):
+        for lon in range(w, e + 1):
+            visit(0, lat, lon, (lat * _FIRST_LON_DIGITS + lon) * SUBTREE_SIZE[2])
+    return cells
+
+
+def _merge(cells: list[tuple[int, int, int, int]]) -> list[tuple[int, int]]:
+    ranges = []
+    for key, _, _, length in cells:
+        start, end = key, key + SUBTREE_SIZE[length]
+        if ranges:
+            # A first child follows the key of its parent, which can be
+            # absorbed, being shorter than any code of the planned length.
+            prev = ranges[-1][1]
+            while start > prev:
+                ancestors = lineage(start)
+                if len(ancestors) < 2 or ancestors[-2] != start - 1:
+                    break
+                start -= 1
+            if start == prev:
+                ranges[-1] = (ranges[-1][0], end)
+                continue
+        ranges.append((key, end))
+    return ranges
+
+
+def _box(area: Area | AreaView) -> _Box:
+    return _Box(area.sw.lat, area.sw.lon, area.ne.lat, area.ne.lon)
+
+
+def key_ranges(
+    area: Area | AreaView, code_length: int = 10, max_ranges: int | None = None
+) -> list[tuple[int, int]]:
+    """
+    Sorted, disjoint [start, end) ranges of packed keys that contain the
+    keys of exactly the codes of the input length whose cells intersect the
+    box, along with their descendants. Ranges may also contain keys of
+    shorter codes where that lets adjacent ranges merge.
+
+    Args:
+        area: The box, which may not cross the antimeridian.
+        code_length: The length of the codes to enumerate.
+        max_ranges: If given, the plan is coarsened to shorter code lengths,
+            and as a last resort to a single range, until it has at most
+            this many ranges. A coarsened plan also contains codes of the
+            input length outside of the box.
+
+    Raises:
+        ValueError: If the code length is invalid or the box inverted.
+    """
+    if max_ranges is not None and max_ranges < 1:
+        raise ValueError(f"max_ranges must be positive: {max_ranges=}")
+    box = _box(area)
+    ranges = _merge(_plan(box, code_length))
+    length = code_length
+    while max_ranges is not None and len(ranges) > max_ranges:
+        if length == LENGTHS[0]:
+            return [(ranges[0][0], ranges[-1][1])]
+        length = LENGTHS[LENGTHS.index(length) - 1]
+        ranges = _merge(_plan(box, length))
+    return ranges
+
+
+def prefixes(
+    area: Area | AreaView, code_length: int = 10, max_prefixes: int | None = None
+) -> list[str]:
+    """
+    Sorted code prefixes, such as '8FVC9G' or '8FVC9G8F+6X', that the codes of
+    the input length whose cells intersect the box, and only those, start
+    with.
+
+    Args:
+        area: The box, which may not cross the antimeridian.
+        code_length: The length of the codes to enumerate.
+        max_prefixes: If given, the plan is coarsened to shorter code
+            lengths until it has at most this many prefixes, or reaches
+            length 2.
+
+    Raises:
+        ValueError: If the code length is invalid or the box inverted.
+    """
+    if max_prefixes is not None and max_prefixes < 1:
+        raise ValueError(f"max_prefixes must be positive: {max_prefixes=}")
+    box = _box(area)
+    cells = _plan(box, code_length)
+    length = code_length
+    while max_prefixes is not None and len(cells) > max_prefixes:
+        if length == LENGTHS[0]:
+            break
+        length = LENGTHS[LENGTHS.index(length) - 1]
+        cells = _plan(box, length)
+
+    codes = []
+    for _, lat, lon, length in cells:
+        encoder = Encoders[length]
+        code = encoder._code(lat * encoder._lat_div, lon * encoder._lon_div)
+        codes.append(code[: length + (length > Base.SEP_POSITION)])
+    return codes
@@ -0,0 +1,150 @@
+"""
+Row parsing and chunked encoding and decoding, shared by the command line
+and the parallel file encoder.
+
+In the lines format, each line holds either a code, or a latitude and a
+longitude separated by a comma or whitespace. Rows of the CSV and TSV formats
+are split by the csv module. Blank lines are skipped, and rows are numbered
+by their source line for error messages.
+"""
+import csv
+from itertools import islice
+from math import isfinite
+from typing import Iterable, Iterator, TextIO
+
+from .decoder import decode_bounds, decode_center
+from .encoder import Encoders
+from .validator import Validator
+
+FORMATS = ("lines", "csv", "tsv")
+
+# The field delimiter of each format, also used when writing rows.
+DELIMITERS = {"lines": ",", "csv": ",", "tsv": "\t"}
+
+
+class RowError(ValueError):
+    """An input row that cannot be processed."""
+
+    def __init__(self, row: int, message: str):
+        super().__init__(f"row {row}: {message}")
+        self.row = row
+        self.message = message
+
+    def __reduce__(self):
+        # Raised in worker processes, so it must survive pickling.
+        return type(self), (self.row, self.message)
+
+
+def read_lines(paths: list[str], stdin: TextIO) -> Iterator[str]:
+    """Lazily chain the lines of the input files, where "-" is stdin."""
+    for path in paths or ["-"]:
+        if path == "-":
+            yield from stdin
+        else:
+            with open(path, newline="") as f:
+                yield from f
+
+
+def read_rows(
+    lines: Iterable[str], fmt: str, start: int = 1
+) -> Iterator[tuple[int, list[str]]]:
+    """
+    Split lines into (line number, fields) rows, skipping blank lines, where
+    start is the number of the first line.
+    """
+    if fmt == "lines":
+        for number, line in enumerate(lines, start):
+            fields = line.replace(",", " ").split()
+            if fields:
+                yield number, fields
+        return
+    reader = csv.reader(lines, delimiter=DELIMITERS[fmt])
+    for fields in reader:
+        if fields:
+            yield start - 1 + reader.line_num, fields
+
+
+def chunked(rows: Iterable, size: int) -> Iterator[list]:
+    """Split rows into lists of at most size rows."""
+    rows = iter(rows)
+    while chunk := list(islice(rows, size)):
+        yield chunk
+
+
+def _encode(lats: list[float], lons: list[float], code_length: int) -> list[str]:
+    """Encode with vectorized.encode when numpy is installed."""
+    try:
+        from . import vectorized
+    except ImportError:
+        return Encoders[code_length].encode_many(lats, lons)
+    return vectorized.encode(lats, lons, code_length).tolist()
+
+
+def encode_chunk(
+    chunk: list[tuple[int, list[str]]],
+    lat_col: int,
+    lon_col: int,
+    code_length: int,
+    skip_invalid: bool = False,
+) -> list[str]:
+    """Encode the selected columns of a chunk of numbered rows. Rows without
+    finite coordinates produce empty codes when skip_invalid is set.
+    """
+    try:
+        lats = [float(row[lat_col]) for _, row in chunk]
+        lons = [float(row[lon_col]) for _, row in chunk]
+        valid = isfinite(sum(lats)) and isfinite(sum(lons))
+    except (ValueError, IndexError):
+        valid = False
+    if valid:
+        return _encode(lats, lons, code_length)
+
+    # Locate the invalid rows, which the sums above may also flag when
+    # finite values overflow.
+    lats, lons, kept = [], [], []
+    for i, (number, row) in enumerate(chunk):
+        try:
+            lat, lon = float(row[lat_col]), float(row[lon_col])
+            if not (isfinite(lat) and isfinite(lon)):
+                raise ValueError(f"Non-finite location: {lat=}, {lon=}")
+        except (ValueError, IndexError) as e:
+            if skip_invalid:
+                continue
+            raise RowError(number, str(e))
+        lats.append(lat)
+        lons.append(lon)
+        kept.append(i)
+    codes = [""] * len(chunk)
+    for i, code in zip(kept, _encode(lats, lons, code_length)):
+        codes[i] = code
+    return codes
+
+
+def decode_chunk(
+    chunk: list[tuple[int, list[str]]],
+    code_col: int,
+    center: bool,
+    skip_invalid: bool = False,
+) -> list[list[float]]:
+    """Decode the selected column of a chunk of numbered rows into bounds,
+    followed by the center if requested. Rows without a valid code produce
+    empty rows when skip_invalid is set.
+    """
+    is_full = Validator().is_full
+    results = []
+    append = results.append
+    for number, row in chunk:
+        try:
+            code = row[code_col].strip().upper()
+            if not is_full(code):
+                raise ValueError(f"Invalid full code: {code=}")
+        except (ValueError, IndexError) as e:
+            if skip_invalid:
+                append([])
+                continue
+            raise RowError(number, str(e))
+        bounds = decode_bounds(code)
+        if center:
+            bounds += decode_center(code)
+        append(bounds)
+    return results
@@ -1,12 +1,11 @@
 """Transformations on short codes."""
-import re
-from typing import Tuple
+from typing import Iterable, Tuple
 
 from .base import Base
 from .decoder import Decoder
 from .encoder import Encoder
 from .geo import Point
-from .validator import Validator
+from .validator import CodeKind, Validator, classify, classify_many
 
 
 def normalize_lat(lat: float) -> float:
@@ -59,10 +58,11 @@ class Transformer(Base):
           unchanged.
         """
         code = code.upper()
+        kind = classify(code)
         # if code is a valid full code, return it properly capitalized
-        if self.validator.is_full(code):
-            return code.upper()
-        if not self.validator.is_short(code):
+        if kind >= CodeKind.FULL:
+            return code
+        if kind != CodeKind.SHORT:
             raise ValueError("Passed short code is not valid - " + str(code))
 
         # Ensure that latitude and longitude are valid.
@@ -105,6 +105,98 @@ class Transformer(Base):
         # return self.encoder.encode(c_lat, c_lon, codeArea.code_length)
         return self.encoder.encode(c_lat, c_lon)
 
+    def recover_many(
+        self, codes: Iterable[str], ref: Point | Tuple[float, float]
+    ) -> tuple[list[str | None], bytearray]:
+        """
+        Recover many short codes relative to the same reference location.
+
+        Each result is exactly what lenghten returns for the code, but the
+        reference is encoded once, and the centers of the padded codes are
+        decoded and moved by a cell in bulk, with numpy when it is installed.
+
+        Args:
+            codes: Short codes, or full codes which are returned upper cased.
+            ref: The reference location.
+
+        Returns:
+            The recovered codes, and a mask that is 1 for each code that is
+            neither a valid short nor a valid full code, and whose result is
+            None, instead of raising.
+        """
+        if isinstance(ref, tuple):
+            ref = Point(*ref)
+        ref_code = self.encoder.encode(ref.lat, ref.lon)
+        sep, sep_pos = self.SEP, self.SEP_POSITION
+
+        results: list[str | None] = []
+        errors = bytearray()
+        # The padded short codes, their rows and their padding lengths.
+        padded, rows, pads = [], [], []
+        for i, code in enumerate(codes):
+            code = code.upper()
+            kind = classify(code)
+            if kind >= CodeKind.FULL:
+                results.append(code)
+                errors.append(0)
+            elif kind == CodeKind.SHORT:
+                pad = sep_pos - code.find(sep)
+                padded.append(ref_code[:pad] + code)
+                rows.append(i)
+                pads.append(pad)
+                results.append(None)
+                errors.append(0)
+            else:
+                results.append(None)
+                errors.append(1)
+
+        if padded:
+            for i, code in zip(rows, self._recover(padded, pads, ref)):
+                results[i] = code
+        return results, errors
+
+    def _recover(self, padded: list[str], pads: list[int], ref: Point) -> list[str]:
+        """Move the centers of padded short codes to the cell nearest to the
+        reference, as in lenghten, and encode them.
+        """
+        resolutions = {pad: pow(20, 2 - (pad / 2)) for pad in set(pads)}
+        max_lat = self.MAX_LAT
+        try:
+            import numpy as np
+
+            from . import vectorized
+        except ImportError:
+            codes = []
+            decode_center, encode = self.decoder.decode_center, self.encoder.encode
+            for code, pad in zip(padded, pads):
+                resolution = resolutions[pad]
+                half = resolution / 2.0
+                c_lat, c_lon = decode_center(code)
+                if ref.lat + half < c_lat and c_lat - resolution >= -max_lat:
+                    c_lat -= resolution
+                elif ref.lat - half > c_lat and c_lat + resolution <= max_lat:
+                    c_lat += resolution
+                if ref.lon + half < c_lon:
+                    c_lon -= resolution
+                elif ref.lon - half > c_lon:
+                    c_lon += resolution
+                codes.append(encode(c_lat, c_lon))
+            return codes
+
+        centers = vectorized.decode(padded, center=True)
+        c_lat, c_lon = centers["center_lat"], centers["center_lon"]
+        resolution = np.array([resolutions[pad] for pad in pads])
+        half = resolution / 2.0
+        south = (ref.lat + half < c_lat) & (c_lat - resolution >= -max_lat)
+        north = ~south & (ref.lat - half > c_lat) & (c_lat + resolution <= max_lat)
+        c_lat = np.where(south, c_lat - resolution, c_lat)
+        c_lat = np.where(north, c_lat + resolution, c_lat)
+        west = ref.lon + half < c_lon
+        east = ~west & (ref.lon - half > c_lon)
+        c_lon = np.where(west, c_lon - resolution, c_lon)
+        c_lon = np.where(east, c_lon + resolution, c_lon)
+        return vectorized.encode(c_lat, c_lon, self.encoder.code_length).tolist()
+
     def shorten(self, code, ref: Point | Tuple[float, float]) -> str:
         """
         Remove characters from the start of an OLC code.
@@ -128,9 +220,10 @@ class Transformer(Base):
           Either the original code, if the reference location was not close enough,
           or the .
         """
-        if not self.validator.is_full(code):
+        kind = classify(code)
+        if kind < CodeKind.FULL:
             raise ValueError(f"Passed code is not valid and full: {code=}")
-        if self.PADDING_CHAR in code:
+        if kind == CodeKind.PADDED:
             raise ValueError(f"Cannot shorten padded codes: {code=}")
 
         if isinstance(ref, tuple):
@@ -139,7 +232,8 @@ class Transformer(Base):
         code = code.upper()
         area = self.decoder.decode(code)
 
-        if len(re.sub("[+0]", "", code)) < self.MIN_TRIMMABLE_CODE_LEN:
+        # Unpadded full codes have one separator and only digits otherwise.
+        if len(code) - 1 < self.MIN_TRIMMABLE_CODE_LEN:
             raise ValueError(
                 f"Code length must be at least {self.MIN_TRIMMABLE_CODE_LEN}"
             )
@@ -156,3 +250,107 @@ class Transformer(Base):
                 # Trim it.
                 return code[(i + 1) * 2 :]
         return code
+
+    def shorten_many(
+        self, codes: Iterable[str], ref: Point | Tuple[float, float]
+    ) -> tuple[list[str | None], bytearray]:
+        """
+        Shorten many full codes relative to the same reference location.
+
+        Each result is exactly what shorten returns for the code, but each
+        code is validated once, and the code centers are decoded in bulk, with
+        numpy when it is installed.
+
+        Args:
+            codes: Full, unpadded codes of at least MIN_TRIMMABLE_CODE_LEN
+                digits.
+            ref: The reference location.
+
+        Returns:
+            The shortened codes, and a mask that is 1 for each code that
+            shorten would reject, and whose result is None, instead of raising.
+        """
+        if isinstance(ref, tuple):
+            ref = Point(*ref)
+        min_length = self.MIN_TRIMMABLE_CODE_LEN + 1
+
+        results: list[str | None] = []
+        errors = bytearray()
+        full, rows = [], []
+        codes = list(codes)
+        for i, (code, kind) in enumerate(zip(codes, classify_many(codes))):
+            if kind == CodeKind.FULL and len(code) >= min_length:
+                full.append(code.upper())
+                rows.append(i)
+                errors.append(0)
+            else:
+                errors.append(1)
+            results.append(None)
+
+        if full:
+            for i, code in zip(rows, self._shorten(full, ref)):
+                results[i] = code
+        return results, errors
+
+    def _shorten(self, codes: list[str], ref: Point) -> list[str]:
+        """Trim valid full codes by their center's distance to the reference,
+        as in shorten.
+        """
+        # Candidate trims and the ranges below which they apply, tightest
+        # first.
+        trims = [
+            ((i + 1) * 2, self.PAIR_RESOLUTIONS[i] * 0.3)
+            for i in range(len(self.PAIR_RESOLUTIONS) - 2, 0, -1)
+        ]
+        try:
+            import numpy as np
+
+            from . import vectorized
+        except ImportError:
+            shortened = []
+            decode_center = self.decoder.decode_center
+            for code in codes:
+                c_lat, c_lon = decode_center(code)
+                coderange = max(abs(c_lat - ref.lat), abs(c_lon - ref.lon))
+                for trim, limit in trims:
+                    if coderange < limit:
+                        code = code[trim:]
+                        break
+                shortened.append(code)
+            return shortened
+
+        centers = vectorized.decode(codes, center=True)
+        coderange = np.maximum(
+            np.abs(centers["center_lat"] - ref.lat),
+            np.abs(centers["center_lon"] - ref.lon),
+        )
+        cut = np.select(
+            [coderange < limit for _, limit in trims], [trim for trim, _ in trims], 0
+        )
+        return [code[trim:] for code, trim in zip(codes, cut.tolist())]
+
+
+# Shared by the module level functions, since transformers are stateless.
+_transformer = Transformer()
+
+
+def recover_many(
+    codes: Iterable[str], ref: Point | Tuple[float, float]
+) -> tuple[list[str | None], bytearray]:
+    """
+    Recover many short codes relative to the same reference location,
+    returning the codes and a mask of invalid inputs. See
+    Transformer.recover_many.
+    """
+    return _transformer.recover_many(codes, ref)
+
+
+def shorten_many(
+    codes: Iterable[str], ref: Point | Tuple[float, float]
+) -> tuple[list[str | None], bytearray]:
+    """
+    Shorten many full codes relative to the same reference location,
+    returning the codes and a mask of rejected inputs. See
+    Transformer.shorten_many.
+    """
+    return _transformer.shorten_many(codes, ref)
@@ -1,9 +1,129 @@
+import re
+from enum import IntEnum
+from typing import Iterable
+
 from .base import Base
 
 
+class CodeKind(IntEnum):
+    """The classification of a string as a Plus Code."""
+
+    # Not a valid code.
+    INVALID = 0
+    # A valid code that is neither short nor full, e.g., '+2VX', or a code
+    # whose first pair is out of range, such as 'WC000000+'.
+    VALID = 1
+    # A short code, with the separator before the eighth digit.
+    SHORT = 2
+    # A full code without padding.
+    FULL = 3
+    # A full code with padding, e.g., '8FVC0000+'.
+    PADDED = 4
+
+
+def _pattern() -> re.Pattern:
+    """
+    The language accepted by the is_valid, is_short and is_full rules, with
+    one named alternative per kind, so one match classifies a code.
+
+    Valid codes have a single separator at an even position up to the
+    eighth, are not a lone separator, and do not end in a single digit after
+    the separator. Padding is one even-length group of zeros before a final
+    separator at the eighth position, and may not start the code.
+    """
+
+    def chars(alphabet: str) -> str:
+        # Character classes match both cases, which is faster than
+        # re.IGNORECASE.
+        return f"[{alphabet}{alphabet.lower()}]"
+
+    digit, padded = chars(Base.ALPHABET), chars(Base.ALPHABET + Base.PADDING_CHAR)
+    lat = chars(Base.ALPHABET[: 2 * Base.MAX_LAT // Base.ENCODING_BASE])
+    lon = chars(Base.ALPHABET[: 2 * Base.MAX_LON // Base.ENCODING_BASE])
+    sep, pad, pos = re.escape(Base.SEP), Base.PADDING_CHAR, Base.SEP_POSITION
+    tail = f"(?:{digit}{{2,}})?"
+    # One group of an even number of zeros among the digits before a final
+    # separator at pos.
+    zeros = f"{digit}*(?:{pad}{pad})+{digit}*{sep}"
+    return re.compile(
+        "|".join(
+            [
+                f"(?P<FULL>{lat}{lon}{digit}{{{pos - 2}}}{sep}{tail})",
+                f"(?P<SHORT>(?:{digit}{digit}){{1,{pos // 2 - 1}}}{sep}{tail})",
+                f"(?P<PADDED>{lat}{lon}(?={padded}{{{pos - 2}}}{sep}$){zeros})",
+                f"(?P<VALID>{digit}{{{pos}}}{sep}{tail}|{sep}{digit}{{2,}}"
+                f"|{digit}(?={padded}{{{pos - 1}}}{sep}$){zeros})",
+            ]
+        )
+    )
+
+
+def _full_pattern() -> re.Pattern:
+    """
+    Full codes of the lengths with integer keys, 2 through 15 digits: eight
+    digits followed by the separator and up to seven more, or fewer pairs of
+    digits padded up to the separator.
+    """
+    digit = f"[{Base.ALPHABET}{Base.ALPHABET.lower()}]"
+    lat = Base.ALPHABET[: 2 * Base.MAX_LAT // Base.ENCODING_BASE]
+    lon = Base.ALPHABET[: 2 * Base.MAX_LON // Base.ENCODING_BASE]
+    sep, pad, pos = re.escape(Base.SEP), Base.PADDING_CHAR, Base.SEP_POSITION
+    extra = Base.MAX_CODE_LENGTH - pos
+    padded = "|".join(
+        f"{digit}{{{n}}}{pad * (pos - 2 - n)}" for n in range(pos - 4, -1, -2)
+    )
+    return re.compile(
+        f"[{lat}{lat.lower()}][{lon}{lon.lower()}]"
+        f"(?:{digit}{{{pos - 2}}}{sep}(?:{digit}{{2,{extra}}})?|(?:{padded}){sep})"
+    )
+
+
+_PATTERN = _pattern()
+_FULL_PATTERN = _full_pattern()
+_KINDS = {kind.name: kind for kind in CodeKind}
+
+
+def _full_digits(code: str) -> str:
+    """
+    The significant digits of a full code of a valid length, upper cased.
+    Shared by the modules that parse codes into keys and cells.
+
+    Raises:
+        ValueError: If the input is not a full code of a valid length.
+    """
+    if _FULL_PATTERN.fullmatch(code) is None:
+        raise ValueError(f"Invalid full code: {code=}")
+    pos = Base.SEP_POSITION
+    return (code[:pos].rstrip(Base.PADDING_CHAR) + code[pos + 1 :]).upper()
+
+
+def classify(code: str) -> CodeKind:
+    """Classify a string as an invalid, valid, short, full or padded code, in
+    a single match, ignoring case.
+    """
+    match = _PATTERN.fullmatch(code)
+    return _KINDS[match.lastgroup] if match else CodeKind.INVALID
+
+
+def classify_many(codes: Iterable[str]) -> bytearray:
+    """Classify many strings, returning one CodeKind value per string."""
+    fullmatch, kinds = _PATTERN.fullmatch, _KINDS
+    return bytearray(
+        kinds[match.lastgroup] if match else 0 for match in map(fullmatch, codes)
+    )
+
+
 class Validator(Base):
     """Perform validation operations on a Plus Code."""
 
+    def classify(self, code: str) -> CodeKind:
+        """Classify a string as a Plus Code. See the module level classify."""
+        return classify(code)
+
+    def classify_many(self, codes: Iterable[str]) -> bytearray:
+        """Classify many strings. See the module level classify_many."""
+        return classify_many(codes)
+
     def is_valid(self, code: str) -> bool:
         """
         Determines if a Plus code is valid.
@@ -11,49 +131,7 @@ class Validator(Base):
         set with at most one separator. The separator can be in any even-numbered
         position up to the eighth digit.
         """
-        code = code.upper()
-
-        # Is it the only character?
-        if len(code) == 1 or code.count(self.SEP) > 1:
-            return False
-
-        # The separator is required.
-        sep = code.find(self.SEP)
-
-        # Is it in an illegal position?
-        if sep == -1 or sep > self.SEP_POSITION or sep % 2 == 1:
-            return False
-
-        # We can have an even number of padding characters before the separator,
-        # but then it must be the final character.
-        pad = code.find(self.PADDING_CHAR)
-        if pad != -1:
-            # Short codes cannot have padding
-            if sep < self.SEP_POSITION:
-                return False
-            # Not allowed to start with them!
-            if pad == 0:
-                return False
-
-            # There can only be one group and it must have even length.
-            rpad = code.rfind(self.PADDING_CHAR) + 1
-            pads = code[pad:rpad]
-            if len(pads) % 2 == 1 or pads.count(self.PADDING_CHAR) != len(pads):
-                return False
-            # If the code is long enough to end with a separator, make sure it does.
-            if not code.endswith(self.SEP):
-                return False
-
-        # If there are characters after the separator, make sure there isn't just
-        # one of them (not legal).
-        if len(code) - sep - 1 == 1:
-            return False
-
-        # Check the code contains only valid characters.
-        for ch in code:
-            if ch not in self.VALID_CHARS:
-                return False
-        return True
+        return _PATTERN.fullmatch(code) is not None
 
     def is_short(self, code: str) -> bool:
         """
@@ -62,8 +140,8 @@ class Validator(Base):
         digits from an Open Location Code. It must include a separator
         character.
         """
-        pos = self.SEP_POSITION
-        return self.is_valid(code) and (0 < code.find(self.SEP) < pos)
+        match = _PATTERN.fullmatch(code)
+        return match is not None and match.lastgroup == "SHORT"
 
     def is_full(self, code: str) -> bool:
         """
@@ -74,16 +152,5 @@ class Validator(Base):
         character is present, it must be the first character. If the separator
         character is present, it must be after four characters.
         """
-        if not self.is_valid(code) or self.is_short(code):
-            return False
-
-        idx = self.ALPHABET_INDEX
-
-        # Fetch initial values for lat and lon.
-        first_lat = idx[code[0]] * self.ENCODING_BASE
-        first_lon = idx[code[1]] * self.ENCODING_BASE
-
-        res = True
-        if (first_lat >= self.MAX_LAT * 2) or (first_lon >= self.MAX_LON * 2):
-            res = False
-        return res
+        match = _PATTERN.fullmatch(code)
+        return match is not None and match.lastgroup in ("FULL", "PADDED")
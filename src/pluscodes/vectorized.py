@@ -0,0 +1,428 @@
+"""
+NumPy vectorized Plus Code operations over coordinate arrays.
+
+Each function performs the same integer arithmetic as its scalar counterpart,
+but as whole-array operations, and returns exactly the same values.
+
+Requires numpy, which is an optional dependency:
+
+    pip install pluscodes[numpy]
+"""
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .base import Base
+from .encoder import Encoder, Encoders
+from .packed import _FIRST_LON_DIGITS, _STRIDES, LENGTHS, MAX_KEY
+
+# The code alphabet as lookup tables of byte and UCS4 character codes.
+_ALPHABET = {
+    "S": np.frombuffer(Base.ALPHABET.encode("ascii"), dtype=np.uint8),
+    "U": np.frombuffer(Base.ALPHABET.encode("utf-32-le"), dtype=np.uint32),
+}
+
+# Python's round(x, 6) carries into the next integer exactly when the
+# fractional part of x is at least this float (the nearest float to 0.9999995
+# lies above the decimal value, and no float equals the decimal value).
+_ROUND_UP_FRACTION = 0.9999995
+
+_INT32_MAX = np.iinfo(np.int32).max
+
+# Maps a character code to its digit value. Separator and padding characters
+# are skipped (-1) and anything else is invalid (-2), except NUL which pads
+# fixed width numpy strings.
+_SKIP, _INVALID = -1, -2
+_DIGITS = np.full(256, _INVALID, dtype=np.int8)
+for _i, _c in enumerate(Base.ALPHABET):
+    _DIGITS[ord(_c)] = _DIGITS[ord(_c.lower())] = _i
+for _c in (Base.SEP, Base.PADDING_CHAR, "\0"):
+    _DIGITS[ord(_c)] = _SKIP
+
+# Place values of the pair and grid digits, most significant first.
+_PAIR_PLACE_VALUES = Base.ENCODING_BASE ** np.arange(4, -1, -1, dtype=np.int64)
+_ROW_PLACE_VALUES = Base.GRID_ROWS ** np.arange(4, -1, -1, dtype=np.int64)
+_COL_PLACE_VALUES = Base.GRID_COLUMNS ** np.arange(4, -1, -1, dtype=np.int64)
+
+# Splits a float into two halves with at most 26 significant bits each.
+_SPLITTER = 2.0**27 + 1
+_ROUND_SCALE = 1e14
+
+
+# The digits of a code only depend on the scaled integer latitude and
+# longitude modulo these, which exceed the scaled range of valid locations.
+_LAT_MODULUS = Base.ENCODING_BASE**5 * Base.GRID_ROWS**Base.GRID_CODE_LENGTH
+_LON_MODULUS = Base.ENCODING_BASE**5 * Base.GRID_COLUMNS**Base.GRID_CODE_LENGTH
+
+
+def _scale(values: np.ndarray, precision: int, modulus: int) -> np.ndarray:
+    """
+    Vectorized, exact equivalent of int(round(values * precision, 6)) modulo
+    modulus.
+
+    Encoder.encode computes with unbounded integers, so out of range inputs
+    are reduced here, exactly in floating point, instead of overflowing int64.
+    """
+    scaled = values * precision
+    if not np.isfinite(scaled).all():
+        i = np.flatnonzero(~np.isfinite(scaled))[0]
+        raise ValueError(f"Location out of range: {values[i]}")
+    if (scaled < 0).any():
+        # Only reachable for out of range inputs, where int() truncates.
+        mag = np.abs(scaled)
+        whole = np.floor(mag)
+        whole += (mag - whole) >= _ROUND_UP_FRACTION
+        whole = np.copysign(whole, scaled)
+    else:
+        whole = np.floor(scaled)
+        whole += (scaled - whole) >= _ROUND_UP_FRACTION
+    # Integral floats, whose floored remainders are exact.
+    return np.mod(whole, modulus).astype(np.int64)
+
+
+def _split(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Veltkamp splitting: values == hi + lo with hi * hi exact."""
+    t = values * _SPLITTER
+    hi = t - (t - values)
+    return hi, values - hi
+
+
+def _round14(values: np.ndarray) -> np.ndarray:
+    """
+    Vectorized, exact equivalent of round(values, 14).
+
+    Python rounds the exact binary value half to even at the 14th decimal and
+    returns the nearest float. numpy's own rounding scales by 1e14 in floating
+    point, so the product and its error term are tracked separately here.
+    """
+    # The gap between floats of magnitude >= 64 exceeds 1e-14, so the decimal
+    # rounding is always nearest to the input itself.
+    small = np.abs(values) < 64
+
+    # Whenever |scaled| < 2**53 its gap is at most 1 and the product's error
+    # term at most half that gap, so rint(scaled) can only be off when scaled
+    # lands exactly on a half integer, or when the gap is 1 (|scaled| >= 2**52)
+    # and the error term is exactly one half.
+    scaled = values * _ROUND_SCALE
+    whole = np.rint(scaled)
+    frac = scaled - whole
+    suspect = np.flatnonzero(
+        small & ((np.abs(frac) == 0.5) | ((frac == 0) & (np.abs(scaled) >= 2.0**52)))
+    )
+    if suspect.size:
+        # Dekker's product: scaled + err == values * 1e14 exactly.
+        x_hi, x_lo = _split(values[suspect])
+        s_hi, s_lo = _split(np.float64(_ROUND_SCALE))
+        f, w = frac[suspect], whole[suspect]
+        err = ((x_hi * s_hi - scaled[suspect]) + x_hi * s_lo + x_lo * s_hi) + (
+            x_lo * s_lo
+        )
+        odd = w % 2 == 1
+        w += ((f == 0.5) & (err > 0)) | ((f == 0) & (err == 0.5) & odd)
+        w -= ((f == -0.5) & (err < 0)) | ((f == 0) & (err == -0.5) & odd)
+        whole[suspect] = w
+    return np.where(small, whole / _ROUND_SCALE, values)
+
+
+def _narrow(values: np.ndarray) -> np.ndarray:
+    """Downcast to int32 when possible, where division is much faster."""
+    if values.dtype != np.int32 and np.abs(values).max(initial=0) <= _INT32_MAX:
+        return values.astype(np.int32)
+    return values
+
+
+def _cells(
+    lat_array: ArrayLike, lon_array: ArrayLike, encoder: Encoder
+) -> tuple[tuple, np.ndarray, np.ndarray]:
+    """The input shape and the flattened integer cells of the locations at the
+    encoder's code length, as computed by Encoder.encode.
+    """
+    lat = np.asarray(lat_array, dtype=np.float64)
+    lon = np.asarray(lon_array, dtype=np.float64)
+    if lat.shape != lon.shape:
+        raise ValueError(f"Shape mismatch: {lat.shape=}, {lon.shape=}")
+    shape = lat.shape
+    lat = lat.ravel()
+    lon = lon.ravel()
+    # Encoder.encode fails to convert non-finite values to integers.
+    finite = np.isfinite(lat) & np.isfinite(lon)
+    if not finite.all():
+        i = np.flatnonzero(~finite)[0]
+        raise ValueError(f"Non-finite location: lat={lat[i]}, lon={lon[i]}")
+
+    # Same edge handling as Encoder.encode.
+    lat = np.where(lat == 90, lat - encoder._lat_precision, lat)
+    lon = np.where(lon == 180, -180.0, lon)
+
+    latVal = _scale(lat + Base.MAX_LAT, Base.FINAL_LAT_PRECISION, _LAT_MODULUS)
+    lngVal = _scale(lon + Base.MAX_LON, Base.FINAL_LON_PRECISION, _LON_MODULUS)
+    return shape, latVal // encoder._lat_div, lngVal // encoder._lon_div
+
+
+def encode(
+    lat_array: ArrayLike,
+    lon_array: ArrayLike,
+    code_length: int = 10,
+    dtype: str = "U",
+) -> np.ndarray:
+    """
+    Encode arrays of locations into Plus Codes.
+
+    Equivalent to calling Encoder.encode on each pair of coordinates.
+
+    Args:
+      lat_array: Latitudes in signed decimal degrees.
+      lon_array: Longitudes in signed decimal degrees, with the same shape as
+          lat_array.
+      code_length: The number of significant digits in the output codes.
+      dtype: Either "U" for a fixed width unicode array or "S" for a fixed
+          width bytes array.
+
+    Returns:
+      An array of codes with the same shape as the inputs.
+    """
+    try:
+        encoder = Encoders[code_length]
+    except KeyError:
+        raise ValueError("code_length must be between 6 and 15, inclusive.")
+    if dtype not in ("U", "S"):
+        raise ValueError(f"dtype must be 'U' or 'S': {dtype=}")
+
+    shape, latVal, lngVal = _cells(lat_array, lon_array, encoder)
+    latVal = _narrow(latVal)
+    lngVal = _narrow(lngVal)
+
+    # Digits are written into a (width, n) buffer so that each digit fills a
+    # contiguous row, and transposed once at the end. Remainders are computed
+    # from the quotient since integer division by a scalar is far cheaper
+    # than the modulo operation.
+    alphabet = _ALPHABET[dtype]
+    template = np.array([ord(c) for c in encoder._template], dtype=alphabet.dtype)
+    width = len(template)
+    out = np.empty((width, len(latVal)), dtype=alphabet.dtype)
+    out[:] = template[:, np.newaxis]
+
+    rows, cols = Base.GRID_ROWS, Base.GRID_COLUMNS
+    for slot in encoder._grid_slots:
+        latQuot = latVal // rows
+        lngQuot = lngVal // cols
+        out[slot] = alphabet[(latVal - latQuot * rows) * cols + lngVal - lngQuot * cols]
+        latVal = _narrow(latQuot)
+        lngVal = _narrow(lngQuot)
+
+    base = Base.ENCODING_BASE
+    for lat_slot, lon_slot in encoder._pair_slots:
+        latQuot = latVal // base
+        lngQuot = lngVal // base
+        out[lon_slot] = alphabet[lngVal - lngQuot * base]
+        out[lat_slot] = alphabet[latVal - latQuot * base]
+        latVal = latQuot
+        lngVal = lngQuot
+
+    return np.ascontiguousarray(out.T).view(f"{dtype}{width}").reshape(shape)
+
+
+def encode_int(
+    lat_array: ArrayLike, lon_array: ArrayLike, code_length: int = 10
+) -> np.ndarray:
+    """
+    Encode arrays of locations into the packed integer keys of their codes.
+
+    Equivalent to calling Encoder.encode_int on each pair of coordinates
+    within [-90, 90] x [-180, 180]. Keys of locations outside of that range
+    are unspecified.
+
+    Returns:
+      A uint64 array of keys with the same shape as the inputs.
+    """
+    try:
+        encoder = Encoders[code_length]
+    except KeyError:
+        raise ValueError(f"Invalid code length: {code_length=}")
+
+    shape, latVal, lngVal = _cells(lat_array, lon_array, encoder)
+    latVal = _narrow(latVal)
+    lngVal = _narrow(lngVal)
+
+    # Sum the digit groups times the strides of their levels, least
+    # significant first. Level i contributes 1 + group * stride, less the one
+    # added for the root.
+    levels = encoder._n_pairs + encoder._n_grid
+    keys = np.full(len(latVal), levels - 1, dtype=np.uint64)
+    strides = iter(_STRIDES[levels - 1 :: -1])
+    rows, cols = Base.GRID_ROWS, Base.GRID_COLUMNS
+    for _ in range(encoder._n_grid):
+        latQuot = latVal // rows
+        lngQuot = lngVal // cols
+        group = (latVal - latQuot * rows) * cols + lngVal - lngQuot * cols
+        keys += group.astype(np.uint64) * np.uint64(next(strides))
+        latVal = _narrow(latQuot)
+        lngVal = _narrow(lngQuot)
+
+    base = Base.ENCODING_BASE
+    for _ in range(encoder._n_pairs - 1):
+        latQuot = latVal // base
+        lngQuot = lngVal // base
+        group = (latVal - latQuot * base) * base + lngVal - lngQuot * base
+        keys += group.astype(np.uint64) * np.uint64(next(strides))
+        latVal = latQuot
+        lngVal = lngQuot
+    # The first pair only spans 18 longitude digits.
+    group = (latVal % base) * _FIRST_LON_DIGITS + lngVal % base
+    keys += group.astype(np.uint64) * np.uint64(next(strides))
+    return keys.reshape(shape)
+
+
+def decode(codes: ArrayLike, center: bool = False) -> np.ndarray:
+    """
+    Decode an array of valid, full Plus Codes into their bounds.
+
+    Equivalent to calling Decoder.decode on each code, without allocating
+    Point and Area objects. No explicit validation checks are performed, but
+    characters outside the code alphabet raise a ValueError.
+
+    Args:
+      codes: Code strings or bytes, e.g., a list or a numpy U, S or object
+          array.
+      center: Whether to include the center point computed by Area.center.
+
+    Returns:
+      A structured float64 array with the same shape as the input and fields
+      sw_lat, sw_lon, ne_lat and ne_lon, followed by center_lat and
+      center_lon if requested.
+    """
+    codes = np.asarray(codes)
+    if codes.dtype.kind == "O":
+        codes = codes.astype(str)
+    if codes.dtype.kind not in ("U", "S"):
+        raise ValueError(f"Expected an array of strings: {codes.dtype=}")
+    shape = codes.shape
+    codes = np.ascontiguousarray(codes.ravel())
+    n = len(codes)
+
+    # Look up each character as an unsigned integer code.
+    width = codes.dtype.itemsize // (4 if codes.dtype.kind == "U" else 1)
+    chars = codes.view(np.uint32 if codes.dtype.kind == "U" else np.uint8)
+    chars = chars.reshape(n, width)
+    digits = _DIGITS[np.minimum(chars, 255)]
+    digits[chars > 255] = _INVALID
+    if (digits == _INVALID).any():
+        raise ValueError("Codes contain characters outside the code alphabet.")
+
+    # Drop separator and padding characters, shift the remaining digits left
+    # and constrain to the maximum number of digits. Digits are stored one
+    # per row, with zeros past the end of a code.
+    keep = digits >= 0
+    lengths = np.minimum(keep.sum(axis=1), Base.MAX_CODE_LENGTH)
+    vals = np.zeros((max(width, Base.MAX_CODE_LENGTH), n), dtype=np.int64)
+    if n and (keep == keep[0]).all():
+        # Fast path: every code has the same layout, e.g., the same length.
+        kept = np.flatnonzero(keep[0])
+        vals[: len(kept)] = digits[:, kept].T
+    else:
+        rows, cols = np.nonzero(keep)
+        vals[np.cumsum(keep, axis=1)[keep] - 1, rows] = digits[keep]
+    odd = (lengths < Base.PAIR_CODE_LENGTH) & (lengths % 2 == 1)
+    if odd.any():
+        raise ValueError("Codes with fewer than 10 digits must have even length.")
+    return _decode_digits(vals, lengths, center).reshape(shape)
+
+
+def decode_int(keys: ArrayLike, center: bool = False) -> np.ndarray:
+    """
+    Decode an array of packed integer keys into the bounds of their codes.
+
+    Equivalent to decode on the codes of the keys, without formatting them.
+
+    Args:
+      keys: Keys as unsigned 64-bit integers, e.g., a uint64 array or the
+          keys of a PlusCodeArray.
+      center: Whether to include the center point computed by Area.center.
+
+    Returns:
+      A structured float64 array as returned by decode.
+
+    Raises:
+      ValueError: If a key is outside of [0, packed.MAX_KEY).
+    """
+    keys = np.asarray(keys, dtype=np.uint64)
+    shape = keys.shape
+    keys = keys.ravel()
+    n = len(keys)
+    if n and keys.max() >= MAX_KEY:
+        raise ValueError(f"Key is out of range: {keys.max()=}")
+
+    # Unpack the digit groups as packed.to_cell does, most significant first,
+    # into the digit rows of decode.
+    vals = np.zeros((Base.MAX_CODE_LENGTH, n), dtype=np.int64)
+    group, rest = np.divmod(keys, np.uint64(_STRIDES[0]))
+    vals[0], vals[1] = np.divmod(group.astype(np.int64), _FIRST_LON_DIGITS)
+    lengths = np.full(n, LENGTHS[0], dtype=np.int64)
+    base, pairs = Base.ENCODING_BASE, Base.PAIR_CODE_LENGTH
+    for length, stride in zip(LENGTHS[1:], _STRIDES[1:]):
+        more = rest != 0
+        if not more.any():
+            break
+        # Finished codes have nothing left, and keep zero digits.
+        group, rest = np.divmod(rest - more, np.uint64(stride))
+        group = group.astype(np.int64)
+        if length <= pairs:
+            vals[length - 2], vals[length - 1] = np.divmod(group, base)
+        else:
+            vals[length - 1] = group
+        lengths[more] = length
+    return _decode_digits(vals, lengths, center).reshape(shape)
+
+
+def _decode_digits(vals: np.ndarray, lengths: np.ndarray, center: bool) -> np.ndarray:
+    """
+    The bounds of codes given as digit rows, one row per digit position and
+    zero past the end of each code, and their numbers of digits.
+    """
+    n = len(lengths)
+    # Digits past the end of a code are zero, so they contribute nothing.
+    normalLat = np.full(n, -Base.MAX_LAT * Base.PAIR_PRECISION, dtype=np.int64)
+    normalLng = np.full(n, -Base.MAX_LON * Base.PAIR_PRECISION, dtype=np.int64)
+    for i, pv in enumerate(_PAIR_PLACE_VALUES.tolist()):
+        normalLat += vals[2 * i] * pv
+        normalLng += vals[2 * i + 1] * pv
+    gridLat = np.zeros(n, dtype=np.int64)
+    gridLng = np.zeros(n, dtype=np.int64)
+    place_values = zip(_ROW_PLACE_VALUES.tolist(), _COL_PLACE_VALUES.tolist())
+    for i, (rowpv, colpv) in enumerate(place_values, start=Base.PAIR_CODE_LENGTH):
+        row = vals[i] // Base.GRID_COLUMNS
+        gridLat += row * rowpv
+        gridLng += (vals[i] - row * Base.GRID_COLUMNS) * colpv
+
+    # Place value of the last digit of each code.
+    pair_digits = Base.PAIR_CODE_LENGTH
+    n_pairs = np.minimum(lengths, pair_digits) // 2
+    pv = _PAIR_PLACE_VALUES[np.maximum(n_pairs - 1, 0)]
+    n_grid = np.maximum(lengths - pair_digits, 1)
+    latPrecision = pv / Base.PAIR_PRECISION
+    lngPrecision = latPrecision.copy()
+    has_grid = lengths > pair_digits
+    if has_grid.any():
+        latPrecision[has_grid] = (
+            _ROW_PLACE_VALUES[n_grid - 1][has_grid] / Base.FINAL_LAT_PRECISION
+        )
+        lngPrecision[has_grid] = (
+            _COL_PLACE_VALUES[n_grid - 1][has_grid] / Base.FINAL_LON_PRECISION
+        )
+
+    lat = normalLat / Base.PAIR_PRECISION + gridLat / Base.FINAL_LAT_PRECISION
+    lng = normalLng / Base.PAIR_PRECISION + gridLng / Base.FINAL_LON_PRECISION
+
+    fields = ["sw_lat", "sw_lon", "ne_lat", "ne_lon"]
+    if center:
+        fields += ["center_lat", "center_lon"]
+    out = np.empty(n, dtype=[(f, np.float64) for f in fields])
+    out["sw_lat"] = _round14(lat)
+    out["sw_lon"] = _round14(lng)
+    out["ne_lat"] = _round14(lat + latPrecision)
+    out["ne_lon"] = _round14(lng + lngPrecision)
+    if center:
+        half_lat = (out["sw_lat"] + out["ne_lat"]) / 2
+        half_lon = (out["sw_lon"] + out["ne_lon"]) / 2
+        out["center_lat"] = _round14(np.minimum(half_lat, Base.MAX_LAT))
+        out["center_lon"] = _round14(np.minimum(half_lon, Base.MAX_LON))
+    return out
@@ -0,0 +1,98 @@
+import json
+import subprocess
+import sys
+
+from pluscodes.bench import (
+    FEATURES,
+    OPERATIONS,
+    compare,
+    import_time,
+    main,
+    result_key,
+    suite,
+)
+
+
+def result(operation: str, per_sec: float, code_length: int = 10) -> dict:
+    return {
+        "operation": operation,
+        "implementation": "pluscodes",
+        "mode": "scalar",
+        "code_length": code_length,
+        "n": 1,
+        "seconds": 1 / per_sec,
+        "per_sec": per_sec,
+    }
+
+
+def test_compare():
+    baseline = [result("encode", 100.0), result("decode", 100.0)]
+    results = [result("encode", 85.0), result("decode", 95.0), result("shorten", 1.0)]
+    comparison = {c["key"]: c for c in compare(results, baseline, threshold=0.1)}
+    # Cases missing from the baseline are not compared.
+    assert set(comparison) == {result_key(r) for r in baseline}
+    assert comparison["encode/pluscodes/scalar/10"]["regression"]
+    assert comparison["encode/pluscodes/scalar/10"]["ratio"] == 0.85
+    assert not comparison["decode/pluscodes/scalar/10"]["regression"]
+
+
+def test_suite():
+    results = suite(n=20, repeat=1, code_lengths=[6, 10])
+    keys = {result_key(r) for r in results}
+    assert len(keys) == len(results)
+    # Shortening and recovery need codes of at least 8 digits.
+    assert {r["operation"] for r in results if r["code_length"] == 6} == {
+        "encode",
+        "decode",
+        "validate",
+    }
+    assert {r["operation"] for r in results if r["code_length"] == 10} == set(
+        OPERATIONS
+    ) - {"import"}
+    assert {result_key(r) for r in results if r["operation"] == "import"} == {
+        "import/pluscodes/package",
+        "import/pluscodes/encode",
+        "import/openlocationcode/package",
+    }
+    for operation in OPERATIONS[1:]:
+        assert f"{operation}/openlocationcode/scalar/10" in keys
+        assert f"{operation}/pluscodes/scalar/10" in keys
+    assert all(r["per_sec"] > 0 for r in results)
+
+
+def test_main_baseline(tmp_path):
+    path = tmp_path / "baseline.json"
+    argv = ["-n", "10", "--repeat", "1", "-l", "10", "--op", "encode"]
+    assert main(argv + ["--json", str(path)]) == 0
+    doc = json.loads(path.read_text())
+    assert {r["operation"] for r in doc["results"]} == {"encode"}
+
+    # A baseline far faster than any run flags every case.
+    for r in doc["results"]:
+        r["per_sec"] *= 1e6
+    path.write_text(json.dumps(doc))
+    assert main(argv + ["--baseline", str(path)]) == 1
+
+
+def test_import_time():
+    assert 0 < import_time("import pluscodes", repeat=1)
+
+
+def test_lazy_import():
+    code = (
+        "import sys, pluscodes.bench; "
+        "print(*sorted(m for m in sys.modules if m.startswith('pluscodes')))"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert proc.stdout.split() == ["pluscodes", "pluscodes.bench"]
+
+
+def test_features(capsys):
+    runs = {name: run for name, run, _ in FEATURES}
+    assert len(runs) == len(FEATURES)
+    main(["--features", "-n", "20", "--repeat", "1"])
+    lines = capsys.readouterr().out.splitlines()
+    for name in runs:
+        assert any(line.startswith(name) for line in lines) or "vectorized" in name
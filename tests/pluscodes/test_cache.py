@@ -0,0 +1,63 @@
+import threading
+
+import pytest
+
+from pluscodes import PlusCode, Transformer, cache, decode
+from pluscodes.decoder import Decoder
+
+
+@pytest.fixture(autouse=True)
+def disable_cache():
+    yield
+    cache.disable()
+
+
+class TestDecodeCache:
+    def test_disabled_by_default(self):
+        assert not cache.enabled()
+        assert cache.info() is None
+        assert decode("849VCWC8+W9") == Decoder().decode("849VCWC8+W9")
+
+    def test_hits_and_misses(self):
+        cache.enable(maxsize=10)
+        expected = decode("849VCWC8+W9")
+        assert decode("849VCWC8+W9") is expected
+        PlusCode("849VCWC8+W9").area
+        Transformer().shorten("849VCWC8+W9", (37.4, -122.1))
+        assert cache.info() == cache.CacheInfo(hits=3, misses=1, maxsize=10, currsize=1)
+        cache.clear()
+        assert cache.info() == cache.CacheInfo(hits=0, misses=0, maxsize=10, currsize=0)
+
+    @pytest.mark.parametrize(
+        "policy,kept", [("lru", "22222222+"), ("fifo", "33333333+")]
+    )
+    def test_eviction(self, policy: str, kept: str):
+        c = cache.enable(maxsize=2, policy=policy)
+        decode("22222222+")
+        decode("33333333+")
+        decode("22222222+")
+        decode("44444444+")
+        assert sorted(c._data) == [kept, "44444444+"]
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            cache.enable(maxsize=0)
+        with pytest.raises(ValueError):
+            cache.enable(policy="random")
+
+    def test_threads(self):
+        cache.enable(maxsize=50)
+        codes = [f"{a}{b}222222+" for a in "23456789C" for b in "23456789CF"]
+
+        def work():
+            for code in codes * 5:
+                decode(code)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        info = cache.info()
+        assert info.hits + info.misses == 4 * 5 * len(codes)
+        assert info.currsize == 50
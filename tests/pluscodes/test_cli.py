@@ -0,0 +1,120 @@
+import io
+
+import pytest
+
+from pluscodes import decode_bounds, decode_center, encode
+from pluscodes.cli import main
+
+ROWS = [(37.4223041570954, -122.08410042965134), (-33.87, 151.21), (0.0, 0.0)]
+
+
+def run(capsys, *argv: str) -> tuple[int, list[str], str]:
+    status = main(list(argv))
+    out, err = capsys.readouterr()
+    return status, out.splitlines(), err
+
+
+@pytest.fixture
+def stdin(monkeypatch):
+    def feed(text: str):
+        monkeypatch.setattr("sys.stdin", io.StringIO(text))
+
+    return feed
+
+
+class TestEncode:
+    def test_lines(self, capsys, stdin):
+        stdin("".join(f"{lat} {lon}\n" for lat, lon in ROWS))
+        status, out, err = run(capsys, "encode", "-l", "11")
+        assert status == 0
+        assert out == [encode(lat, lon, 11) for lat, lon in ROWS]
+        assert "3 rows" in err and "rows/s" in err
+
+    def test_csv_columns(self, capsys, tmp_path):
+        path = tmp_path / "in.csv"
+        path.write_text("y,name,x\n" + "".join(f'{a},"a, b",{b}\n' for a, b in ROWS))
+        status, out, _ = run(
+            capsys, "encode", str(path), "-f", "csv", "--lat", "y", "--lon", "2", "-k"
+        )
+        assert status == 0
+        assert out[0] == "y,name,x,code"
+        assert out[1:] == [f'{a},"a, b",{b},{encode(a, b)}' for a, b in ROWS]
+
+    def test_chunks(self, capsys, tmp_path):
+        path = tmp_path / "in.tsv"
+        path.write_text("".join(f"{a}\t{b}\n" for a, b in ROWS * 5))
+        status, out, err = run(
+            capsys,
+            *("encode", str(path), "-f", "tsv", "--no-header"),
+            *("--chunk-size", "2", "--progress"),
+        )
+        assert status == 0
+        assert out == [encode(a, b) for a, b in ROWS * 5]
+        assert len(err.splitlines()) == 8
+
+    def test_invalid_row(self, capsys, stdin):
+        stdin("1 2\n1 x\n")
+        status, out, err = run(capsys, "encode")
+        assert status == 1
+        assert "row 2" in err
+
+    def test_blank_lines(self, capsys, stdin):
+        stdin("lat,lon\n1,2\n\n3,4\n\n")
+        status, out, _ = run(capsys, "encode", "-f", "csv", "-q")
+        assert status == 0
+        assert out == ["code", encode(1, 2), encode(3, 4)]
+
+        # Rows are numbered by their source line.
+        stdin("1 2\n\n\n1 x\n")
+        status, _, err = run(capsys, "encode")
+        assert status == 1
+        assert "row 4" in err
+
+    def test_skip_invalid(self, capsys, stdin):
+        stdin("1 2\nnan 1\n1 inf\n1 x\n3 4\n")
+        status, _, err = run(capsys, "encode")
+        assert status == 1
+        assert "row 2" in err
+
+        stdin("1 2\nnan 1\n1 inf\n1 x\n3 4\n")
+        status, out, _ = run(capsys, "encode", "--skip-invalid", "-q")
+        assert status == 0
+        assert out == [encode(1, 2), "", "", "", encode(3, 4)]
+
+
+class TestDecode:
+    def test_lines(self, capsys, stdin):
+        codes = [encode(lat, lon) for lat, lon in ROWS]
+        stdin("\n".join(code.lower() for code in codes))
+        status, out, _ = run(capsys, "decode", "-q")
+        assert status == 0
+        assert out == [",".join(map(repr, decode_bounds(c))) for c in codes]
+
+    def test_csv_center(self, capsys, stdin):
+        stdin("id,code\n1,849VCWC8+W9\n")
+        status, out, _ = run(capsys, "decode", "-f", "csv", "--center", "-k", "-q")
+        assert status == 0
+        assert out[0] == "id,code,sw_lat,sw_lon,ne_lat,ne_lon,center_lat,center_lon"
+        assert out[1].split(",")[-2:] == list(map(repr, decode_center("849VCWC8+W9")))
+
+    def test_invalid_code(self, capsys, stdin):
+        stdin("849VCWC8+W9\nbad\n")
+        status, _, err = run(capsys, "decode")
+        assert status == 1
+        assert "row 2" in err
+
+        stdin("bad\n849VCWC8+W9\n")
+        status, out, _ = run(capsys, "decode", "--skip-invalid", "-q")
+        assert status == 0
+        assert out[0] == "" and len(out) == 2
+
+    def test_skip_missing_column(self, capsys, stdin):
+        stdin("id,code\n1\n2,849VCWC8+W9\n")
+        status, _, err = run(capsys, "decode", "-f", "csv")
+        assert status == 1
+        assert "row 2" in err
+
+        stdin("id,code\n1\n2,849VCWC8+W9\n")
+        status, out, _ = run(capsys, "decode", "-f", "csv", "--skip-invalid", "-q")
+        assert status == 0
+        assert out[1] == "" and len(out) == 3
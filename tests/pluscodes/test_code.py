@@ -0,0 +1,39 @@
+import pytest
+
+from pluscodes import Area, PlusCode, Point, decode, to_int
+
+
+class TestPlusCode:
+    def test_slots(self):
+        pc = PlusCode(37.4223041570954, -122.08410042965134)
+        assert not hasattr(pc, "__dict__")
+        with pytest.raises(AttributeError):
+            pc.other = 1
+
+    def test_lazy(self):
+        pc = PlusCode("849vcwc8+w9")
+        assert pc._area is None and pc._length is None
+        assert pc.length == 10
+        assert pc.area == decode("849VCWC8+W9")
+        assert pc.area is pc._area
+
+    def test_area_override(self):
+        area = Area(sw=Point(0, 0), ne=Point(1, 1))
+        assert PlusCode("849VCWC8+W9", area=area).area is area
+        pc = PlusCode("849VCWC8+W9")
+        pc.area = area
+        assert pc.area is area
+
+    @pytest.mark.parametrize("code_length", [2, 4, 6, 8, 10, 11, 15])
+    def test_factories(self, code_length: int):
+        lat, lon = 37.4223041570954, -122.08410042965134
+        expected = PlusCode(lat, lon, code_length=code_length)
+        for pc in [
+            PlusCode.from_latlon(lat, lon, code_length),
+            PlusCode.from_code(expected.code.lower()),
+            PlusCode.from_int(to_int(expected.code)),
+        ]:
+            assert isinstance(pc, PlusCode)
+            assert pc.code == expected.code
+            assert pc.length == expected.length == code_length
+            assert pc.area == expected.area
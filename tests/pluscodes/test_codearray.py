@@ -0,0 +1,148 @@
+import pickle
+import random
+import sys
+
+import pytest
+
+from pluscodes import PlusCodeArray, decode_bounds, encode, encode_many, to_int
+from pluscodes.encoder import Encoders
+
+
+def sample(n: int = 500, seed: int = 3) -> tuple[list[float], list[float]]:
+    rng = random.Random(seed)
+    lats = [rng.uniform(-90, 90) for _ in range(n)] + [-90, 90, 0]
+    lons = [rng.uniform(-180, 180) for _ in range(n)] + [-180, 180, 0]
+    return lats, lons
+
+
+class TestConstruction:
+    @pytest.mark.parametrize("code_length", sorted(Encoders))
+    def test_encode(self, code_length: int):
+        lats, lons = sample()
+        codes = PlusCodeArray.encode(lats, lons, code_length)
+        assert codes.codes() == encode_many(lats, lons, code_length)
+        assert codes == PlusCodeArray(codes.codes())
+        assert list(codes.keys) == [to_int(c) for c in codes]
+
+    def test_encode_generators(self):
+        lats, lons = sample(20)
+        codes = PlusCodeArray.encode((a for a in lats), iter(lons), 11)
+        assert codes.codes() == encode_many(lats, lons, 11)
+
+    def test_vectorized_encode_int(self):
+        np = pytest.importorskip("numpy")
+        from pluscodes import vectorized
+
+        lats, lons = sample()
+        for code_length, encoder in Encoders.items():
+            keys = vectorized.encode_int(np.array(lats), np.array(lons), code_length)
+            assert keys.dtype == np.uint64
+            assert keys.tolist() == [
+                encoder.encode_int(a, b) for a, b in zip(lats, lons)
+            ]
+
+    def test_buffer(self):
+        codes = PlusCodeArray.encode(*sample(10))
+        view = memoryview(codes.keys)
+        assert view.format == "Q" and len(view) == len(codes)
+        assert PlusCodeArray.frombuffer(view) == codes
+        np = pytest.importorskip("numpy")
+        keys = np.frombuffer(codes.keys, dtype=np.uint64)
+        assert keys.tolist() == list(codes.keys)
+        assert PlusCodeArray.frombuffer(keys) == codes
+
+    def test_buffer_format(self):
+        raw = memoryview(bytes(16))
+        for view in (raw, raw.cast("q"), raw.cast("d"), raw.cast("I")):
+            with pytest.raises(ValueError):
+                PlusCodeArray.frombuffer(view)
+        assert len(PlusCodeArray.frombuffer(raw.cast("Q"))) == 2
+
+    def test_invalid_code(self):
+        with pytest.raises(ValueError):
+            PlusCodeArray(["849VCWC8+W"])
+
+    def test_pickle(self):
+        codes = PlusCodeArray.encode(*sample(10))
+        assert pickle.loads(pickle.dumps(codes)) == codes
+
+
+class TestDecode:
+    @pytest.mark.parametrize("numpy", [True, False])
+    def test_bounds(self, numpy: bool, monkeypatch):
+        if numpy:
+            pytest.importorskip("numpy")
+        else:
+            monkeypatch.setitem(sys.modules, "pluscodes.vectorized", None)
+        lats, lons = sample(100)
+        codes = [
+            encode(a, b, length)
+            for a, b in zip(lats, lons)
+            for length in (2, 8, 10, 13, 15)
+        ]
+        bounds = PlusCodeArray(codes).bounds()
+        assert bounds.typecode == "d"
+        expected = [x for c in codes for x in decode_bounds(c)]
+        assert list(bounds) == expected
+        assert len(PlusCodeArray().bounds()) == 0
+
+    def test_areas(self):
+        codes = encode_many(*sample(20))
+        areas = PlusCodeArray(codes).areas()
+        assert [a.bounds() for a in areas] == [decode_bounds(c) for c in codes]
+
+
+class TestOrdering:
+    def test_sort_unique(self):
+        codes = encode_many(*sample(200), 6) * 2
+        arr = PlusCodeArray(codes)
+        arr.sort()
+        assert arr.codes() == sorted(codes)
+        assert arr.unique().codes() == sorted(set(codes))
+
+    def test_searchsorted(self):
+        arr = PlusCodeArray(encode_many(*sample(200)))
+        arr.sort()
+        keys = list(arr.keys)
+        for code in arr[::17]:
+            left = arr.searchsorted(code)
+            assert arr[left] == code
+            assert arr.searchsorted(to_int(code), side="right") == left + keys.count(
+                to_int(code)
+            )
+        with pytest.raises(ValueError):
+            arr.searchsorted(arr[0], side="middle")
+
+    def test_within(self):
+        codes = encode_many(*sample(500), 12)
+        arr = PlusCodeArray(codes)
+        arr.sort()
+        prefix = codes[0][:4] + "0000+"
+        expected = sorted(c for c in codes if c.startswith(codes[0][:4]))
+        assert arr.within(prefix).codes() == expected
+
+
+class TestSlicingAndGrouping:
+    def test_slicing(self):
+        codes = encode_many(*sample(20))
+        arr = PlusCodeArray(codes)
+        assert arr[3] == codes[3] and arr[-1] == codes[-1]
+        assert arr[2:9:2].codes() == codes[2:9:2]
+        assert len(arr[5:]) == len(codes) - 5
+
+    def test_truncate(self):
+        lats, lons = sample(50)
+        arr = PlusCodeArray.encode(lats, lons, 11)
+        assert arr.truncate(6).codes() == encode_many(lats, lons, 6)
+        with pytest.raises(ValueError):
+            arr.truncate(12)
+
+    def test_groupby(self):
+        lats, lons = sample(300)
+        arr = PlusCodeArray.encode(lats, lons)
+        groups = arr.groupby(2)
+        assert sum(map(len, groups.values())) == len(arr)
+        for prefix, group in groups.items():
+            assert prefix.endswith("000000+")
+            assert all(code[:2] == prefix[:2] for code in group)
+        assert list(groups) == list(dict.fromkeys(arr.truncate(2)))
@@ -0,0 +1,125 @@
+import os
+import random
+import stat
+import struct
+
+import pytest
+
+from pluscodes import (
+    CodeFile,
+    PlusCodeArray,
+    codefile,
+    decode,
+    decode_bounds,
+    encode_many,
+)
+
+
+def sample(n: int = 300, seed: int = 11) -> list[str]:
+    rng = random.Random(seed)
+    lats = [rng.uniform(-90, 90) for _ in range(n)]
+    lons = [rng.uniform(-180, 180) for _ in range(n)]
+    return encode_many(lats, lons, 11)
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "codes.plc"
+
+
+class TestCodeFile:
+    def test_round_trip(self, path):
+        codes = sample()
+        assert codefile.write(path, codes, chunk_size=64) == len(codes)
+        assert path.stat().st_size == 32 + 40 * len(codes)
+        with CodeFile(path) as f:
+            assert len(f) == len(codes) and f.has_bounds
+            assert list(f) == codes
+            assert f[7] == codes[7] and f[-1] == codes[-1]
+            assert f.bounds(7) == decode_bounds(codes[7])
+            assert f.area(7) == decode(codes[7])
+            assert f.to_array() == PlusCodeArray(codes)
+
+    def test_without_bounds(self, path):
+        codes = sample(20)
+        codefile.write(path, PlusCodeArray(codes), bounds=False)
+        assert path.stat().st_size == 32 + 8 * len(codes)
+        with CodeFile(path) as f:
+            assert not f.has_bounds
+            assert f.bounds(3) == decode_bounds(codes[3])
+            with pytest.raises(ValueError):
+                f.area(3)
+
+    def test_slicing(self, path):
+        codes = sample(50)
+        codefile.write(path, codes)
+        with CodeFile(path) as f:
+            for s in (slice(5, 20), slice(None, None, -3), slice(40, 2, -7)):
+                view = f[s]
+                assert list(view) == codes[s]
+                assert len(view) == len(codes[s])
+                assert list(view.keys) == list(f.keys)[s]
+                assert view.bounds(1) == decode_bounds(codes[s][1])
+            assert list(f[10:30][5:][::2]) == codes[10:30][5:][::2]
+
+    def test_searchsorted(self, path):
+        codes = sorted(sample(100))
+        codefile.write(path, codes)
+        with CodeFile(path) as f:
+            for i, code in enumerate(codes):
+                assert f.searchsorted(code) == codes.index(code)
+            assert f.searchsorted(codes[-1], side="right") == len(codes)
+
+    def test_invalid(self, path):
+        path.write_bytes(b"not a code file" * 4)
+        with pytest.raises(ValueError):
+            CodeFile(path)
+        codefile.write(path, sample(5))
+        path.write_bytes(path.read_bytes()[:-8])
+        with pytest.raises(ValueError):
+            CodeFile(path)
+        header = struct.pack("<8sHHIQQ", b"PLUSCODE", 2, 0, 0, 0, 0)
+        path.write_bytes(header)
+        with pytest.raises(ValueError):
+            CodeFile(path)
+
+    def test_invalid_closes_mapping(self, path, monkeypatch):
+        import mmap
+
+        mappings = []
+
+        class Recorder(mmap.mmap):
+            def __init__(self, *args, **kwargs):
+                mappings.append(self)
+
+        monkeypatch.setattr(mmap, "mmap", Recorder)
+        path.write_bytes(b"not a code file" * 4)
+        with pytest.raises(ValueError):
+            CodeFile(path)
+        assert len(mappings) == 1 and mappings[0].closed
+
+    def test_write_failure_keeps_file(self, path):
+        codefile.write(path, sample(5))
+        before = path.read_bytes()
+
+        def codes():
+            yield from sample(5)
+            raise RuntimeError("source failed")
+
+        with pytest.raises(RuntimeError):
+            codefile.write(path, codes(), chunk_size=2)
+        with pytest.raises(ValueError):
+            codefile.write(path, ["9G8F+6X"])
+        assert path.read_bytes() == before
+        assert [p.name for p in path.parent.iterdir()] == [path.name]
+
+    def test_write_mode(self, path):
+        umask = os.umask(0o022)
+        try:
+            codefile.write(path, sample(5))
+            assert stat.S_IMODE(path.stat().st_mode) == 0o644
+            path.chmod(0o640)
+            codefile.write(path, sample(5))
+            assert stat.S_IMODE(path.stat().st_mode) == 0o640
+        finally:
+            os.umask(umask)
@@ -0,0 +1,114 @@
+import random
+from functools import lru_cache
+
+import pytest
+
+from pluscodes import Area, Point, cover, encode, interior_cover, to_int
+from pluscodes.covering import _Polygon
+from pluscodes.encoder import Encoders
+from pluscodes.packed import lineage
+
+BOX = Area(Point(47.36, 8.52), Point(47.40, 8.56))
+TRIANGLE = [(47.36, 8.52), (47.40, 8.54), (47.36, 8.56)]
+
+
+def points(n: int = 2000, seed: int = 17) -> list[tuple[float, float]]:
+    rng = random.Random(seed)
+    return [(rng.uniform(47.355, 47.405), rng.uniform(8.515, 8.565)) for _ in range(n)]
+
+
+def in_box(lat: float, lon: float) -> bool:
+    return BOX.sw.lat <= lat < BOX.ne.lat and BOX.sw.lon <= lon < BOX.ne.lon
+
+
+def covered(codes: list[str], lat: float, lon: float) -> bool:
+    key = Encoders[15].encode_int(lat, lon)
+    return not keys(tuple(codes)).isdisjoint(lineage(key))
+
+
+@lru_cache
+def keys(codes: tuple[str, ...]) -> frozenset[int]:
+    return frozenset(map(to_int, codes))
+
+
+class TestCover:
+    @pytest.mark.parametrize("max_cells", [1, 8, 64, 500])
+    def test_box(self, max_cells: int):
+        codes = cover(BOX, max_cells=max_cells, max_length=11)
+        for lat, lon in points():
+            if in_box(lat, lon):
+                assert covered(codes, lat, lon)
+
+    @pytest.mark.parametrize("max_cells", [8, 64, 500])
+    def test_polygon(self, max_cells: int):
+        polygon = _Polygon(TRIANGLE)
+        codes = cover(TRIANGLE, max_cells=max_cells, max_length=11)
+        for lat, lon in points():
+            if polygon.contains_point(lat, lon):
+                assert covered(codes, lat, lon)
+
+    def test_max_cells(self):
+        assert cover(BOX, max_cells=8) == ["8FVC9G00+", "8FVC9H00+"]
+        assert len(cover(TRIANGLE, max_cells=64, max_length=11)) <= 64
+
+    def test_aligned_box(self):
+        # A box that is exactly a cell is covered by that cell alone.
+        assert cover(Area(Point(47.35, 8.5), Point(47.4, 8.55))) == ["8FVC9G00+"]
+
+    def test_point(self):
+        assert cover(Area(Point(1, 1), Point(1, 1)), max_length=11) == [
+            encode(1, 1, 11)
+        ]
+
+    def test_min_length(self):
+        codes = cover(BOX, max_cells=1, min_length=8)
+        assert len(codes) > 1
+        assert all(len(code.rstrip("0+")) >= 8 for code in codes)
+
+    def test_sorted(self):
+        rng = random.Random(23)
+        for _ in range(100):
+            lat, lon = rng.uniform(-80, 79), rng.uniform(-179, 178)
+            box = Area(Point(lat, lon), Point(lat + 0.5, lon + 0.5))
+            codes = cover(box, max_cells=20, max_length=11)
+            assert codes == sorted(codes)
+            assert interior_cover(box, max_cells=20, max_length=11) == sorted(
+                interior_cover(box, max_cells=20, max_length=11)
+            )
+        box = Area(
+            Point(-31.33677602064168, 130.8541383346501),
+            Point(-30.83677602064168, 131.3541383346501),
+        )
+        codes = cover(box, max_cells=20, max_length=11)
+        assert codes.index("4QXG3V00+") < codes.index("4QXH0000+")
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            cover(BOX, max_length=9)
+        with pytest.raises(ValueError):
+            cover(BOX, min_length=10, max_length=8)
+        with pytest.raises(ValueError):
+            cover(Area(Point(1, 2), Point(0, 1)))
+        with pytest.raises(ValueError):
+            cover([(0, 0), (1, 1)])
+
+
+class TestInteriorCover:
+    def test_box(self):
+        codes = interior_cover(BOX, max_cells=300)
+        assert 0 < len(codes) <= 300
+        for lat, lon in points():
+            if covered(codes, lat, lon):
+                assert in_box(lat, lon)
+
+    def test_polygon(self):
+        polygon = _Polygon(TRIANGLE)
+        codes = interior_cover(TRIANGLE, max_cells=300, max_length=11)
+        assert codes
+        for lat, lon in points():
+            if covered(codes, lat, lon):
+                assert polygon.contains_point(lat, lon)
+
+    def test_budget(self):
+        # No cell of the box fits within a budget of 8 codes.
+        assert interior_cover(BOX, max_cells=8) == []
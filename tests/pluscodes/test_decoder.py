@@ -0,0 +1,32 @@
+import random
+
+import pytest
+
+from pluscodes import decode, decode_bounds, decode_center
+from pluscodes import openlocationcode as olc
+from pluscodes.encoder import Encoders
+
+
+def sample_codes(code_length: int, n: int = 1000, seed: int = 5) -> list[str]:
+    rng = random.Random(seed)
+    lats = [rng.uniform(-90, 90) for _ in range(n)] + [-90, 0, 90]
+    lons = [rng.uniform(-180, 180) for _ in range(n)] + [-180, 0, 180]
+    return Encoders[code_length].encode_many(lats, lons)
+
+
+class TestDecode:
+    @pytest.mark.parametrize("code_length", sorted(Encoders))
+    def test_matches_openlocationcode(self, code_length: int):
+        for code in sample_codes(code_length):
+            area = decode(code)
+            expected = olc.decode(code)
+            assert area.sw.latlon() == (expected.latitudeLo, expected.longitudeLo)
+            assert area.ne.latlon() == (expected.latitudeHi, expected.longitudeHi)
+            assert decode(code.lower()) == area
+
+    @pytest.mark.parametrize("code_length", sorted(Encoders))
+    def test_tuples(self, code_length: int):
+        for code in sample_codes(code_length, 200):
+            area = decode(code)
+            assert decode_bounds(code) == (*area.sw.latlon(), *area.ne.latlon())
+            assert decode_center(code) == area.center().latlon()
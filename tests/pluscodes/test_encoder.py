@@ -0,0 +1,89 @@
+import random
+from array import array
+
+import pytest
+
+from pluscodes import (
+    PlusCode,
+    decode,
+    encode,
+    encode_many,
+    encode_many_with_area,
+    encode_with_area,
+)
+from pluscodes import openlocationcode as olc
+from pluscodes.encoder import Encoders
+
+EDGES = [
+    (-90, -180),
+    (-90, 0),
+    (-90, 180),
+    (0, -180),
+    (0, 0),
+    (0, 180),
+    (90, -180),
+    (90, 0),
+    (90, 180),
+]
+
+
+def sample(n: int = 2000, seed: int = 7) -> tuple[list[float], list[float]]:
+    rng = random.Random(seed)
+    lats = [rng.uniform(-90, 90) for _ in range(n)] + [p[0] for p in EDGES]
+    lons = [rng.uniform(-180, 180) for _ in range(n)] + [p[1] for p in EDGES]
+    return lats, lons
+
+
+class TestEncode:
+    @pytest.mark.parametrize("code_length", sorted(Encoders))
+    def test_matches_openlocationcode(self, code_length: int):
+        for lat, lon in zip(*sample()):
+            assert encode(lat, lon, code_length) == olc.encode(lat, lon, code_length)
+
+
+class TestEncodeMany:
+    @pytest.mark.parametrize("code_length", sorted(Encoders))
+    def test_matches_scalar(self, code_length: int):
+        lats, lons = sample()
+        expected = [encode(a, b, code_length) for a, b in zip(lats, lons)]
+        assert encode_many(lats, lons, code_length) == expected
+
+    def test_buffers(self):
+        lats, lons = sample(100)
+        expected = encode_many(lats, lons)
+        assert encode_many(array("d", lats), memoryview(array("d", lons))) == expected
+        assert encode_many(iter(lats), iter(lons)) == expected
+
+    def test_length_mismatch(self):
+        with pytest.raises(ValueError):
+            encode_many([0.0, 1.0], [0.0])
+
+    def test_invalid_code_length(self):
+        with pytest.raises(ValueError):
+            encode_many([0.0], [0.0], 9)
+
+    def test_float_code_length(self):
+        assert encode(1.0, 2.0, 10.0) == encode(1.0, 2.0, 10) == "6FH42222+22"
+        with pytest.raises(ValueError):
+            encode(1.0, 2.0, 10.5)
+
+
+class TestEncodeWithArea:
+    @pytest.mark.parametrize("code_length", sorted(Encoders))
+    def test_matches_decode(self, code_length: int):
+        lats, lons = sample(500)
+        lats += [-100, 95, 400]
+        lons += [300, -250, -400]
+        results = encode_many_with_area(lats, lons, code_length)
+        for lat, lon, (code, area) in zip(lats, lons, results):
+            assert (code, area) == encode_with_area(lat, lon, code_length)
+            assert code == encode(lat, lon, code_length)
+            assert area == decode(code)
+
+    def test_plus_code(self):
+        # A PlusCode built from a fused result matches one decoded lazily.
+        for lat, lon in zip(*sample(100)):
+            code, area = encode_with_area(lat, lon)
+            pc = PlusCode(code, area=area)
+            assert pc.area is area
+            assert (pc.code, pc.area) == (PlusCode(lat, lon).code, PlusCode(code).area)
@@ -0,0 +1,97 @@
+import dataclasses
+import pickle
+from array import array
+
+import pytest
+
+from pluscodes import Area, AreaView, Point, decode, decode_bounds, encode_many
+from pluscodes.geo import as_doubles
+
+CODES = encode_many([37.42, -33.87, 0.0, 89.99], [-122.08, 151.21, 0.0, 179.99])
+
+
+class TestArea:
+    def test_slots(self):
+        area = decode(CODES[0])
+        for obj in (area, area.sw, area.ne):
+            assert not hasattr(obj, "__dict__")
+            with pytest.raises(dataclasses.FrozenInstanceError):
+                obj.other = 1
+
+    def test_compatible(self):
+        area = Area(sw=Point(lat=1.0, lon=2.0), ne=Point(lat=3.0, lon=4.0))
+        assert area == Area(Point(1.0, 2.0), Point(3.0, 4.0))
+        assert hash(area) == hash(Area(Point(1.0, 2.0), Point(3.0, 4.0)))
+        assert [f.name for f in dataclasses.fields(area)] == ["sw", "ne"]
+        assert dataclasses.asdict(area) == {
+            "sw": {"lat": 1.0, "lon": 2.0},
+            "ne": {"lat": 3.0, "lon": 4.0},
+        }
+        assert repr(area) == (
+            "Area(sw=Point(lat=1.0, lon=2.0), ne=Point(lat=3.0, lon=4.0))"
+        )
+
+    def test_center_cached(self):
+        area = decode(CODES[0])
+        center = area.center()
+        assert center is area.center()
+        assert area.dict()["center"] == center.dict()
+        assert area == decode(CODES[0])
+
+    def test_pickle(self):
+        area = decode(CODES[0])
+        area.center()
+        copy = pickle.loads(pickle.dumps(area))
+        assert copy == area
+        assert copy.center() == area.center()
+
+
+class TestAreaView:
+    def test_rows(self):
+        buffer = array("d", [x for c in CODES for x in decode_bounds(c)])
+        views = AreaView.rows(buffer)
+        assert len(views) == len(CODES)
+        for code, view in zip(CODES, views):
+            area = decode(code)
+            assert view == area and area == view
+            assert hash(view) == hash(area)
+            assert view.area() == area
+            assert view.center() == area.center()
+            assert view.dict() == area.dict()
+            assert view.tuple() == area.tuple()
+            assert view.bounds() == decode_bounds(code)
+
+    def test_shares_buffer(self):
+        buffer = array("d", decode_bounds(CODES[0]) + decode_bounds(CODES[1]))
+        view = AreaView(buffer, 1)
+        assert view.sw == Point(buffer[4], buffer[5])
+        with pytest.raises(TypeError):
+            as_doubles(buffer)[4] = 0.0
+
+    def test_numpy(self):
+        np = pytest.importorskip("numpy")
+        from pluscodes import vectorized
+
+        views = AreaView.rows(vectorized.decode(np.array(CODES)))
+        assert views == [decode(c) for c in CODES]
+        # Rows with centers have 6 values.
+        centers = vectorized.decode(np.array(CODES), center=True)
+        assert AreaView.rows(centers) == [decode(c) for c in CODES]
+        assert AreaView(centers, 1) == decode(CODES[1])
+        flat = np.array([decode_bounds(c) for c in CODES])
+        assert AreaView.rows(flat) == [decode(c) for c in CODES]
+
+    def test_stride(self):
+        codes = CODES[:3]
+        buffer = array("d", [x for c in codes for x in decode_bounds(c) + (0.0,)])
+        assert AreaView.rows(buffer, stride=5) == [decode(c) for c in codes]
+        assert AreaView(buffer, 1, stride=5) == decode(CODES[1])
+        with pytest.raises(ValueError):
+            AreaView.rows(buffer)
+        with pytest.raises(ValueError):
+            AreaView(buffer, 0, stride=3)
+
+    def test_row_out_of_range(self):
+        buffer = array("d", decode_bounds(CODES[0]))
+        with pytest.raises(IndexError):
+            AreaView(buffer, 1)
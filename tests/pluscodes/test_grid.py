@@ -0,0 +1,106 @@
+import random
+
+import pytest
+
+from pluscodes import decode, encode, k_ring, neighbors, packed, to_int
+from pluscodes.encoder import Encoders
+from pluscodes.grid import cell, from_cell, grid_size, offset
+
+
+def sample(n: int = 200, seed: int = 19) -> list[tuple[float, float]]:
+    rng = random.Random(seed)
+    return [(rng.uniform(-89, 89), rng.uniform(-179, 179)) for _ in range(n)]
+
+
+def round_trip(code: str, dlat: int, dlon: int) -> str:
+    """The neighbor through decode, offset and encode, away from the edges."""
+    area = decode(code)
+    lat, lon = area.center().latlon()
+    height, width = area.ne.lat - area.sw.lat, area.ne.lon - area.sw.lon
+    return encode(lat + dlat * height, lon + dlon * width, cell(code)[2])
+
+
+class TestCell:
+    @pytest.mark.parametrize("code_length", sorted(Encoders))
+    def test_round_trip(self, code_length: int):
+        for lat, lon in sample(50):
+            code = encode(lat, lon, code_length)
+            y, x, length = cell(code)
+            assert (y, x, length) == packed.to_cell(to_int(code))
+            assert from_cell(y, x, length) == code
+
+    def test_grid_size(self):
+        assert grid_size(2) == (9, 18)
+        assert grid_size(10) == (9 * 20**4, 18 * 20**4)
+        assert grid_size(12) == (9 * 20**4 * 25, 18 * 20**4 * 16)
+        with pytest.raises(ValueError):
+            grid_size(9)
+
+    def test_invalid(self):
+        for code in ("849VCWC8+W", "849VCWC8+WI", "X49VCWC8+W9"):
+            with pytest.raises(ValueError):
+                cell(code)
+        with pytest.raises(ValueError):
+            from_cell(9, 0, 2)
+
+    @pytest.mark.parametrize(
+        "code", ["9G8F+6X", "8F+", "+6X", "8FVC9G8F+6X0", "8FVC9G8F6X", "8F00+"]
+    )
+    def test_not_full(self, code: str):
+        with pytest.raises(ValueError):
+            cell(code)
+        with pytest.raises(ValueError):
+            neighbors(code)
+
+
+class TestNeighbors:
+    @pytest.mark.parametrize("code_length", [4, 8, 10, 11, 13])
+    def test_matches_round_trip(self, code_length: int):
+        for lat, lon in sample(30):
+            code = encode(lat, lon, code_length)
+            expected = [
+                round_trip(code, dlat, dlon)
+                for dlat, dlon in [
+                    (1, 0),
+                    (1, 1),
+                    (0, 1),
+                    (-1, 1),
+                    (-1, 0),
+                    (-1, -1),
+                    (0, -1),
+                    (1, -1),
+                ]
+            ]
+            assert neighbors(code) == expected
+            assert offset(code, -1, 1) == expected[3]
+
+    def test_antimeridian(self):
+        east = encode(0, 179.99, 4)
+        west = encode(0, -179.99, 4)
+        assert west in neighbors(east) and east in neighbors(west)
+        assert offset(east, 0, 1) == west
+
+    def test_poles(self):
+        top = encode(90, 0, 6)
+        assert len(neighbors(top)) == 5
+        assert offset(top, 1, 0) is None
+        bottom = encode(-90, 0, 6)
+        assert len(neighbors(bottom)) == 5
+        assert all(cell(c)[0] in (0, 1) for c in neighbors(bottom))
+
+
+class TestKRing:
+    def test_interior(self):
+        code = encode(37.4, -122.1, 10)
+        ring = k_ring(code, 2)
+        assert len(ring) == len(set(ring)) == 25
+        assert ring[12] == code
+        assert set(k_ring(code, 1)) == {code, *neighbors(code)}
+        assert k_ring(code, 0) == [code]
+
+    def test_edges(self):
+        assert len(k_ring(encode(90, 0, 8), 3)) == 4 * 7
+        ring = k_ring(encode(0, 0, 2), 10)
+        assert len(ring) == len(set(ring)) == 9 * 18
+        with pytest.raises(ValueError):
+            k_ring("849VCWC8+W9", -1)
@@ -0,0 +1,121 @@
+import random
+from itertools import islice
+
+import pytest
+
+from pluscodes import (
+    ancestors,
+    children,
+    descendants,
+    encode,
+    parent,
+    to_int,
+)
+from pluscodes.packed import LENGTHS, lineage, subtree_size
+
+
+def sample(n: int = 100, seed: int = 23) -> list[tuple[float, float]]:
+    rng = random.Random(seed)
+    return [(rng.uniform(-90, 90), rng.uniform(-180, 180)) for _ in range(n)]
+
+
+class TestParent:
+    @pytest.mark.parametrize("code_length", LENGTHS[1:])
+    def test_encode(self, code_length: int):
+        # The parent is the code of the same point at the shorter length.
+        for lat, lon in sample():
+            code = encode(lat, lon, code_length)
+            for length in LENGTHS[: LENGTHS.index(code_length)]:
+                assert parent(code, length) == encode(lat, lon, length)
+
+    def test_default(self):
+        assert parent("8FVC9G8F+6X") == "8FVC9G8F+"
+        assert parent("8FVC9G8F+") == "8FVC9G00+"
+        assert parent("8FVC9G8F+6X3") == "8FVC9G8F+6X"
+        assert parent("8fvc0000+") == "8F000000+"
+
+    @pytest.mark.parametrize(
+        "code,length",
+        [
+            ("8F000000+", None),
+            ("8FVC9G8F+", 8),
+            ("8FVC9G8F+", 9),
+            ("8FVC9G8F+6X", 12),
+            ("8FVC9G8+", 4),
+            ("8FVC9G8F", 4),
+            ("8FVC0G00+", 2),
+            ("8FVC9G8F+6", 8),
+            ("8FVC9G8I+6X", 8),
+            ("WC000000+", None),
+            ("9G8F+6X", 4),
+        ],
+    )
+    def test_invalid(self, code: str, length: int | None):
+        with pytest.raises(ValueError):
+            parent(code, length)
+
+
+class TestAncestors:
+    def test_lineage(self):
+        for lat, lon in sample():
+            code = encode(lat, lon, 15)
+            keys = list(map(to_int, ancestors(code) + [code]))
+            assert keys == lineage(to_int(code))
+
+    def test_shortest(self):
+        assert ancestors("8F000000+") == []
+
+
+class TestChildren:
+    @pytest.mark.parametrize("code_length", LENGTHS[:-1])
+    def test_children(self, code_length: int):
+        lat, lon = sample(1)[0]
+        code = encode(lat, lon, code_length)
+        found = list(children(code))
+        assert len(found) == (400 if code_length < 10 else 20)
+        assert found == sorted(found)
+        assert all(parent(child) == code for child in found)
+        assert encode(lat, lon, LENGTHS[LENGTHS.index(code_length) + 1]) in found
+
+    def test_longest(self):
+        assert list(children("8FVC9G8F+6X3VQWX")) == []
+
+    def test_eager_validation(self):
+        with pytest.raises(ValueError):
+            children("8FVC9G8+")
+        with pytest.raises(ValueError):
+            descendants("8FVC9G8F+", 8)
+
+
+class TestDescendants:
+    @pytest.mark.parametrize(
+        "code,length,count",
+        [
+            ("8F000000+", 6, 400**2),
+            ("8FVC0000+", 8, 400**2),
+            ("8FVC9G8F+", 12, 400 * 20**2),
+            ("8FVC9G8F+6X", 13, 20**3),
+        ],
+    )
+    def test_keys(self, code: str, length: int, count: int):
+        # Descendants are the codes of the given length in the key range of
+        # the code's subtree, in key order.
+        found = list(descendants(code, length))
+        assert len(found) == len(set(found)) == count
+        code_length = len(code.replace("+", "").rstrip("0"))
+        start = to_int(code)
+        end = start + subtree_size(code_length)
+        keys = list(map(to_int, found))
+        assert keys == sorted(keys)
+        assert start < keys[0] and keys[-1] < end
+        assert all(parent(child, code_length) == code for child in found[::997])
+
+    def test_lazy(self):
+        # 64 million codes, of which only the first few are formatted.
+        found = list(islice(descendants("8F000000+", 10), 3))
+        assert found == ["8F222222+22", "8F222222+23", "8F222222+24"]
+
+    def test_encode(self):
+        for lat, lon in sample(10):
+            code = encode(lat, lon, 11)
+            assert code in descendants(parent(code, 8), 11)
@@ -0,0 +1,91 @@
+import pickle
+import random
+
+import pytest
+
+from pluscodes import CodeFile, PlusCodeArray, PlusCodeIndex, codefile, encode
+
+LENGTHS = (2, 4, 6, 8, 10)
+
+
+def regions(n: int = 2000, seed: int = 13) -> list[str]:
+    # Clustered, so that regions of different lengths nest.
+    rng = random.Random(seed)
+    codes = []
+    for _ in range(n):
+        lat, lon = rng.uniform(37, 38), rng.uniform(-123, -122)
+        codes.append(encode(lat, lon, rng.choice(LENGTHS)))
+    return codes + [encode(90, 180, 8), encode(-90, -180, 4)]
+
+
+def points(n: int = 500, seed: int = 17) -> list[tuple[float, float]]:
+    rng = random.Random(seed)
+    pts = [(rng.uniform(37, 38), rng.uniform(-123, -122)) for _ in range(n)]
+    return pts + [(90, 180), (-90, -180), (0, 0)]
+
+
+def brute_force(codes: set[str], lat: float, lon: float) -> list[str]:
+    return [
+        encode(lat, lon, length)
+        for length in LENGTHS
+        if encode(lat, lon, length) in codes
+    ]
+
+
+class TestPlusCodeIndex:
+    def test_query(self):
+        codes = regions()
+        index = PlusCodeIndex(codes)
+        assert len(index) == len(set(codes))
+        found = 0
+        for lat, lon in points():
+            expected = brute_force(set(codes), lat, lon)
+            assert index.query(lat, lon) == expected
+            found += len(expected)
+        assert found > 500
+
+    def test_values(self):
+        codes = list(dict.fromkeys(regions(200)))
+        index = PlusCodeIndex(codes, range(len(codes)))
+        lat, lon = points(1)[0]
+        for code, value in index.query_items(lat, lon):
+            assert codes[value] == code
+        assert index.get(codes[3]) == 3
+        assert index.get("9C000000+", "missing") == "missing"
+
+    def test_insert_delete(self):
+        index = PlusCodeIndex()
+        assert index.query(37.4, -122.1) == []
+        index.insert("849V0000+", "area")
+        index.insert("849VCWC8+W9", "site")
+        assert index.query_code("849VCWC8+W9") == ["849V0000+", "849VCWC8+W9"]
+        assert index.lengths == [4, 10]
+        index.delete("849VCWC8+W9")
+        assert "849VCWC8+W9" not in index and "849V0000+" in index
+        assert index.lengths == [4]
+        with pytest.raises(KeyError):
+            index.delete("849VCWC8+W9")
+        with pytest.raises(ValueError):
+            index.insert("849VCWC8+W")
+        with pytest.raises(ValueError):
+            # A short code is not a region of its own.
+            index.insert("CWC8+W9")
+
+    def test_pickle(self):
+        codes = list(dict.fromkeys(regions(300)))
+        index = PlusCodeIndex(codes, codes)
+        copy = pickle.loads(pickle.dumps(index))
+        assert sorted(copy) == sorted(index) == sorted(codes)
+        for lat, lon in points(50):
+            assert copy.query_items(lat, lon) == index.query_items(lat, lon)
+
+    def test_from_keys(self, tmp_path):
+        codes = regions(300)
+        path = tmp_path / "regions.plc"
+        codefile.write(path, codes, bounds=False)
+        with CodeFile(path) as f:
+            index = PlusCodeIndex.from_keys(f.keys)
+        assert sorted(index) == sorted(set(codes))
+        assert sorted(PlusCodeIndex.from_keys(PlusCodeArray(codes).keys)) == sorted(
+            index
+        )
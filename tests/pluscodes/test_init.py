@@ -0,0 +1,69 @@
+import subprocess
+import sys
+
+import pytest
+
+import pluscodes
+from pluscodes import encoder
+
+
+def loaded(statement: str) -> list[str]:
+    """The pluscodes modules loaded by a statement in a fresh interpreter."""
+    code = (
+        f"{statement}; import sys; "
+        "print(*sorted(m for m in sys.modules if m.startswith('pluscodes')))"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return proc.stdout.split()
+
+
+def test_lazy_import():
+    assert loaded("import pluscodes") == ["pluscodes"]
+    assert loaded("from pluscodes import parent") == [
+        "pluscodes",
+        "pluscodes.base",
+        "pluscodes.hierarchy",
+        "pluscodes.packed",
+        "pluscodes.validator",
+    ]
+    assert loaded("from pluscodes import encode") == [
+        "pluscodes",
+        "pluscodes.base",
+        "pluscodes.encoder",
+    ]
+
+
+def test_exports():
+    for name in pluscodes.__all__:
+        assert getattr(pluscodes, name).__module__.startswith("pluscodes.")
+    assert set(pluscodes.__all__) <= set(dir(pluscodes))
+    with pytest.raises(AttributeError):
+        pluscodes.missing
+    # Submodules are still importable by name.
+    from pluscodes import cache
+
+    assert cache.__name__ == "pluscodes.cache"
+
+
+def test_submodules_do_not_shadow_exports():
+    # cover is defined in pluscodes.covering, so no submodule shares its name.
+    assert loaded(
+        "import pluscodes.covering, pluscodes.plan; "
+        "from pluscodes import cover; assert callable(cover)"
+    )
+    import pluscodes.covering
+    import pluscodes.plan
+
+    assert callable(pluscodes.cover)
+    assert callable(pluscodes.plan.key_ranges)
+
+
+def test_encoders():
+    encoders = encoder.Encoders
+    assert sorted(encoders) == [2, 4, 6, 8, 10, 11, 12, 13, 14, 15]
+    assert {k: e.code_length for k, e in encoders.items()} == {k: k for k in encoders}
+    # Keys equal to a length find the encoder of the int length.
+    assert encoders[10.0] is encoders[10]
+    assert encoders.get(3) is None
@@ -0,0 +1,98 @@
+import pytest
+
+from pluscodes import (
+    Transformer,
+    Validator,
+    decode,
+    decode_bounds,
+    decode_center,
+    encode,
+    encode_many,
+    instrument,
+    recover_many,
+)
+from pluscodes.encoder import Encoder
+from pluscodes.instrument import METHODS, Registry
+
+
+@pytest.fixture(autouse=True)
+def disable_instrument():
+    yield
+    instrument.disable()
+
+
+def test_disabled_by_default():
+    assert not instrument.enabled()
+    assert instrument.snapshot() is None
+    # The original methods are installed.
+    for cls, methods in METHODS.items():
+        for name in methods:
+            assert not hasattr(getattr(cls, name), "__wrapped__")
+
+
+def test_enable_and_disable():
+    original = Encoder.__dict__["encode"]
+    instrument.enable()
+    assert instrument.enabled()
+    assert Encoder.encode.__wrapped__ is original
+    # Enabling again replaces the registry without wrapping twice.
+    instrument.enable()
+    assert Encoder.encode.__wrapped__ is original
+    instrument.disable()
+    assert Encoder.__dict__["encode"] is original
+    assert not instrument.enabled()
+
+
+def test_counts():
+    instrument.enable()
+    code = encode(47.365590, 8.524997)
+    decode(code)
+    encode_many([1.0, 2.0, 3.0], [4.0, 5.0, 6.0])
+    recover_many(["9G8F+6X", "9G8F+6X", "invalid"], (47.4, 8.6))
+    with pytest.raises(ValueError):
+        Transformer().shorten("invalid", (47.4, 8.6))
+    Validator().is_full(code)
+
+    stats = instrument.snapshot()
+    assert stats["Encoder.encode"]["calls"] >= 1
+    assert stats["Decoder.decode"]["calls"] == 1
+    assert stats["Encoder.encode_many"]["items"] == 3
+    assert stats["Transformer.recover_many"]["items"] == 3
+    assert stats["Transformer.recover_many"]["mean_batch_size"] == 3
+    assert stats["Transformer.shorten"]["calls"] == 1
+    assert stats["Transformer.shorten"]["errors"] == 1
+    assert stats["Validator.is_full"]["calls"] == 1
+    assert "Validator.is_short" not in stats
+
+    instrument.clear()
+    assert instrument.snapshot() == {}
+
+
+def test_decode_recorded_once():
+    instrument.enable()
+    decode("8FVC9G8F+6X")
+    stats = instrument.snapshot()
+    assert stats["Decoder.decode"]["calls"] == 1
+    assert "Decoder.decode_bounds" not in stats
+    decode_bounds("8FVC9G8F+6X")
+    decode_center("8FVC9G8F+6X")
+    stats = instrument.snapshot()
+    assert stats["Decoder.decode_bounds"]["calls"] == 1
+    assert stats["Decoder.decode_center"]["calls"] == 1
+    assert stats["Decoder.decode"]["calls"] == 1
+
+
+def test_registry_percentiles():
+    registry = Registry(window=100)
+    for ns in range(1, 201):
+        registry.record("op", ns * 1000)
+    stats = registry.snapshot()["op"]
+    assert stats["calls"] == stats["items"] == 200
+    assert stats["max_seconds"] == 200e-6
+    assert stats["total_seconds"] == pytest.approx(sum(range(1, 201)) * 1e-6)
+    # Percentiles cover the most recent 100 calls.
+    assert stats["p50_seconds"] == 150e-6
+    assert stats["p99_seconds"] == 199e-6
+
+    with pytest.raises(ValueError):
+        Registry(window=0)
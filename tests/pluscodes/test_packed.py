@@ -0,0 +1,81 @@
+import random
+
+import pytest
+
+from pluscodes import from_int, to_int
+from pluscodes.encoder import Encoders
+from pluscodes.packed import MAX_KEY, subtree_size
+
+
+def sample_codes(n: int = 500, seed: int = 11) -> list[str]:
+    rng = random.Random(seed)
+    lats = [rng.uniform(-90, 90) for _ in range(n)] + [-90, 0, 90, 90]
+    lons = [rng.uniform(-180, 180) for _ in range(n)] + [-180, 0, 180, -180]
+    return [c for e in Encoders.values() for c in e.encode_many(lats, lons)]
+
+
+class TestPacked:
+    def test_max_key(self):
+        assert MAX_KEY <= 2**64
+        assert from_int(0) == "22000000+"
+        assert from_int(MAX_KEY - 1) == "CVXXXXXX+XXXXXXX"
+        with pytest.raises(ValueError):
+            from_int(MAX_KEY)
+        with pytest.raises(ValueError):
+            from_int(-1)
+
+    @pytest.mark.parametrize("code_length", sorted(Encoders))
+    def test_round_trip(self, code_length: int):
+        rng = random.Random(code_length)
+        encoder = Encoders[code_length]
+        for _ in range(500):
+            lat, lon = rng.uniform(-90, 90), rng.uniform(-180, 180)
+            code = encoder.encode(lat, lon)
+            key = encoder.encode_int(lat, lon)
+            assert to_int(code) == key
+            assert to_int(code.lower()) == key
+            assert from_int(key) == code
+
+    def test_order_matches_strings(self):
+        codes = sample_codes()
+        keys = [to_int(c) for c in codes]
+        assert [from_int(k) for k in sorted(keys)] == sorted(codes)
+
+    def test_descendant_range(self):
+        def digits(code: str) -> str:
+            return code.replace("+", "").replace("0", "")
+
+        for code in sample_codes(20):
+            start = to_int(code)
+            end = start + subtree_size(len(digits(code)))
+            inside = [from_int(k) for k in (start, start + 1, end - 1) if k < end]
+            assert all(digits(c).startswith(digits(code)) for c in inside)
+            if end < MAX_KEY:
+                assert not digits(from_int(end)).startswith(digits(code))
+
+    @pytest.mark.parametrize(
+        "code",
+        [
+            "",
+            "849VCWC8+W",
+            "849VCWC1+W9",
+            "X2000000+",
+            # Short codes.
+            "9G8F+6X",
+            "8F+",
+            "+6X",
+            # Misplaced separators and padding.
+            "8FVC9G8F6X+",
+            "8FVC9G8F+6X00",
+            "8FVC9G8F+6X0",
+            "8F00VC00+",
+            "8FV00000+",
+            "8FVC0000+6X",
+            "8FVC9G8F",
+            # Too many digits.
+            "8FVC9G8F+6X234567",
+        ],
+    )
+    def test_invalid(self, code: str):
+        with pytest.raises(ValueError):
+            to_int(code)
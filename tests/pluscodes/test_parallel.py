@@ -0,0 +1,65 @@
+import random
+
+import pytest
+
+from pluscodes import encode_many, parallel
+from pluscodes.rows import RowError
+
+
+def sample(n: int = 1000, seed: int = 5) -> tuple[list[float], list[float]]:
+    rng = random.Random(seed)
+    lats = [rng.uniform(-90, 90) for _ in range(n)]
+    lons = [rng.uniform(-180, 180) for _ in range(n)]
+    return lats, lons
+
+
+class TestEncodeMany:
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_ordered(self, workers: int):
+        lats, lons = sample()
+        codes = parallel.encode_many(
+            lats, lons, 11, workers=workers, chunk_size=97, max_pending=3
+        )
+        assert codes == encode_many(lats, lons, 11)
+
+    def test_chunks(self):
+        lats, lons = sample(250)
+        chunks = list(parallel.encode_chunks(lats, lons, workers=1, chunk_size=100))
+        assert list(map(len, chunks)) == [100, 100, 50]
+
+    def test_invalid_options(self):
+        lats, lons = sample(10)
+        with pytest.raises(ValueError):
+            parallel.encode_many(lats, lons[:-1], workers=1)
+        with pytest.raises(ValueError):
+            parallel.encode_many(lats, lons, 9)
+        with pytest.raises(ValueError):
+            parallel.encode_many(lats, lons, chunk_size=0)
+
+
+class TestEncodeFile:
+    def test_csv(self, tmp_path):
+        lats, lons = sample(500)
+        src, dst = tmp_path / "in.csv", tmp_path / "out.txt"
+        src.write_text(
+            "id,lat,lon\n"
+            + "".join(f"{i},{a},{b}\n" for i, (a, b) in enumerate(zip(lats, lons)))
+        )
+        rows = parallel.encode_file(
+            src,
+            dst,
+            fmt="csv",
+            lat_col=1,
+            lon_col=2,
+            header=True,
+            workers=2,
+            chunk_size=64,
+        )
+        assert rows == 500
+        assert dst.read_text().splitlines() == encode_many(lats, lons)
+
+    def test_row_error(self, tmp_path):
+        src, dst = tmp_path / "in.txt", tmp_path / "out.txt"
+        src.write_text("1 2\n" * 10 + "1 x\n")
+        with pytest.raises(RowError, match="row 11"):
+            parallel.encode_file(src, dst, workers=2, chunk_size=4)
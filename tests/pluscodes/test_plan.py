@@ -0,0 +1,106 @@
+from bisect import bisect_right
+
+import pytest
+
+from pluscodes import Area, Point, to_int
+from pluscodes.grid import from_cell, grid_size
+from pluscodes.packed import subtree_size
+from pluscodes.plan import key_ranges, prefixes
+
+# Whole length 8 cells, 16 rows across two length 6 cells.
+ZURICH = Area(Point(47.36, 8.52), Point(47.40, 8.56))
+# The north east corner of the grid.
+CORNER = Area(Point(89.99871, 179.99813), Point(90, 180))
+
+# Boxes and lengths small enough to check every cell around the box, with
+# edges off the cell boundaries.
+CASES = [
+    (Area(Point(31.7, -12.9), Point(47.3, 22.1)), 4),
+    (Area(Point(47.3613, 8.52137), Point(47.4017, 8.5613)), 8),
+    (Area(Point(-0.01307, -0.02113), Point(0.01109, 0.00407)), 8),
+    (Area(Point(47.36123, 8.52131), Point(47.36391, 8.52527)), 10),
+    (Area(Point(-0.00031, -0.00043), Point(0.00017, 0.00029)), 11),
+    (CORNER, 10),
+    (CORNER, 11),
+]
+
+
+def inside(area: Area, code_length: int, margin: int = 2) -> dict[str, bool]:
+    """The codes of cells around the box, and whether they intersect it."""
+    lat_cells, lon_cells = grid_size(code_length)
+    height, width = 180 / lat_cells, 360 / lon_cells
+    south, west = int((area.sw.lat + 90) // height), int((area.sw.lon + 180) // width)
+    north = int((area.ne.lat + 90) // height)
+    east = int((area.ne.lon + 180) // width)
+    codes = {}
+    for lat in range(max(south - margin, 0), min(north + margin, lat_cells - 1) + 1):
+        for lon in range(max(west - margin, 0), min(east + margin, lon_cells - 1) + 1):
+            sw_lat, sw_lon = lat * height - 90, lon * width - 180
+            codes[from_cell(lat, lon, code_length)] = (
+                sw_lat < area.ne.lat
+                and area.sw.lat < sw_lat + height
+                and sw_lon < area.ne.lon
+                and area.sw.lon < sw_lon + width
+            )
+    return codes
+
+
+def in_ranges(ranges: list[tuple[int, int]], key: int) -> bool:
+    i = bisect_right(ranges, (key, float("inf"))) - 1
+    return i >= 0 and ranges[i][0] <= key < ranges[i][1]
+
+
+class TestKeyRanges:
+    @pytest.mark.parametrize("area,code_length", CASES)
+    def test_exact(self, area: Area, code_length: int):
+        ranges = key_ranges(area, code_length)
+        assert ranges == sorted(ranges)
+        assert all(a[1] < b[0] for a, b in zip(ranges, ranges[1:]))
+        for code, expected in inside(area, code_length).items():
+            assert in_ranges(ranges, to_int(code)) == expected, code
+
+    def test_merged(self):
+        # Each row of length 8 cells is one run of keys per length 6 cell,
+        # and the two length 6 cells are adjacent.
+        assert len(key_ranges(ZURICH, 10)) == 32
+        assert len(key_ranges(ZURICH, 6)) == 1
+
+    @pytest.mark.parametrize("max_ranges", [1, 3, 10])
+    def test_max_ranges(self, max_ranges: int):
+        area, code_length = CASES[3]
+        ranges = key_ranges(area, code_length, max_ranges=max_ranges)
+        assert len(ranges) <= max_ranges
+        for code, expected in inside(area, code_length).items():
+            if expected:
+                assert in_ranges(ranges, to_int(code))
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            key_ranges(ZURICH, 9)
+        with pytest.raises(ValueError):
+            key_ranges(ZURICH, max_ranges=0)
+
+
+class TestPrefixes:
+    @pytest.mark.parametrize("area,code_length", CASES)
+    def test_exact(self, area: Area, code_length: int):
+        found = prefixes(area, code_length)
+        assert found == sorted(found)
+        for code, expected in inside(area, code_length).items():
+            assert any(code.startswith(p) for p in found) == expected, code
+
+    def test_coarsened(self):
+        assert prefixes(ZURICH, 10) == prefixes(ZURICH, 8)
+        assert prefixes(ZURICH, 10, max_prefixes=10) == ["8FVC9G", "8FVC9H"]
+
+    @pytest.mark.parametrize("area,code_length", CASES)
+    def test_ranges(self, area: Area, code_length: int):
+        # Each prefix is a code whose keys lie within the planned ranges.
+        ranges = key_ranges(area, code_length)
+        for prefix in prefixes(area, code_length):
+            code = prefix if "+" in prefix else prefix.ljust(8, "0") + "+"
+            key = to_int(code)
+            assert in_ranges(ranges, key)
+            assert in_ranges(
+                ranges, key + subtree_size(len(prefix.replace("+", ""))) - 1
+            )
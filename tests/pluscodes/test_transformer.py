@@ -0,0 +1,118 @@
+import random
+
+import pytest
+
+from pluscodes import Transformer, encode, recover_many, shorten_many
+
+REFS = [
+    (47.365590, 8.524997),
+    (89.9, 179.9),
+    (-89.95, -179.95),
+    (0.0, 179.99),
+    (-33.8688, 151.2093),
+]
+
+
+def short_codes(ref: tuple[float, float], n: int = 500, seed: int = 29) -> list[str]:
+    """Short and full codes of locations around the reference, some of which
+    recover to a neighboring cell.
+    """
+    rng = random.Random(seed)
+    codes = []
+    for _ in range(n):
+        trim = rng.choice([0, 2, 4, 6])
+        spread = 20 ** (1 - trim / 2) if trim else 1
+        lat = ref[0] + rng.uniform(-spread, spread)
+        lon = ref[1] + rng.uniform(-spread, spread)
+        code = encode(lat, lon, rng.choice([8, 10, 11, 12]))
+        codes.append(code[trim:].lower() if rng.random() < 0.1 else code[trim:])
+    return codes
+
+
+def lengthen(codes: list[str], ref: tuple[float, float]) -> list[str | None]:
+    results = []
+    for code in codes:
+        try:
+            results.append(Transformer().lenghten(code, ref))
+        except (ValueError, KeyError):
+            results.append(None)
+    return results
+
+
+def shorten(codes: list[str], ref: tuple[float, float]) -> list[str | None]:
+    results = []
+    for code in codes:
+        try:
+            results.append(Transformer().shorten(code, ref))
+        except (ValueError, KeyError):
+            results.append(None)
+    return results
+
+
+def full_codes(ref: tuple[float, float], n: int = 500, seed: int = 31) -> list[str]:
+    """Full codes at distances from the reference around each trim limit."""
+    rng = random.Random(seed)
+    codes = []
+    for _ in range(n):
+        spread = rng.choice([0.0005, 0.001, 0.01, 0.02, 0.2, 0.4])
+        lat = max(min(ref[0] + rng.uniform(-spread, spread), 90), -90)
+        lon = max(min(ref[1] + rng.uniform(-spread, spread), 179.9999), -180)
+        codes.append(encode(lat, lon, rng.choice([8, 10, 11, 12, 15])))
+    return codes
+
+
+class TestRecoverMany:
+    @pytest.mark.parametrize("ref", REFS)
+    def test_lenghten(self, ref: tuple[float, float]):
+        codes = short_codes(ref)
+        results, errors = recover_many(codes, ref)
+        assert results == lengthen(codes, ref)
+        assert list(map(bool, errors)) == [code is None for code in results]
+        assert errors.count(0) > len(codes) // 2
+
+    @pytest.mark.parametrize("ref", REFS[:2])
+    def test_without_numpy(self, ref: tuple[float, float], monkeypatch):
+        monkeypatch.setitem(__import__("sys").modules, "numpy", None)
+        codes = short_codes(ref, 200)
+        assert recover_many(codes, ref)[0] == lengthen(codes, ref)
+
+    def test_errors(self):
+        codes = ["9G8F+6X", "bad", "+22", "", "9G8F+6", "WC000000+", "8fvc9g8f+6x"]
+        results, errors = recover_many(codes, REFS[0])
+        assert results == lengthen(codes, REFS[0])
+        assert list(errors) == [0, 1, 1, 1, 1, 1, 0]
+        assert results[-1] == "8FVC9G8F+6X"
+
+    def test_empty(self):
+        assert recover_many([], REFS[0]) == ([], bytearray())
+
+
+class TestShortenMany:
+    @pytest.mark.parametrize("ref", REFS)
+    def test_shorten(self, ref: tuple[float, float]):
+        codes = full_codes(ref)
+        results, errors = shorten_many(codes, ref)
+        assert results == shorten(codes, ref)
+        assert not any(errors)
+        assert len(set(map(len, results))) > 3
+
+    def test_without_numpy(self, monkeypatch):
+        monkeypatch.setitem(__import__("sys").modules, "numpy", None)
+        codes = full_codes(REFS[0], 200)
+        assert shorten_many(codes, REFS[0])[0] == shorten(codes, REFS[0])
+
+    def test_errors(self):
+        codes = [
+            "8FVC9G8F+6X",
+            "8FVC0000+",
+            "8F+",
+            "9G8F+6X",
+            "8fvc9g8f+6x",
+            "22vc9g8f+6x",
+            "WC000000+",
+            "",
+        ]
+        results, errors = shorten_many(codes, REFS[0])
+        assert results == shorten(codes, REFS[0])
+        assert list(errors) == [0, 1, 1, 1, 0, 0, 1, 1]
+        assert results[0] == results[4] == "+6X"
@@ -0,0 +1,66 @@
+import random
+
+import pytest
+
+from pluscodes import CodeKind, Validator, classify, classify_many, encode
+
+validator = Validator()
+
+CASES = [
+    ("8FVC9G8F+6X", CodeKind.FULL),
+    ("8fvc9g8f+6x", CodeKind.FULL),
+    ("8FVC9G8F+", CodeKind.FULL),
+    ("8FVC9G8F+6X3VQWX", CodeKind.FULL),
+    ("8FVC0000+", CodeKind.PADDED),
+    ("8F000000+", CodeKind.PADDED),
+    ("8F0000VC+", CodeKind.PADDED),
+    ("9G8F+6X", CodeKind.SHORT),
+    ("8F+", CodeKind.SHORT),
+    ("9g8f+", CodeKind.SHORT),
+    ("+22", CodeKind.VALID),
+    ("WC000000+", CodeKind.VALID),
+    ("CWX2V38X+", CodeKind.VALID),
+    ("2000000C+", CodeKind.VALID),
+    ("", CodeKind.INVALID),
+    ("+", CodeKind.INVALID),
+    ("8", CodeKind.INVALID),
+    ("8FVC9G8F+6", CodeKind.INVALID),
+    ("8FVC9G8F6X", CodeKind.INVALID),
+    ("8FVC9G8+6X", CodeKind.INVALID),
+    ("8FVC9G8F9+6X", CodeKind.INVALID),
+    ("8FVC9G8F++6X", CodeKind.INVALID),
+    ("8FVC000+", CodeKind.INVALID),
+    ("8F00VC00+", CodeKind.INVALID),
+    ("0FVC0000+", CodeKind.INVALID),
+    ("8FVC0000+22", CodeKind.INVALID),
+    ("8FV00000+", CodeKind.INVALID),
+    ("9G00+", CodeKind.INVALID),
+    ("8FVC9G8F+6Y", CodeKind.INVALID),
+    ("8FVC 9G8F+6X", CodeKind.INVALID),
+]
+
+
+class TestClassify:
+    @pytest.mark.parametrize("code,kind", CASES)
+    def test_classify(self, code: str, kind: CodeKind):
+        assert classify(code) is kind
+        assert validator.is_valid(code) == (kind != CodeKind.INVALID)
+        assert validator.is_short(code) == (kind == CodeKind.SHORT)
+        assert validator.is_full(code) == (kind >= CodeKind.FULL)
+
+    def test_classify_many(self):
+        codes = [code for code, _ in CASES]
+        kinds = classify_many(codes)
+        assert isinstance(kinds, bytearray)
+        assert list(kinds) == [kind for _, kind in CASES]
+        assert classify_many(iter(codes)) == kinds
+
+    def test_encoded(self):
+        rng = random.Random(37)
+        for _ in range(1000):
+            lat, lon = rng.uniform(-90, 90), rng.uniform(-180, 180)
+            code = encode(lat, lon, rng.choice([2, 4, 6, 8, 10, 11, 15]))
+            kind = CodeKind.PADDED if "0" in code else CodeKind.FULL
+            assert classify(code) is kind
+            if kind == CodeKind.FULL:
+                assert classify(code[rng.choice([2, 4, 6]) :]) is CodeKind.SHORT
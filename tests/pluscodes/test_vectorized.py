@@ -0,0 +1,137 @@
+import pytest
+
+from pluscodes.decoder import Decoder
+from pluscodes.encoder import Encoders
+from pluscodes.packed import MAX_KEY, to_int
+
+np = pytest.importorskip("numpy")
+vectorized = pytest.importorskip("pluscodes.vectorized")
+
+
+def sample(n: int = 5000, seed: int = 7):
+    rng = np.random.default_rng(seed)
+    edges_lat = [-90, -90, -90, 0, 0, 0, 90, 90, 90]
+    edges_lon = [-180, 0, 180, -180, 0, 180, -180, 0, 180]
+    # Values whose scaled fractional part sits on either side of the point
+    # where round(x, 6) carries into the next integer.
+    k = rng.integers(0, 180 * Encoders[10].FINAL_LAT_PRECISION, n)
+    carry = (k + 0.9999995) / Encoders[10].FINAL_LAT_PRECISION - 90
+    lats = np.concatenate(
+        [rng.uniform(-90, 90, n), edges_lat, carry, np.nextafter(carry, -100)]
+    )
+    lons = np.concatenate([rng.uniform(-180, 180, n), edges_lon, *[lats[:n]] * 2])
+    return lats, lons
+
+
+class TestEncode:
+    @pytest.mark.parametrize("code_length", sorted(Encoders))
+    def test_matches_scalar(self, code_length: int):
+        lats, lons = sample()
+        encoder = Encoders[code_length]
+        expected = [encoder.encode(a, b) for a, b in zip(lats.tolist(), lons.tolist())]
+        assert vectorized.encode(lats, lons, code_length).tolist() == expected
+        codes = vectorized.encode(lats, lons, code_length, dtype="S")
+        assert [c.decode() for c in codes.tolist()] == expected
+
+    def test_shape(self):
+        lats, lons = sample(100)
+        flat = vectorized.encode(lats[:100], lons[:100])
+        codes = vectorized.encode(
+            lats[:100].reshape(10, 10), lons[:100].reshape(10, 10)
+        )
+        assert codes.shape == (10, 10)
+        assert codes.dtype == np.dtype("U11")
+        assert (codes.ravel() == flat).all()
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            vectorized.encode([0.0], [0.0], 9)
+        with pytest.raises(ValueError):
+            vectorized.encode([0.0, 1.0], [0.0])
+
+    @pytest.mark.parametrize("value", [np.nan, np.inf, -np.inf])
+    def test_non_finite(self, value: float):
+        # Scalar and vectorized encoding both reject non-finite coordinates.
+        for lat, lon in [(value, 1.0), (1.0, value)]:
+            with pytest.raises((ValueError, OverflowError)):
+                Encoders[10].encode(lat, lon)
+            with pytest.raises(ValueError):
+                vectorized.encode([0.0, lat], [0.0, lon])
+            with pytest.raises(ValueError):
+                vectorized.encode_int([0.0, lat], [0.0, lon])
+
+    @pytest.mark.parametrize("code_length", sorted(Encoders))
+    def test_huge_values(self, code_length: int):
+        # Finite values far out of range wrap as in the scalar encoder, where
+        # they would overflow int64.
+        rng = np.random.default_rng(13)
+        values = rng.choice([-1, 1], 200) * 10 ** rng.uniform(0, 300, 200)
+        values = np.concatenate([values, [1e12, -1e12, 1e20, -1e20, 1e300]])
+        lats = np.concatenate([values, np.full(values.size, 5.0), values])
+        lons = np.concatenate([np.full(values.size, 5.0), values, -values])
+        encoder = Encoders[code_length]
+        expected = encoder.encode_many(lats.tolist(), lons.tolist())
+        with np.errstate(all="raise"):
+            assert vectorized.encode(lats, lons, code_length).tolist() == expected
+
+
+class TestDecode:
+    def codes(self) -> list[str]:
+        lats, lons = sample(500)
+        codes = []
+        for code_length, encoder in sorted(Encoders.items()):
+            codes += encoder.encode_many(lats.tolist(), lons.tolist())
+        return codes
+
+    def test_matches_scalar(self):
+        codes = self.codes()
+        codes += [c.lower() for c in codes[:100]]
+        decoder = Decoder()
+        bounds = vectorized.decode(codes, center=True)
+        for code, row in zip(codes, bounds.tolist()):
+            area = decoder.decode(code)
+            expected = (*area.sw.latlon(), *area.ne.latlon(), *area.center().latlon())
+            assert row == expected
+
+    def test_dtypes(self):
+        codes = self.codes()
+        expected = vectorized.decode(codes)
+        assert expected.dtype.names == ("sw_lat", "sw_lon", "ne_lat", "ne_lon")
+        for arr in (
+            np.array(codes),
+            np.array(codes, dtype="S"),
+            np.array(codes, dtype=object),
+        ):
+            assert (vectorized.decode(arr) == expected).all()
+        assert vectorized.decode(np.array(codes).reshape(-1, 2)).shape == (
+            len(codes) // 2,
+            2,
+        )
+
+    def test_round14(self):
+        rng = np.random.default_rng(3)
+        values = np.concatenate(
+            [
+                rng.uniform(-180, 180, 10000),
+                rng.uniform(-1e-3, 1e-3, 1000),
+                np.arange(-(2**12), 2**12) / 2**15,
+                rng.integers(-(10**6), 10**6, 1000) / Decoder.FINAL_LON_PRECISION,
+            ]
+        )
+        expected = [round(x, 14) for x in values.tolist()]
+        assert vectorized._round14(values).tolist() == expected
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            vectorized.decode(["849VCWC8+W1"])
+        with pytest.raises(ValueError):
+            vectorized.decode(["849VC000+"])
+
+    def test_decode_int(self):
+        codes = self.codes()
+        keys = np.array([to_int(c) for c in codes], dtype=np.uint64)
+        expected = vectorized.decode(codes, center=True)
+        assert (vectorized.decode_int(keys, center=True) == expected).all()
+        assert vectorized.decode_int(keys[:0]).shape == (0,)
+        with pytest.raises(ValueError):
+            vectorized.decode_int([MAX_KEY])